@@ -10,9 +10,12 @@ def add_if_exists(datas_list, src, dst):
 def add_glob(datas_list, pattern, dst):
     for p in glob.glob(pattern): datas_list.append((p, dst))
 datas = []
-for core in ('student_portal.py','license_client.py','activation_dialog.py','splash_screen.py','path_utils.py','gocbt_logo.png','app.ico'):
+for core in ('student_portal.py','license_client.py','activation_dialog.py','splash_screen.py','path_utils.py','question_bank.py','question_store.py','question_pack.py','compile_assets.py','question_dedupe.py','question_sampler.py','rotation_state.py','exam_blueprint.py','question_stats.py','question_search.py','question_nav.py','virtual_views.py','bg_renderer.py','image_cache.py','tk_scheduler.py','metrics.py','gocbt_logo.png','app.ico'):
     add_if_exists(datas, core, '.')
 add_glob(datas, os.path.join('assets','*.json'), 'assets')
+add_glob(datas, os.path.join('assets','*.gocbtpack'), 'assets')
+add_glob(datas, os.path.join('assets','blueprints','*.json'), os.path.join('assets','blueprints'))
+add_glob(datas, os.path.join('assets','scaled','*.png'), os.path.join('assets','scaled'))
 for folder in ('images','media','fonts','static','data'):
     if os.path.isdir(folder): add_glob(datas, os.path.join(folder,'*.*'), folder)
 for pattern in ('*.png','*.gif','*.jpg','*.jpeg','*.json','*.csv','*.txt'):
@@ -4,6 +4,11 @@ from tkinter import messagebox
 import datetime
 from license_client import activate_with_reference
 
+try:
+    from tk_scheduler import Scheduler  # shared root timer (nudges coalesce with main.py's)
+except Exception:
+    Scheduler = None
+
 APP_NAME = "GO CBT APP"
 PAY_URL = "https://paystack.shop/pay/hpv92fjpxf"
 SUPPORT_PHONE = "08066713410"
@@ -18,16 +23,13 @@ def _alog(msg: str):
         pass
 
 def _load_logo_scaled(path, max_w=320, max_h=160):
-    """Load image scaled to fit; use Pillow if available; fallback to Tk subsample."""
+    """Load image scaled to fit; shared image cache (Pillow) if available; fallback to Tk subsample."""
     try:
-        from PIL import Image, ImageTk  # optional
-        img = Image.open(path)
-        try:
-            from PIL.Image import Resampling
-            img.thumbnail((max_w, max_h), Resampling.LANCZOS)
-        except Exception:
-            img.thumbnail((max_w, max_h))
-        return ImageTk.PhotoImage(img)
+        from image_cache import get_photo  # optional (needs Pillow)
+        ph = get_photo(path, (max_w, max_h))
+        if ph is None:
+            raise ValueError("no image")
+        return ph
     except Exception:
         try:
             ph = tk.PhotoImage(file=path)  # PNG/GIF only
@@ -118,9 +120,11 @@ class ActivationDialog(tk.Toplevel):
             self.grab_set()
 
             # nudge focus a few times in case another window steals it
+            later = (lambda ms, fn: Scheduler.for_root(self).call_later(ms, fn, owner=self)) \
+                if Scheduler is not None else self.after
             for d in (150, 300, 600, 900):
-                self.after(d, lambda w=self: (w.lift(), w.attributes("-topmost", True), w.focus_force()))
-            self.after(1100, lambda w=self: w.attributes("-topmost", False))
+                later(d, lambda w=self: (w.lift(), w.attributes("-topmost", True), w.focus_force()))
+            later(1100, lambda w=self: w.attributes("-topmost", False))
         except Exception:
             pass
         try:
@@ -0,0 +1,85 @@
+# bench_question_memory.py — retained heap: dict-per-question vs columnar QuestionBank
+# Usage (from GO_CBT_APP_Desktop/):  python benchmarks/bench_question_memory.py
+# Measures what stays alive after loading every subject in the manifest, plus the
+# per-subject shuffled copy GO_CBT_App keeps, using tracemalloc (pure Python, no deps).
+
+import os, sys, gc, json, time, random, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from question_bank import SUBJECT_FILES, find_json_file, normalize_question_item, _question_key
+from question_store import QuestionBank
+
+
+def _raw_items():
+    """Parse every subject once up front so JSON decoding is not part of the measurement."""
+    out = []
+    for subject, filename in SUBJECT_FILES:
+        path = find_json_file(filename)
+        if not path:
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict) and "questions" in data:
+            data = data["questions"]
+        out.append((subject, data))
+    return out
+
+
+def _normalized(raw):
+    seen, rows = set(), []
+    for item in raw:
+        try:
+            norm = normalize_question_item(item)
+        except Exception:
+            continue
+        key = _question_key(norm)
+        if key not in seen:
+            seen.add(key)
+            rows.append(norm)
+    return rows
+
+
+def build_dicts(raw_subjects):
+    bank = {subject: _normalized(raw) for subject, raw in raw_subjects}
+    shuffled = {}
+    for subject, qs in bank.items():
+        copy = qs[:]
+        random.shuffle(copy)
+        shuffled[subject] = copy
+    return bank, shuffled
+
+
+def build_columnar(raw_subjects):
+    bank = {subject: QuestionBank.from_dicts(_normalized(raw)) for subject, raw in raw_subjects}
+    shuffled = {}
+    for subject, qs in bank.items():
+        copy = list(qs)
+        random.shuffle(copy)
+        shuffled[subject] = copy
+    return bank, shuffled
+
+
+def measure(label, builder, raw_subjects):
+    gc.collect()
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    t0 = time.perf_counter()
+    result = builder(raw_subjects)
+    secs = time.perf_counter() - t0
+    gc.collect()
+    cur, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    n = sum(len(v) for v in result[0].values())
+    print(f"{label:<22} questions={n:6d}  retained={(cur - base) / 1e6:7.2f} MB  "
+          f"peak={(peak - base) / 1e6:7.2f} MB  build={secs * 1000:7.1f} ms")
+    del result
+    return cur - base
+
+
+if __name__ == "__main__":
+    raw = _raw_items()
+    a = measure("dict per question", build_dicts, raw)
+    b = measure("columnar QuestionBank", build_columnar, raw)
+    if b:
+        print(f"retained ratio: {a / b:.2f}x smaller")
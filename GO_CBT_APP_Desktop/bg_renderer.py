@@ -0,0 +1,140 @@
+# bg_renderer.py — window-filling background image that stays responsive while resizing
+# - The source image is decoded once per process (image_cache) and shared by every renderer
+# - <Configure> bursts are coalesced: while the window is being dragged at most one quick
+#   NEAREST preview is drawn per FAST_MS, and one LANCZOS render follows once no resize
+#   has arrived for SETTLE_MS (both timers run on the root's tk_scheduler, owned by the label)
+# - Rendered sizes are rounded up to BUCKET px and kept in a small LRU, so going back to a
+#   size (maximize/restore, returning to the exam screen) reuses the PhotoImage as is
+
+from collections import OrderedDict
+
+from PIL import Image, ImageTk
+
+import image_cache
+from tk_scheduler import Scheduler
+
+BUCKET    = 32      # px; rendered sizes are rounded up to a multiple of this
+LRU_SIZE  = 4       # LANCZOS renders kept per renderer
+FAST_MS   = 40      # min gap between previews while resizing
+SETTLE_MS = 250     # quiet time before the final LANCZOS render
+
+try:
+    from PIL.Image import Resampling as _Resampling
+    FAST_FILTER, FINAL_FILTER = _Resampling.NEAREST, _Resampling.LANCZOS
+except Exception:
+    FAST_FILTER = Image.NEAREST
+    FINAL_FILTER = getattr(Image, "LANCZOS", getattr(Image, "ANTIALIAS", Image.BICUBIC))
+
+
+def load_source(path):
+    """Decoded RGB image for `path`, read from disk once per process (None if unreadable)."""
+    return image_cache.get_image(path, mode="RGB")
+
+
+def _bucket(w, h):
+    return (-(-max(1, w) // BUCKET) * BUCKET, -(-max(1, h) // BUCKET) * BUCKET)
+
+
+class BackgroundRenderer:
+    """
+    Keeps `label` (placed to fill its parent) showing `path` scaled to the parent's size.
+    attach() binds the parent's <Configure>; detach() cancels any pending work.
+    """
+
+    def __init__(self, label, path):
+        self.label = label
+        self.path = path
+        self._lru = OrderedDict()      # bucket size → PhotoImage (LANCZOS)
+        self._size = None              # latest requested size
+        self._shown = None             # (bucket, final?) currently on the label
+        self._fast_job = None
+        self._settle_job = None
+        self._bind_id = None
+        self._parent = None
+
+    def attach(self, parent):
+        self.detach()
+        self._parent = parent
+        self._bind_id = parent.bind("<Configure>", self._on_configure, add="+")
+        self.request(parent.winfo_width(), parent.winfo_height())
+
+    def detach(self):
+        for job in (self._fast_job, self._settle_job):
+            if job is not None:
+                job.cancel()
+        self._fast_job = self._settle_job = None
+        if self._parent is not None and self._bind_id:
+            try:
+                self._parent.unbind("<Configure>", self._bind_id)
+            except Exception:
+                pass
+        self._bind_id = None
+
+    def _on_configure(self, evt):
+        if evt.widget is self._parent:
+            self.request(evt.width, evt.height)
+
+    def request(self, w, h):
+        """Ask for the background at w×h; cheap to call for every <Configure>."""
+        if w <= 1 or h <= 1:
+            return
+        self._size = (w, h)
+        key = _bucket(w, h)
+        if key in self._lru:
+            self._lru.move_to_end(key)
+            self._show(key, self._lru[key], True)
+            return
+        sched = Scheduler.for_root(self.label)
+        if self._fast_job is None:
+            self._fast_job = sched.call_later(FAST_MS, self._preview, owner=self.label)
+        if self._settle_job is not None:
+            self._settle_job.cancel()
+        self._settle_job = sched.call_later(SETTLE_MS, self._settle, owner=self.label)
+
+    def _render(self, key, resample):
+        src = load_source(self.path)
+        if src is None:
+            return None
+        return ImageTk.PhotoImage(src.resize(key, resample))
+
+    def _preview(self):
+        self._fast_job = None
+        if self._size is None:
+            return
+        key = _bucket(*self._size)
+        if self._shown is not None and self._shown[0] == key:
+            return
+        try:
+            photo = self._render(key, FAST_FILTER)
+        except Exception:
+            return
+        if photo is not None:
+            self._show(key, photo, False)
+
+    def _settle(self):
+        self._settle_job = None
+        if self._size is None:
+            return
+        key = _bucket(*self._size)
+        photo = self._lru.get(key)
+        if photo is None:
+            try:
+                photo = self._render(key, FINAL_FILTER)
+            except Exception:
+                return
+            if photo is None:
+                return
+            self._lru[key] = photo
+            while len(self._lru) > LRU_SIZE:
+                self._lru.popitem(last=False)
+        self._show(key, photo, True)
+
+    def _show(self, key, photo, final):
+        if self._shown == (key, final) and getattr(self.label, "image", None) is photo:
+            return
+        try:
+            self.label.configure(image=photo)
+            self.label.image = photo      # keep reference
+            self._shown = (key, final)
+        except Exception:
+            pass
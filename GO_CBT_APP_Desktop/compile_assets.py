@@ -0,0 +1,247 @@
+# compile_assets.py — offline question-bank compiler (run before PyInstaller)
+# - Reads every manifest subject JSON, normalizes + dedupes it exactly like the app does
+# - Flags rows whose answer could not be resolved and was forced to "A", rows that were
+#   skipped as malformed, duplicates, missing subject files and unreferenced bank JSON files
+# - Cross-bank exact / near-duplicate clusters (question_dedupe.py) go into the report,
+#   unreferenced JSON files included (as "unreferenced:<file>"), plus near duplicates
+#   keyed to different answers; --drop-duplicates also keeps only the first copy of each
+#   cluster in the pack (clusters with an answer conflict are kept whole)
+# - Writes assets/questions.gocbtpack (flagged as compiled) and a machine-readable
+#   audit report (assets/question_audit.json); the frozen app then does no validation
+# - Also writes the pre-scaled logo PNGs (image_cache.build_prescaled → assets/scaled/)
+#
+# Usage:
+#   python compile_assets.py [--out PACK] [--report JSON] [--strict] [--drop-duplicates] [--no-images]
+#   --strict exits with status 1 if any answer was forced or a subject file is missing
+
+import os, sys, json, time, argparse
+
+from path_utils import assets_dir_candidates
+from question_bank import SUBJECT_FILES, find_json_file, read_subject_file
+from question_pack import PACK_FILENAME, PACK_FLAG_COMPILED, write_pack
+from question_dedupe import build_index
+from question_store import QuestionBank
+from image_cache import build_prescaled
+
+AUDIT_FILENAME = "question_audit.json"
+UNREFERENCED_PREFIX = "unreferenced:"     # duplicate-report subject label for non-manifest files
+CONFIG_FILENAMES = {AUDIT_FILENAME.lower(), "simulation_weights.json"}   # JSON in assets that is not a bank
+_SNIPPET = 120
+
+
+def _snippet(text) -> str:
+    text = " ".join(str(text or "").split())
+    return text if len(text) <= _SNIPPET else text[:_SNIPPET - 1] + "…"
+
+def _raw_rows(path: str) -> list:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict) and "questions" in data:
+        data = data["questions"]
+    return data if isinstance(data, list) else []
+
+def _is_question_file(path: str) -> bool:
+    """True for a JSON list or {"questions": [...]} (a bank); False for config or unreadable files."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        return False
+    if isinstance(data, dict):
+        data = data.get("questions")
+    return isinstance(data, list)
+
+def _forced_details(path: str, rows: list[int]) -> list[dict]:
+    """Row number, question snippet and the raw answer fields for each forced row."""
+    try:
+        raw = _raw_rows(path)
+    except Exception:
+        return [{"row": i} for i in rows]
+    out = []
+    for i in rows:
+        item = raw[i] if 0 <= i < len(raw) and isinstance(raw[i], dict) else {}
+        out.append({
+            "row": i,
+            "question": _snippet(item.get("question") or item.get("Question") or item.get("title")),
+            "answer_fields": {k: v for k, v in item.items() if k not in ("question", "Question", "title", "options")},
+        })
+    return out
+
+
+def compile_subjects(manifest=SUBJECT_FILES):
+    """
+    Parse every subject in `manifest`.
+    Returns (pack_entries, audit, dup_index) where pack_entries is a list of
+    (subject, source_path, QuestionBank) ready for write_pack() and dup_index
+    is the built question_dedupe.DuplicateIndex.
+    """
+    entries, subjects, missing, used = [], [], [], set()
+    totals = {"rows": 0, "kept": 0, "duplicates": 0, "fast": 0, "fallback": 0, "skipped": 0, "forced_a": 0}
+
+    for subject, filename in manifest:
+        path = find_json_file(filename)
+        if not path or not os.path.exists(path):
+            missing.append({"subject": subject, "file": filename})
+            continue
+        used.add(os.path.normcase(os.path.abspath(path)))
+
+        t0 = time.perf_counter()
+        stats = {}
+        bank = read_subject_file(path, report=stats)
+        secs = time.perf_counter() - t0
+
+        entry = {
+            "subject": subject,
+            "file": os.path.basename(path),
+            "rows": stats.get("rows", 0),
+            "kept": len(bank),
+            "duplicates": stats.get("duplicates", 0),
+            "fast": stats.get("fast", 0),
+            "fallback": stats.get("fallback", 0),
+            "skipped": stats.get("skipped", 0),
+            "forced_a": stats.get("forced_a", 0),
+            "schema": stats.get("schema"),
+            "seconds": round(secs, 4),
+            "forced": _forced_details(path, stats.get("forced_rows", [])),
+        }
+        for k in totals:
+            totals[k] += entry[k]
+        subjects.append(entry)
+        entries.append((subject, path, bank))
+
+    # question-bank *.json in the assets dirs that no manifest subject resolved to (typos,
+    # stale copies, …); config files and anything not shaped like a bank are left out
+    unreferenced = []
+    for d in assets_dir_candidates():
+        if not os.path.isdir(d):
+            continue
+        for name in sorted(os.listdir(d)):
+            p = os.path.normcase(os.path.abspath(os.path.join(d, name)))
+            if (name.lower().endswith(".json") and name.lower() not in CONFIG_FILENAMES
+                    and p not in used and _is_question_file(os.path.join(d, name))):
+                unreferenced.append(os.path.join(d, name))
+
+    # stale copies are compared too (e.g. "Fire Service MCQs.json" vs "Fire_Service_MCQs.json");
+    # they come after the manifest subjects, so a manifest copy is always the keeper
+    t0 = time.perf_counter()
+    banks = {subject: bank for subject, _, bank in entries}
+    for p in unreferenced:
+        banks[UNREFERENCED_PREFIX + os.path.basename(p)] = read_subject_file(p)
+    dup_index = build_index(banks)
+    duplicates = dup_index.report()
+    duplicates["seconds"] = round(time.perf_counter() - t0, 3)
+
+    audit = {
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "totals": dict(totals, subjects=len(subjects), missing=len(missing)),
+        "missing": missing,
+        "unreferenced": unreferenced,
+        "subjects": subjects,
+        "duplicates": duplicates,
+    }
+    return entries, audit, dup_index
+
+
+def drop_duplicates(entries, dup_index) -> tuple[list, int]:
+    """Rebuild each bank without the redundant copies (the first copy in manifest order stays)."""
+    drop = dup_index.redundant()
+    if not drop:
+        return entries, 0
+    out, dropped = [], 0
+    for subject, path, bank in entries:
+        keep = [bank[i] for i in range(len(bank)) if (subject, i) not in drop]
+        dropped += len(bank) - len(keep)   # copies in unreferenced files aren't in the pack anyway
+        out.append((subject, path, bank if len(keep) == len(bank) else QuestionBank.from_dicts(keep)))
+    return out, dropped
+
+
+def write_audit(path: str, audit: dict) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(audit, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+def load_audit(path: str | None = None) -> dict | None:
+    """Read a previously written audit report (None if absent/unreadable)."""
+    if path is None:
+        from path_utils import find_asset
+        path = find_asset(AUDIT_FILENAME)
+    if not path:
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def print_summary(audit: dict) -> None:
+    t = audit["totals"]
+    print(f"[INFO] {t['subjects']} subject(s): {t['rows']} rows → {t['kept']} kept "
+          f"({t['duplicates']} duplicate, {t['skipped']} skipped, {t['fallback']} via generic normalizer)")
+    for s in audit["subjects"]:
+        if s["forced_a"] or s["skipped"]:
+            print(f"[WARN] {s['subject']} ({s['file']}): {s['forced_a']} answer(s) forced to 'A', "
+                  f"{s['skipped']} row(s) skipped")
+    for m in audit["missing"]:
+        print(f"[WARN] Missing subject file: {m['file']} ({m['subject']})")
+    for p in audit["unreferenced"]:
+        print(f"[INFO] Not in manifest: {os.path.basename(p)}")
+    d = audit.get("duplicates") or {}
+    if d:
+        st = d["stats"]
+        print(f"[INFO] Cross-bank duplicates: {st['exact_pairs']} exact + {st['near_pairs']} near "
+              f"in {len(d['clusters'])} cluster(s) ({d.get('seconds', 0):.2f}s)")
+        conflicts = d.get("conflicts", [])
+        for c in conflicts[:20]:
+            first = c["members"][0]
+            answers = sorted({m["answer"] for m in c["members"]})
+            print(f"[WARN] Same question, different answers ({' / '.join(answers)}): "
+                  f"{first['question'][:60]!r} ({', '.join(sorted({m['subject'] for m in c['members']}))})")
+        if len(conflicts) > 20:
+            print(f"[WARN] … {len(conflicts) - 20} more answer conflict(s) in the report")
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Validate the subject JSON files and compile questions.gocbtpack.")
+    ap.add_argument("--out", help=f"pack output path (default: assets/{PACK_FILENAME})")
+    ap.add_argument("--report", help=f"audit report path (default: next to the pack, {AUDIT_FILENAME})")
+    ap.add_argument("--strict", action="store_true",
+                    help="exit 1 if any answer was forced to 'A' or a subject file is missing")
+    ap.add_argument("--drop-duplicates", action="store_true",
+                    help="keep only the first copy of each duplicate cluster in the pack "
+                         "(clusters with conflicting answers are kept whole)")
+    ap.add_argument("--no-images", action="store_true",
+                    help="skip writing the pre-scaled logo images (assets/scaled/)")
+    args = ap.parse_args(argv)
+
+    out = args.out or os.path.join(assets_dir_candidates()[0], PACK_FILENAME)
+    report = args.report or os.path.join(os.path.dirname(os.path.abspath(out)), AUDIT_FILENAME)
+
+    entries, audit, dup_index = compile_subjects()
+    if args.drop_duplicates:
+        entries, dropped = drop_duplicates(entries, dup_index)
+        audit["duplicates"]["dropped"] = dropped
+        print(f"[INFO] Dropped {dropped} duplicate question(s) from the pack")
+    info = write_pack(out, entries, flags=PACK_FLAG_COMPILED)
+    audit["pack"] = dict(info, path=out)
+    write_audit(report, audit)
+
+    print_summary(audit)
+    print(f"[INFO] Wrote {info['questions']} questions / {info['subjects']} subjects ({info['bytes']:,} bytes) → {out}")
+    print(f"[INFO] Audit report → {report}")
+    if not args.no_images:
+        scaled = build_prescaled()
+        if scaled:
+            print(f"[INFO] Wrote {len(scaled)} pre-scaled image(s) → {os.path.dirname(scaled[0])}")
+
+    t = audit["totals"]
+    if args.strict and (t["forced_a"] or t["missing"]):
+        print("[ERROR] --strict: fix the rows/files above before packaging")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+# exam_blueprint.py — declarative exam blueprints (assets/blueprints/*.json)
+# - A blueprint names its sections (which subjects, how many questions each), the total
+#   time and shuffle rules; compile_blueprint() resolves it against the subject list once
+#   into an ExamPlan, and ExamPlan.assemble() draws an exam from the loaded bank
+# - Built-in "subject_practice" (100 questions from the chosen subject, 60 min) and
+#   "simulation" (100 mixed non-Profession questions, 60 min) plans replace the old
+#   hard-coded sizes/timer; a blueprint file with the same "id" overrides them
+#   (for subject_practice only the total count, duration and shuffle_options apply —
+#   its questions still come from the candidate's no-repeat rotation)
+#
+# Blueprint JSON:
+#   {
+#     "id": "promo_education",                # defaults to the file name
+#     "name": "Promotion Mock — Education",
+#     "duration_minutes": 60,
+#     "sections": [
+#       {"subject": "Education Profession", "count": 40},
+#       {"subjects": ["Public Service Rules", "Code of Conduct"], "count": 30},
+#       {"pool": "non_profession", "count": 30, "weights": {"Current Affairs": 2}}
+#     ],
+#     "shuffle_questions": true,              # mix sections (false keeps section order)
+#     "shuffle_options": false                # permute A–D per question (answer key follows)
+#   }
+#   pool: "all" | "non_profession" | "profession". Without "weights" a section is split in
+#   proportion to bank size; with them, subjects not listed weigh 1.
+
+import os, glob, json, random
+
+from path_utils import assets_dir_candidates
+from question_sampler import stratified_sample
+
+BLUEPRINT_DIRNAME = "blueprints"
+DEFAULT_COUNT     = 100
+DEFAULT_DURATION  = 3600
+_LETTERS = ("A", "B", "C", "D")
+
+
+class BlueprintError(ValueError):
+    pass
+
+
+def _is_profession(subject: str) -> bool:
+    return subject.strip().lower().endswith("profession")
+
+_POOLS = {
+    "all":            lambda s: True,
+    "non_profession": lambda s: not _is_profession(s),
+    "profession":     _is_profession,
+}
+
+
+class ExamPlan:
+    """
+    A compiled blueprint: sections resolved to concrete subject lists.
+    Sections are (subjects, count, weights); "subject_practice" uses a single
+    section whose subject is supplied at assemble() time.
+    """
+
+    def __init__(self, bid, name, sections, duration, shuffle_questions=True, shuffle_options=False):
+        self.id = bid
+        self.name = name
+        self.sections = sections
+        self.duration = int(duration)
+        self.shuffle_questions = bool(shuffle_questions)
+        self.shuffle_options = bool(shuffle_options)
+
+    @property
+    def total(self) -> int:
+        return sum(count for _, count, _ in self.sections)
+
+    def available(self, bank, subject=None) -> int:
+        """How many questions the plan could draw from `bank` (for the 'too few' check)."""
+        n = 0
+        for subjects, count, _ in self.sections:
+            subjects = subjects if subjects is not None else [subject]
+            n += min(count, sum(len(bank[s]) for s in subjects if s in bank))
+        return n
+
+    def assemble(self, bank, seed=None, subject=None, key=None, served=None, on_pick=None, refs=None):
+        """
+        Draw the exam. `subject` fills a section declared without subjects
+        (subject practice). key/served/on_pick are passed to stratified_sample();
+        `refs`, if given, receives (subject, index) aligned with the returned rows.
+        Returns (rows, seed); one seed reproduces the whole exam.
+        """
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(48)
+        rng = random.Random(seed)
+        rows, origin, seen = [], [], set()   # seen keys are shared so no question is drawn twice across sections
+        for subjects, count, weights in self.sections:
+            if subjects is None:
+                subjects = [subject]
+                if weights is not None:     # a wildcard section keeps its raw weights until now
+                    weights = {s: float(weights.get(s, 1.0)) for s in subjects}
+            subjects = [s for s in subjects if s in bank]
+            if not subjects or count <= 0:
+                continue
+            part, _ = stratified_sample(bank, subjects, count, weights=weights,
+                                        seed=rng.getrandbits(48), key=key, seen=seen,
+                                        served=served, on_pick=on_pick, refs=origin)
+            rows.extend(part)
+        if self.shuffle_questions and len(self.sections) > 1:
+            pairs = list(zip(rows, origin))
+            rng.shuffle(pairs)
+            rows, origin = [r for r, _ in pairs], [o for _, o in pairs]
+        if refs is not None:
+            refs.extend(origin)
+        if self.shuffle_options:
+            rows = [_shuffle_options(row, rng) for row in rows]
+        return rows, seed
+
+    def arrange_options(self, rows, rng=None) -> list:
+        """Apply the option-shuffle rule to rows drawn elsewhere (e.g. the rotation sampler)."""
+        if not self.shuffle_options:
+            return list(rows)
+        rng = rng or random.Random()
+        return [_shuffle_options(row, rng) for row in rows]
+
+
+def _shuffle_options(row, rng) -> dict:
+    opts = row.get("options") or {}
+    letters = list(_LETTERS)
+    rng.shuffle(letters)
+    correct = (row.get("correct") or "A")[:1].upper()
+    new_opts = {new: opts.get(old, "") for new, old in zip(_LETTERS, letters)}
+    new_correct = _LETTERS[letters.index(correct)] if correct in letters else "A"
+    return {"question": row.get("question", ""), "options": new_opts, "correct": new_correct}
+
+
+def compile_blueprint(data: dict, subjects, bid: str | None = None) -> ExamPlan:
+    """Validate a blueprint dict and resolve its sections against `subjects` (names in the bank)."""
+    if not isinstance(data, dict):
+        raise BlueprintError("blueprint must be a JSON object")
+    subjects = list(subjects)
+    known = set(subjects)
+    bid = str(data.get("id") or bid or "").strip()
+    if not bid:
+        raise BlueprintError("blueprint has no id")
+
+    sections = []
+    for n, sec in enumerate(data.get("sections") or [], 1):
+        if not isinstance(sec, dict):
+            raise BlueprintError(f"section {n}: must be an object")
+        try:
+            count = int(sec.get("count", 0))
+        except (TypeError, ValueError):
+            raise BlueprintError(f"section {n}: count must be an integer")
+        if "subject" in sec or "subjects" in sec:
+            names = sec.get("subjects") if "subjects" in sec else [sec.get("subject")]
+            if names in ([None], ["*"]) or names is None:
+                chosen = None          # filled in at assemble() time
+            else:
+                missing = [s for s in names if s not in known]
+                if missing:
+                    raise BlueprintError(f"section {n}: unknown subject(s) {missing}")
+                chosen = list(names)
+        else:
+            pool = str(sec.get("pool", "all")).strip().lower()
+            if pool not in _POOLS:
+                raise BlueprintError(f"section {n}: unknown pool {pool!r}")
+            chosen = [s for s in subjects if _POOLS[pool](s)]
+        weights = sec.get("weights")
+        if weights is not None:
+            if not isinstance(weights, dict):
+                raise BlueprintError(f"section {n}: weights must be an object")
+            try:
+                if chosen is None:      # resolved in assemble() once the subject is known
+                    weights = {str(s): float(w) for s, w in weights.items()}
+                else:
+                    weights = {s: float(weights.get(s, 1.0)) for s in chosen}
+            except (TypeError, ValueError):
+                raise BlueprintError(f"section {n}: weights must be numbers")
+        sections.append((chosen, count, weights))
+    if not sections:
+        raise BlueprintError("blueprint has no sections")
+
+    minutes = data.get("duration_minutes")
+    duration = int(float(minutes) * 60) if minutes is not None else int(data.get("duration_seconds", DEFAULT_DURATION))
+    return ExamPlan(bid, str(data.get("name") or bid), sections, duration,
+                    data.get("shuffle_questions", True), data.get("shuffle_options", False))
+
+
+def builtin_blueprints(weights=None) -> dict:
+    """The two plans the app always offers; `weights` is the simulation subject mix."""
+    return {
+        "subject_practice": {"id": "subject_practice", "name": "Subject Practice",
+                             "duration_minutes": DEFAULT_DURATION / 60,
+                             "sections": [{"subject": "*", "count": DEFAULT_COUNT}]},
+        "simulation": {"id": "simulation", "name": "Simulation Exam",
+                       "duration_minutes": DEFAULT_DURATION / 60,
+                       "sections": [{"pool": "non_profession", "count": DEFAULT_COUNT,
+                                     **({"weights": weights} if weights else {})}]},
+    }
+
+
+def blueprint_files() -> list[str]:
+    """assets/blueprints/*.json in every assets dir (first dir wins per file name)."""
+    seen, out = set(), []
+    for d in assets_dir_candidates():
+        for p in sorted(glob.glob(os.path.join(d, BLUEPRINT_DIRNAME, "*.json"))):
+            name = os.path.basename(p).lower()
+            if name not in seen:
+                seen.add(name)
+                out.append(p)
+    return out
+
+
+def load_plans(subjects, weights=None) -> dict[str, ExamPlan]:
+    """
+    Compile the built-in plans plus every blueprint file, keyed by id (in that order).
+    Invalid blueprint files are reported and skipped (a built-in then stays in place).
+    """
+    plans = {bid: compile_blueprint(data, subjects, bid) for bid, data in builtin_blueprints(weights).items()}
+    for path in blueprint_files():
+        bid = os.path.splitext(os.path.basename(path))[0]
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            plan = compile_blueprint(data, subjects, bid)
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Blueprint {path} ignored: {e}")
+            continue
+        plans[plan.id] = plan
+    return plans
@@ -0,0 +1,185 @@
+# image_cache.py — one process-wide cache of decoded and scaled images
+# - get_image(path, box, mode): Pillow image decoded once per path and scaled once per
+#   (path, box, mode); scaling fits inside `box` like Image.thumbnail (never enlarges)
+# - get_photo(...): the same as an ImageTk.PhotoImage (cached too, so every screen that
+#   shows the logo shares one Tk image)
+# - Entries are evicted least-recently-used once the cached pixels exceed MAX_PIXELS
+# - Build step (python image_cache.py, also run by compile_assets.py): writes the logo
+#   sizes the screens ask for (LOGO_BOXES) as small PNGs in assets/scaled/, named
+#   <stem>@<w>x<h>.png; get_image() opens such a file instead of decoding the 1.5 MB
+#   original, so the app never decodes a full-size logo at runtime
+
+import os, sys, threading
+from collections import OrderedDict
+
+from path_utils import assets_dir_candidates, find_asset, resource_path
+
+SCALED_DIRNAME = "scaled"
+MAX_PIXELS     = 8_000_000      # ~32 MB of RGBA across all cached images
+
+# Logo sizes used by the UI / PDF (fit-inside boxes, in pixels)
+LOGO_BOXES = {
+    "goodbye":    (260, 260),   # GoodbyeScreen
+    "splash":     (236, 236),   # splash_screen._LoadingIntro (420 px window minus text room)
+    "activation": (320, 160),   # activation_dialog
+    "pdf":        (330, 330),   # detailed-results PDF (drawn 110 pt wide, ~3x for print)
+}
+PRESCALE_FILES = ("go_cbt_logo.png", "logo.png", "gocbt_logo.png")
+
+try:
+    from PIL import Image
+    try:
+        from PIL.Image import Resampling as _Resampling
+        _LANCZOS = _Resampling.LANCZOS
+    except Exception:
+        _LANCZOS = getattr(Image, "LANCZOS", getattr(Image, "ANTIALIAS", Image.BICUBIC))
+except Exception:       # Pillow missing: callers fall back to tk.PhotoImage
+    Image = None
+
+_lock = threading.Lock()
+_images = OrderedDict()     # (path, box, mode) → PIL image
+_photos = OrderedDict()     # (path, box, mode) → ImageTk.PhotoImage
+_pixels = 0
+
+
+def fit_size(size, box):
+    """Largest size with the aspect of `size` that fits in `box`, never larger than `size`."""
+    w, h = size
+    if not box:
+        return w, h
+    scale = min(1.0, box[0] / float(w or 1), box[1] / float(h or 1))
+    return max(1, round(w * scale)), max(1, round(h * scale))
+
+
+def prescaled_name(path, box) -> str:
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return f"{stem}@{box[0]}x{box[1]}.png"
+
+
+def _find_prescaled(path, box):
+    name = prescaled_name(path, box)
+    try:
+        src_mtime = os.path.getmtime(path)
+    except OSError:
+        src_mtime = 0
+    for d in assets_dir_candidates():
+        p = os.path.join(d, SCALED_DIRNAME, name)
+        try:
+            # frozen bundles don't keep meaningful mtimes; otherwise skip stale variants
+            if os.path.isfile(p) and (getattr(sys, "frozen", False) or os.path.getmtime(p) >= src_mtime):
+                return p
+        except OSError:
+            continue
+    return None
+
+
+def _remember(key, img):
+    global _pixels
+    _images[key] = img
+    _pixels += img.width * img.height
+    while _pixels > MAX_PIXELS and len(_images) > 1:
+        old_key, old = _images.popitem(last=False)
+        _pixels -= old.width * old.height
+        _photos.pop(old_key, None)
+
+
+def get_image(path, box=None, mode=None):
+    """Decoded (and, with `box`, fitted) image for `path`, or None if Pillow/the file is missing."""
+    if Image is None or not path:
+        return None
+    key = (os.path.abspath(path), tuple(box) if box else None, mode)
+    with _lock:
+        img = _images.get(key)
+        if img is not None:
+            _images.move_to_end(key)
+            return img
+    img = None
+    if box:
+        pre = _find_prescaled(path, box)
+        if pre is not None:
+            try:
+                with Image.open(pre) as f:
+                    img = f.convert(mode) if mode else f.copy()
+            except Exception:
+                img = None
+        if img is None:
+            full = get_image(path, None, mode)
+            if full is None:
+                return None
+            size = fit_size(full.size, box)
+            img = full if size == full.size else full.resize(size, _LANCZOS)
+    else:
+        try:
+            with Image.open(path) as f:
+                img = f.convert(mode) if mode else f.copy()
+        except Exception as e:
+            print(f"[WARN] Image unreadable {path}: {e}")
+            return None
+    with _lock:
+        _remember(key, img)
+    return img
+
+
+def get_photo(path, box=None, mode=None):
+    """ImageTk.PhotoImage of get_image(path, box, mode), shared by every caller (needs a Tk root)."""
+    key = (os.path.abspath(path), tuple(box) if box else None, mode) if path else None
+    photo = _photos.get(key)
+    if photo is not None:
+        return photo
+    img = get_image(path, box, mode)
+    if img is None:
+        return None
+    from PIL import ImageTk
+    photo = ImageTk.PhotoImage(img)
+    with _lock:
+        if key in _images:
+            _photos[key] = photo
+    return photo
+
+
+def clear() -> None:
+    global _pixels
+    with _lock:
+        _images.clear()
+        _photos.clear()
+        _pixels = 0
+
+
+# ---------- build step ----------
+def _source_for(name):
+    p = find_asset(name)
+    if p:
+        return p
+    p = resource_path(name)
+    return p if os.path.isfile(p) else None
+
+
+def build_prescaled(out_dir=None) -> list[str]:
+    """Write every PRESCALE_FILES logo at every LOGO_BOXES size into assets/scaled/."""
+    if Image is None:
+        print("[WARN] Pillow not installed; skipping pre-scaled images")
+        return []
+    out_dir = out_dir or os.path.join(assets_dir_candidates()[0], SCALED_DIRNAME)
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+    for name in PRESCALE_FILES:
+        src = _source_for(name)
+        if not src:
+            continue
+        with Image.open(src) as f:
+            full = f.copy()
+        for box in sorted(set(LOGO_BOXES.values())):
+            size = fit_size(full.size, box)
+            img = full if size == full.size else full.resize(size, _LANCZOS)
+            out = os.path.join(out_dir, prescaled_name(src, box))
+            tmp = out + ".tmp"
+            img.save(tmp, format="PNG", optimize=True)
+            os.replace(tmp, out)
+            written.append(out)
+    return written
+
+
+if __name__ == "__main__":
+    files = build_prescaled(sys.argv[1] if len(sys.argv) > 1 else None)
+    total = sum(os.path.getsize(p) for p in files)
+    print(f"[INFO] Wrote {len(files)} pre-scaled image(s) ({total:,} bytes)")
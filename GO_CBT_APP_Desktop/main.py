@@ -3,11 +3,15 @@
 # - Instructions splash → logo loading overlay → portal
 # - Explicit first-render + auto-pack + watchdog (prevents blank window)
 # - Compact log with auto-rotation
+# - Nudges and watchdogs run on the root's shared Scheduler (tk_scheduler.py)
 
 import os, sys, datetime, traceback, webbrowser
 import tkinter as tk
 from tkinter import messagebox
 
+from tk_scheduler import Scheduler
+import metrics
+
 APP_TITLE = "GO CBT APP"
 PAY_URL = "https://paystack.shop/pay/hpv92fjpxf"
 
@@ -15,6 +19,7 @@ PAY_URL = "https://paystack.shop/pay/hpv92fjpxf"
 GOCBT_SAFE          = os.environ.get("GOCBT_SAFE", "0") == "1"        # skip activation
 GOCBT_SKIP_SPLASH   = os.environ.get("GOCBT_SKIP_SPLASH", "0") == "1" # go straight to portal (dev)
 GOCBT_FORCE_DIALOG  = os.environ.get("GOCBT_FORCE_DIALOG", "0") == "1" # force activation for testing
+# GOCBT_METRICS=1 (read by metrics.py) logs event-loop lag and screen timings
 
 # ------------------------------- logging -------------------------------------
 def _log(msg: str) -> None:
@@ -56,6 +61,10 @@ def _center_window(win: tk.Tk | tk.Toplevel, w: int = None, h: int = None) -> No
     except Exception as e:
         _log(f"_center_window failed: {e!r}")
 
+def _later(win: tk.Tk | tk.Toplevel, ms: int, fn) -> None:
+    """Run fn() after ~ms on the root's shared scheduler; dropped if `win` is destroyed first."""
+    Scheduler.for_root(win).call_later(ms, fn, owner=win)
+
 def _set_icon_if_available(win: tk.Tk | tk.Toplevel):
     try:
         from path_utils import find_app_icon
@@ -72,7 +81,7 @@ def _raise_to_front(win: tk.Tk | tk.Toplevel):
     try:
         win.deiconify(); win.lift()
         win.attributes("-topmost", True)
-        win.after(220, lambda: win.attributes("-topmost", False))
+        _later(win, 220, lambda: win.attributes("-topmost", False))
         try:
             win.focus_force()
         except Exception:
@@ -104,7 +113,7 @@ except Exception as e:
             _center_window(self, 520, 320)
 
     def show_loading_intro(root, on_done, duration_ms=1200):
-        root.after(max(200, int(duration_ms)), on_done)
+        _later(root, max(200, int(duration_ms)), on_done)
 
 try:
     from activation_dialog import ActivationDialog
@@ -202,7 +211,7 @@ def start_portal(root: tk.Tk):
                             break
                         except Exception as ee:
                             _log(f"watchdog {alt}() failed: {ee!r}")
-                root.after(350, lambda: _ensure_has_content_fallback(root))
+                _later(root, 350, lambda: _ensure_has_content_fallback(root))
         except Exception as ee:
             _log(f"watchdog error: {ee!r}")
 
@@ -219,10 +228,10 @@ def start_portal(root: tk.Tk):
         except Exception as e:
             _log(f"fallback UI failed: {e!r}")
 
-    root.after(700, _render_watchdog)
+    _later(root, 700, _render_watchdog)
     try:
         root.lift(); root.focus_force()
-        root.attributes("-topmost", True); root.after(200, lambda: root.attributes("-topmost", False))
+        root.attributes("-topmost", True); _later(root, 200, lambda: root.attributes("-topmost", False))
     except Exception:
         pass
 
@@ -282,9 +291,10 @@ def _ensure_activation(root: tk.Tk, on_ready):
                 dlg.update_idletasks()
                 _center_window(dlg, 640, 400)
                 dlg.lift(); dlg.attributes("-topmost", True); dlg.focus_force(); dlg.grab_set()
+                # same slots as the dialog's own nudges, so both share one scheduler tick
                 for delay in (150, 300, 600, 900):
-                    dlg.after(delay, lambda w=dlg: (w.lift(), w.attributes("-topmost", True), w.focus_force()))
-                dlg.after(1100, lambda w=dlg: w.attributes("-topmost", False))
+                    _later(dlg, delay, lambda w=dlg: (w.lift(), w.attributes("-topmost", True), w.focus_force()))
+                _later(dlg, 1100, lambda w=dlg: w.attributes("-topmost", False))
                 try: dlg.bell()
                 except Exception: pass
             except Exception:
@@ -354,8 +364,9 @@ def _run_splash_then_portal(root: tk.Tk):
         return
 
     # watchdogs (unchanged), but they call _fallback_to_loader(), which is now single-shot
-    root.after(600,  lambda: (splash.winfo_exists() and splash.winfo_ismapped()) or _fallback_to_loader("not-mapped"))
-    root.after(1200, lambda: (splash.winfo_exists() and splash.winfo_ismapped()) or _fallback_to_loader("destroyed"))
+    # (owned by root, not splash: a splash that was destroyed early must still fall back)
+    _later(root, 600,  lambda: (splash.winfo_exists() and splash.winfo_ismapped()) or _fallback_to_loader("not-mapped"))
+    _later(root, 1200, lambda: (splash.winfo_exists() and splash.winfo_ismapped()) or _fallback_to_loader("destroyed"))
 
     # Watchdog: if the splash is not visible within 900ms, fallback to loader
     def _watch_splash_visibility():
@@ -379,8 +390,8 @@ def _run_splash_then_portal(root: tk.Tk):
             _fallback_to_loader("watchdog-exception")
 
     # Some GPUs/remote desktops need a bit longer to map; check twice
-    root.after(600, _watch_splash_visibility)
-    root.after(1200, _watch_splash_visibility)
+    _later(root, 600, _watch_splash_visibility)
+    _later(root, 1200, _watch_splash_visibility)
 
 def _after_splash(root: tk.Tk):
     if getattr(root, "_splash_transition_done", False):
@@ -397,6 +408,7 @@ def _after_splash(root: tk.Tk):
 def start_app():
     _log("start_app()")
     root = tk.Tk()
+    metrics.start(root)     # no-op unless GOCBT_METRICS=1
     _set_icon_if_available(root)
     root.withdraw()
     root.title(APP_TITLE)
@@ -409,4 +421,7 @@ def start_app():
     root.mainloop()
 
 if __name__ == "__main__":
+    # Needed when GOCBT_LOAD_POOL=process spawns question-bank workers from the frozen EXE
+    import multiprocessing
+    multiprocessing.freeze_support()
     start_app()
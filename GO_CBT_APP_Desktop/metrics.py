@@ -0,0 +1,214 @@
+# metrics.py — opt-in performance log for "the app froze" reports (GOCBT_METRICS=1)
+# - Off by default: timed() then returns the function unchanged and start() does nothing,
+#   so a normal exam run pays nothing for it
+# - Event-loop lag: a heartbeat after() every HEARTBEAT_MS records how late it ran; every
+#   stall of STALL_MS or more is logged on its own (with the screen that was up), and a
+#   "loop" summary (p50/p95/max lag + tk_scheduler stats) is written every SUMMARY_S
+# - timed(kind): wall time of a call (screen builds, background setup, PDF export); for
+#   "screen" calls also the time until Tk was idle again (layout + redraw)
+# - question_bank records its own "load" events: every subject load (pack, cache or JSON;
+#   on demand or from the pool), each prefetch pass and each hot-reload re-parse
+# - student_portal records an "exam" event with the seed of every simulation/blueprint exam
+# - Records are JSON lines in user_data_dir()/metrics/gocbt_metrics.jsonl, written by a
+#   daemon thread so disk I/O never lands on the UI thread; the file rotates at MAX_BYTES
+#   keeping KEEP_FILES old copies (.1 newest), small enough to collect from lab machines
+
+import os, sys, json, time, queue, atexit, platform, threading, functools
+
+from path_utils import user_data_dir
+
+ENABLED = os.environ.get("GOCBT_METRICS", "0") == "1"
+
+METRICS_DIRNAME = "metrics"
+METRICS_FILE    = "gocbt_metrics.jsonl"
+MAX_BYTES       = 1_000_000
+KEEP_FILES      = 3
+HEARTBEAT_MS    = 250
+STALL_MS        = 200     # heartbeat lag at or above this is logged as its own record
+SUMMARY_S       = 60
+
+SESSION = f"{os.getpid()}-{int(time.time())}"
+
+_queue = queue.Queue()
+_write_lock = threading.Lock()
+_writer = None
+_context = {"screen": None}
+
+
+def metrics_path() -> str:
+    return os.path.join(user_data_dir(), METRICS_DIRNAME, METRICS_FILE)
+
+
+# ---------- writing ----------
+def _rotate(path):
+    for i in range(KEEP_FILES - 1, 0, -1):
+        src = f"{path}.{i}"
+        if os.path.exists(src):
+            os.replace(src, f"{path}.{i + 1}")
+    os.replace(path, f"{path}.1")
+
+
+def _write(lines):
+    path = metrics_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if os.path.exists(path) and os.path.getsize(path) > MAX_BYTES:
+            _rotate(path)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("".join(lines))
+    except Exception as e:
+        print(f"[WARN] Metrics not written: {e}")
+
+
+def _drain(first=None):
+    with _write_lock:
+        lines = [first] if first is not None else []
+        try:
+            while True:
+                lines.append(_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            _write(lines)
+
+
+def _writer_loop():
+    while True:
+        _drain(_queue.get())
+
+
+def flush() -> None:
+    """Write everything queued so far (called at exit and when the root closes)."""
+    _drain()
+
+
+def record(kind: str, **fields) -> None:
+    """Queue one metrics record (no-op unless GOCBT_METRICS=1)."""
+    global _writer
+    if not ENABLED:
+        return
+    rec = {"ts": round(time.time(), 3), "session": SESSION, "kind": kind}
+    rec.update(fields)
+    _queue.put(json.dumps(rec, ensure_ascii=False, default=str) + "\n")
+    if _writer is None:
+        _writer = threading.Thread(target=_writer_loop, name="gocbt-metrics", daemon=True)
+        _writer.start()
+        atexit.register(flush)
+
+
+# ---------- timing ----------
+def timed(kind: str, name: str | None = None):
+    """
+    Decorator: record the wall time of every call as {"kind": kind, "name": ..., "ms": ...}.
+    Applied to a widget method with kind="screen", it also records "idle_ms" (build start
+    until Tk next runs idle callbacks) and remembers the screen for stall records.
+    """
+    def wrap(fn):
+        if not ENABLED:
+            return fn
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            if kind == "screen":
+                _context["screen"] = label
+            t0 = time.perf_counter()
+            ok = False
+            try:
+                result = fn(*args, **kwargs)
+                ok = True
+                return result
+            finally:
+                ms = round((time.perf_counter() - t0) * 1000, 1)
+                widget = args[0] if args else None
+                if kind == "screen" and ok and hasattr(widget, "after_idle"):
+                    def _idle():
+                        record(kind, name=label, ms=ms, idle_ms=round((time.perf_counter() - t0) * 1000, 1))
+                    try:
+                        widget.after_idle(_idle)
+                    except Exception:
+                        record(kind, name=label, ms=ms, ok=ok)
+                else:
+                    record(kind, name=label, ms=ms, ok=ok)
+        return inner
+    return wrap
+
+
+# ---------- event-loop heartbeat ----------
+class _Heartbeat:
+    def __init__(self, root):
+        self.root = root
+        self.lags = []
+        self.stalls = 0
+        self.expected = 0.0
+        self.summary_at = time.monotonic() + SUMMARY_S
+        self.job = None
+
+    def start(self):
+        self.expected = time.monotonic() + HEARTBEAT_MS / 1000
+        self.job = self.root.after(HEARTBEAT_MS, self._beat)
+
+    def _beat(self):
+        now = time.monotonic()
+        lag = max(0.0, (now - self.expected) * 1000)
+        self.lags.append(lag)
+        if lag >= STALL_MS:
+            self.stalls += 1
+            record("stall", lag_ms=round(lag, 1), screen=_context["screen"])
+        if now >= self.summary_at:
+            self._summary()
+            self.summary_at = now + SUMMARY_S
+        self.expected = now + HEARTBEAT_MS / 1000
+        try:
+            self.job = self.root.after(HEARTBEAT_MS, self._beat)
+        except Exception:     # root destroyed
+            self.job = None
+
+    def _summary(self):
+        lags = sorted(self.lags)
+        if not lags:
+            return
+        fields = {
+            "beats": len(lags),
+            "lag_p50_ms": round(lags[len(lags) // 2], 1),
+            "lag_p95_ms": round(lags[min(len(lags) - 1, int(len(lags) * 0.95))], 1),
+            "lag_max_ms": round(lags[-1], 1),
+            "stalls": self.stalls,
+            "screen": _context["screen"],
+        }
+        sched = getattr(self.root, "_gocbt_scheduler", None)
+        if sched is not None:
+            fields["scheduler"] = sched.stats()
+            sched.reset_stats()
+        record("loop", **fields)
+        self.lags.clear()
+        self.stalls = 0
+
+    def stop(self, _evt=None):
+        if _evt is not None and _evt.widget is not self.root:
+            return
+        if self.job is not None:
+            try:
+                self.root.after_cancel(self.job)
+            except Exception:
+                pass
+            self.job = None
+        self._summary()
+        flush()
+
+
+def start(root) -> None:
+    """Start the heartbeat on `root` (once per root) and log a session record."""
+    if not ENABLED or getattr(root, "_gocbt_heartbeat", None) is not None:
+        return
+    hb = root._gocbt_heartbeat = _Heartbeat(root)
+    try:
+        tk_version = root.tk.call("info", "patchlevel")
+    except Exception:
+        tk_version = None
+    record("session", python=platform.python_version(), tk=tk_version,
+           os=platform.platform(), frozen=bool(getattr(sys, "frozen", False)),
+           screen=f"{root.winfo_screenwidth()}x{root.winfo_screenheight()}")
+    root.bind("<Destroy>", hb.stop, add="+")
+    hb.start()
+    print(f"[INFO] Metrics on: {metrics_path()}")
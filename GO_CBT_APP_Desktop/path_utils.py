@@ -1,4 +1,4 @@
-import os, sys
+import os, sys, threading
 
 def _base_dir() -> str:
     if hasattr(sys, "_MEIPASS"):
@@ -12,7 +12,31 @@ BASE_DIR = _base_dir()
 def resource_path(*parts: str) -> str:
     return os.path.join(BASE_DIR, *parts)
 
+def user_data_dir() -> str:
+    """Writable per-user folder for caches/state (GOCBT_DATA_DIR overrides)."""
+    base = os.environ.get("GOCBT_DATA_DIR", "").strip()
+    if not base:
+        if os.name == "nt":
+            root = os.environ.get("LOCALAPPDATA") or os.environ.get("APPDATA") or os.path.expanduser("~")
+            base = os.path.join(root, "GO_CBT")
+        else:
+            root = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+            base = os.path.join(root, "go_cbt")
+    try:
+        os.makedirs(base, exist_ok=True)
+    except Exception:
+        pass
+    return base
+
+_ASSET_DIRS = None
+
 def assets_dir_candidates() -> list[str]:
+    global _ASSET_DIRS
+    if _ASSET_DIRS is None:
+        _ASSET_DIRS = _compute_assets_dir_candidates()
+    return list(_ASSET_DIRS)
+
+def _compute_assets_dir_candidates() -> list[str]:
     candidates = []
     candidates.append(os.path.join(BASE_DIR, "assets"))
     candidates.append(os.path.join(BASE_DIR, "_internal", "assets"))
@@ -39,25 +63,106 @@ def assets_dir_candidates() -> list[str]:
             unique.append(d)
     return unique
 
+# ------------------------------
+# Asset directory index
+# ------------------------------
+def _norm_name(s: str) -> str:
+    """lowercase alnum only, so 'Financial Regulations_clean.json' ~ 'financialregulationsjson'"""
+    return "".join(ch for ch in s.lower() if ch.isalnum())
+
+def _strip_common_suffixes(s: str) -> str:
+    # Allow matching with or without _clean/_normalized, etc.
+    for token in ("clean", "normalized", "normalised"):
+        s = s.replace(token, "")
+    return s
+
+class _AssetIndex:
+    """
+    One listing per candidate assets dir, built on first use and rebuilt only
+    when that dir's mtime changes (a file was added, removed or renamed).
+    Each listing maps normcase'd filename and normalized filename → path, so
+    lookups are dict hits instead of exists()/glob() calls per subject per dir
+    (and, like exists(), case-insensitive on Windows).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._dirs = {}   # dir -> (mtime_ns, {normcase(name): path}, [(norm_name, name, path)])
+
+    def _listing(self, d):
+        try:
+            mtime = os.stat(d).st_mtime_ns
+        except OSError:
+            self._dirs.pop(d, None)
+            return None
+        ent = self._dirs.get(d)
+        if ent is not None and ent[0] == mtime:
+            return ent
+        with self._lock:
+            names, norms = {}, []
+            try:
+                for name in sorted(os.listdir(d)):
+                    p = os.path.join(d, name)
+                    names[os.path.normcase(name)] = p
+                    norms.append((_strip_common_suffixes(_norm_name(name)), name, p))
+            except OSError:
+                return None
+            ent = (mtime, names, norms)
+            self._dirs[d] = ent
+        return ent
+
+    def find(self, *names: str) -> str | None:
+        """First candidate dir (in priority order) holding any of `names`, tried in order."""
+        for d in assets_dir_candidates():
+            ent = self._listing(d)
+            if not ent:
+                continue
+            for name in names:
+                p = ent[1].get(os.path.normcase(name))
+                if p:
+                    return p
+        return None
+
+    def find_fuzzy(self, name: str, ext: str = ".json") -> str | None:
+        """Ignore case/spacing/_clean/_normalized; same-name match beats substring match."""
+        want = _strip_common_suffixes(_norm_name(name))
+        listings = [ent for ent in (self._listing(d) for d in assets_dir_candidates()) if ent]
+        for ent in listings:
+            for nb, base, p in ent[2]:
+                if nb == want and base.lower().endswith(ext):
+                    return p
+        for ent in listings:
+            for nb, base, p in ent[2]:
+                if base.lower().endswith(ext) and (want in nb or nb in want):
+                    return p
+        return None
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._dirs.clear()
+
+ASSET_INDEX = _AssetIndex()
+
+def find_asset(name: str) -> str | None:
+    return ASSET_INDEX.find(name)
+
+def find_asset_fuzzy(name: str, ext: str = ".json") -> str | None:
+    return ASSET_INDEX.find_fuzzy(name, ext)
+
 def asset_path(*parts: str) -> str:
-    for d in assets_dir_candidates():
-        p = os.path.join(d, *parts)
-        if os.path.exists(p):
+    if len(parts) == 1:
+        p = ASSET_INDEX.find(parts[0])
+        if p:
             return p
+    else:
+        for d in assets_dir_candidates():
+            p = os.path.join(d, *parts)
+            if os.path.exists(p):
+                return p
     return os.path.join(assets_dir_candidates()[0], *parts)
 
 def find_app_icon() -> str | None:
-    for d in assets_dir_candidates():
-        for name in ("new_app_icon.ico","go_cbt.ico","app.ico","go_cbt_logo.ico","logo.ico"):
-            p = os.path.join(d, name)
-            if os.path.exists(p):
-                return p
-    return None
+    return ASSET_INDEX.find("new_app_icon.ico","go_cbt.ico","app.ico","go_cbt_logo.ico","logo.ico")
 
 def find_logo() -> str | None:
-    for d in assets_dir_candidates():
-        for name in ("go_cbt_logo.png","go_cbt_logo.gif","go_cbt.png","logo.png","splash.png","splash.gif"):
-            p = os.path.join(d, name)
-            if os.path.exists(p):
-                return p
-    return None
+    return ASSET_INDEX.find("go_cbt_logo.png","go_cbt_logo.gif","go_cbt.png","logo.png","splash.png","splash.gif")
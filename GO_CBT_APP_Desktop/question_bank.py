@@ -0,0 +1,929 @@
+# question_bank.py — subject manifest, universal question normalizer and compiled bank cache
+# - SUBJECT_FILES: subject name → intended JSON filename (finder is fuzzy about case/spacing)
+# - normalize_question_item(): one canonical shape for every historical item layout
+# - normalize_question_batch(): detects a file's schema once, fast-paths matching rows,
+#   and counts the rows that needed the generic normalizer (or were forced to "A")
+# - read_subject_file(): parse + normalize + dedupe one subject JSON
+# - BankCache: pickled, already-normalized questions keyed by each source file's
+#   size, mtime and content hash; only changed subjects are re-parsed
+# - load_subjects_parallel(): cold-start parsing on a worker pool with per-file timings
+# - LazyQuestionBank: Mapping that parses a subject on first use + background prefetch;
+#   subjects present (and up to date) in questions.gocbtpack are served straight from the mmap;
+#   a subject is parsed by one thread only (others wait for it) and never under the bank lock
+# - SubjectWatcher: polls loaded subjects' JSON (size + mtime) and re-parses only the
+#   changed ones in the background; the app swaps them in between exams
+# - Offline build: compile_assets.py validates everything and writes the pack + audit report
+
+import os, sys, json, time, pickle, hashlib, threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from collections.abc import Mapping
+
+from path_utils import assets_dir_candidates, user_data_dir, find_asset, find_asset_fuzzy
+from question_store import QuestionBank
+from question_pack import open_default_pack, source_matches
+import metrics
+
+# ------------------------------
+# Subject manifest (display order)
+# ------------------------------
+SUBJECT_FILES = [
+    ("Current Affairs", "Nigerian_Current_Affairs_Full.json"),
+    ("Code of Conduct", "Code_of_Conduct_Questions_1-400.json"),
+    ("Nigerian Tax", "NIGERIAN_TAX_MCQs.json"),
+    ("Leadership", "Leadership.json"),
+    ("Computer Knowledge", "Computer.json"),
+    ("Psychometrics", "Psychometrics.json"),
+    ("Financial Regulations", "Financial Regulations.json"),
+    ("Public Procurement", "Public Procurement.json"),
+    ("Federal Civil Service Strategic Implementation Plan 2025", "FCSSIP25_MCQs.json"),
+    ("CBN and Monetary Policy", "CBN AND MONETARY POLICIES.json"),
+    ("FCTA and It's Operations", "FCTA AND ITS OPERATIONS.json"),
+    ("Comprehensive Competency Framework", "CCF_100_MCQs.json"),
+    ("Public Service Rules", "PSR.json"),
+    ("Education Profession", "Education_Sector.json"),
+    ("Medical/Health Profession", "Health_MCQs.json"),
+    ("Tourism Development, Arts & Culture Profession", "TAC_MCQs.json"),
+    ("Transportation & Vehicle Inspection Profession", "Transport_MCQs.json"),
+    ("Lands, Housing & Urban Development Profession", "URP_MCQs.json"),
+    ("Agriculture, Rural Development and Infrastructure Profession", "Agric_MCQs.json"),
+    ("Social Welfare & Community Development Profession", "Social_MCQs.json"),
+    ("Human Resource Management (Admin) Profession", "HRM_MCQs.json"),
+    ("Engineering Profession", "Engineering_MCQs.json"),
+    ("Civil Service Reforms & Policies", "CCRP_MCQs.json"),
+    ("Fire Service Profession", "Fire_Service_MCQs.json"),
+    ("General Knowledge", "General Knowledge MCQs.json"),
+    ("Expanded FCTA Structure & Functions", "Expanded FCTA Structure & Functions.json"),
+    ("Legal Profession", "Legal_MCQs.json"),
+    ("Finance & Account, Budget and Audit Profession", "Accounting_MCQs.json"),
+    ("Architectural Profession", "Architecture.json"),
+    ("Information and Communication Technology Profession", "ICT.json"),
+    ("General Mock Test for All", "GMT.json"),
+    ("Surveying Profession", "Surveying.json"),
+    ("Journalism Profession", "Journalism.json"),
+    ("Public Relations Profession", "Public Relations.json"),
+    ("Guidance & Counselling and Librarianship Professions", "Guidance_Library_MCQs.json"),
+    ("Community & Public Health Profession", "Community_Public_Health_MCQs.json"),
+    ("Environmental & Utilities Profession", "Environment_Utilities_MCQs.json"),
+    ("Compliance/Regulatory Profession", "Compliance_Regulatory_MCQs.json"),
+    ("Planning, Research & Statistics (PRS) Profession", "Planning_Research_Statistics_MCQs.json"),
+    ("Protocol & Liaison, Public Affairs and Customer Service Profession", "Protocol_PublicAffairs_CustomerService_MCQs.json"),
+]
+
+CACHE_FILENAME = "question_bank.cache"
+CACHE_VERSION  = 2   # bump whenever the normalized shape or dedupe rule changes (2: columnar QuestionBank)
+
+# Set GOCBT_NO_BANK_CACHE=1 to always parse the raw JSON (content authoring/debugging)
+USE_BANK_CACHE = os.environ.get("GOCBT_NO_BANK_CACHE", "0") != "1"
+
+# Cold-load worker pool: GOCBT_LOAD_WORKERS=1 disables it; GOCBT_LOAD_POOL=process uses
+# processes (true CPU parallelism, but each spawn costs ~0.5 s in a frozen Windows build)
+LOAD_WORKERS = int(os.environ.get("GOCBT_LOAD_WORKERS", "0")) or min(8, (os.cpu_count() or 2))
+LOAD_POOL    = os.environ.get("GOCBT_LOAD_POOL", "thread").strip().lower()
+
+# Set GOCBT_NO_PACK=1 to ignore assets/questions.gocbtpack even if it is shipped
+USE_QUESTION_PACK = os.environ.get("GOCBT_NO_PACK", "0") != "1"
+
+# A pack written by compile_assets.py was validated offline; the frozen EXE (whose JSON
+# can't drift from it) serves it without any stat/hash check. GOCBT_TRUST_PACK=1 forces it.
+TRUST_COMPILED_PACK = bool(getattr(sys, "frozen", False)) or os.environ.get("GOCBT_TRUST_PACK", "0") == "1"
+
+# Hot reload of edited subject files: GOCBT_NO_HOT_RELOAD=1 disables the watcher,
+# GOCBT_RELOAD_INTERVAL sets the polling period in seconds
+HOT_RELOAD      = os.environ.get("GOCBT_NO_HOT_RELOAD", "0") != "1"
+RELOAD_INTERVAL = float(os.environ.get("GOCBT_RELOAD_INTERVAL", "0") or 2.0)
+
+
+# --- BEGIN: universal question normalizer -------------------------------------
+def _normalize_options_dict(opts):
+    """
+    Accepts options in any of these shapes:
+      - dict like {"A": "...", "b": "...", "C":"...", "D":"..."} (any case/order)
+      - list like ["A. Text", "B) Text", "C Text", "D - Text"]   (will parse prefixes)
+    Returns ordered dict: {"A": "...", "B": "...", "C": "...", "D": "..."}
+    Missing items become empty strings (so UI still renders A-D).
+    """
+    out = {"A": "", "B": "", "C": "", "D": ""}
+    if isinstance(opts, dict):
+        for k, v in list(opts.items()):
+            K = str(k).strip().upper()
+            if K in out:
+                out[K] = (v if isinstance(v, str) else str(v)).strip()
+        return out
+
+    if isinstance(opts, list):
+        # try to parse "A. xxx", "B) xxx", "C xxx", etc.
+        for raw in opts:
+            s = (raw if isinstance(raw, str) else str(raw)).strip()
+            if not s:
+                continue
+            prefix = s[:2].upper()  # "A.", "B)", "C ", "D-"
+            letter = None
+            if prefix and prefix[0] in "ABCD":
+                letter = prefix[0]
+                # remove typical separators after the letter
+                rest = s[1:].lstrip(".:) -").strip()
+                out[letter] = rest
+        return out
+
+    # unknown shape: return empty slots
+    return out
+
+
+def _extract_letter_from_answer_field(ans):
+    """
+    If 'answer' is a letter (A-D), return letter; if it's text, return None (we'll map later).
+    """
+    if isinstance(ans, str):
+        s = ans.strip().upper()
+        if s in ("A", "B", "C", "D"):
+            return s
+    return None
+
+
+def _map_text_to_letter(options_dict, text):
+    """Try to match a free-text correct answer to one of A-D by case-insensitive equality."""
+    if not isinstance(text, str):
+        text = str(text)
+    goal = text.strip().lower()
+    for L, opt in options_dict.items():
+        if opt.strip().lower() == goal:
+            return L
+    return None
+
+
+def normalize_question_item(item):
+    """
+    Accepts any of your historical item shapes and returns:
+      {
+        "question": "<text>",
+        "options": {"A": "...", "B": "...", "C": "...", "D": "..."},
+        "correct": "A" | "B" | "C" | "D"
+      }
+
+    Supported inputs:
+      - options as dict or list
+      - correct letter in:  answer / correct_option / CorrectOption / correct / Correct
+      - correct text in:    correct_answer / CorrectAnswer
+      - if only text is present, we map it to A-D via options
+    """
+    norm, _forced = _normalize_item_checked(item)
+    return norm
+
+
+def _resolve_letter(item, options_dict):
+    """The A-D letter normalize_question_item would pick, or None if nothing matched."""
+    # 1) Try to get a letter straight
+    letter = None
+    for key in ("correct_option", "CorrectOption", "correct", "Correct"):
+        if key in item:
+            val = item.get(key)
+            if isinstance(val, str) and val.strip().upper() in ("A", "B", "C", "D"):
+                letter = val.strip().upper()
+                break
+
+    if not letter:
+        # 'answer' field can be letter or text
+        letter = _extract_letter_from_answer_field(item.get("answer"))
+
+    # 2) If we still don't have a letter, try by matching text
+    if not letter:
+        corr_text = item.get("correct_answer") or item.get("CorrectAnswer") or ""
+        if corr_text:
+            letter = _map_text_to_letter(options_dict, corr_text)
+
+    # 3) Final fallback: if 'answer' was text (not letter), try mapping it
+    if not letter and isinstance(item.get("answer"), str):
+        letter = _map_text_to_letter(options_dict, item["answer"])
+
+    return letter if letter in ("A", "B", "C", "D") else None
+
+
+def _normalize_item_checked(item):
+    """normalize_question_item() plus a flag telling whether the answer had to be forced to 'A'."""
+    qtext = item.get("question") or item.get("Question") or item.get("title") or ""
+    opts  = item.get("options", [])
+    options_dict = _normalize_options_dict(opts)
+
+    letter = _resolve_letter(item, options_dict)
+
+    # Guarantee a letter (worst case pick empty 'A' to avoid crash; better than None)
+    forced = letter is None
+    if forced:
+        letter = "A"
+
+    return {
+        "question": str(qtext).strip(),
+        "options": {
+            "A": options_dict.get("A", ""),
+            "B": options_dict.get("B", ""),
+            "C": options_dict.get("C", ""),
+            "D": options_dict.get("D", ""),
+        },
+        "correct": letter
+    }, forced
+
+
+# Key priority used by _resolve_letter for a direct A-D letter
+_LETTER_KEYS = ("correct_option", "CorrectOption", "correct", "Correct", "answer")
+_LETTERS = ("A", "B", "C", "D")
+_LETTER_SET = frozenset(_LETTERS)
+_SCHEMA_SAMPLE = 32
+
+
+def _letter_source(item):
+    """Which key supplies the answer letter directly (None if it needs text matching)."""
+    for key in _LETTER_KEYS[:4]:
+        if key in item:
+            val = item.get(key)
+            if isinstance(val, str) and val.strip().upper() in _LETTER_SET:
+                return key
+    ans = item.get("answer")
+    if isinstance(ans, str) and ans.strip().upper() in _LETTER_SET:
+        return "answer"
+    return None
+
+
+def _options_shape(opts):
+    if type(opts) is dict and opts.keys() == _LETTER_SET and all(type(v) is str for v in opts.values()):
+        return "dict"
+    if (type(opts) is list and len(opts) == 4
+            and all(type(v) is str and v.lstrip()[:1] == L for v, L in zip(opts, _LETTERS))):
+        return "list"
+    return None
+
+
+def detect_schema(items, sample: int = _SCHEMA_SAMPLE):
+    """
+    Look at up to `sample` rows and return (text_key, options_shape, letter_key)
+    if they all agree, else None. options_shape is "dict" ({"A".."D": str}) or
+    "list" (["A. ..", "B) ..", ..]); letter_key is the field that supplies A-D.
+    """
+    text_key = shape = letter_key = None
+    seen = 0
+    for item in items[:sample]:
+        if not isinstance(item, dict):
+            return None
+        tk_ = next((k for k in ("question", "Question", "title") if item.get(k)), None)
+        sh = _options_shape(item.get("options"))
+        lk = _letter_source(item)
+        if tk_ is None or sh is None or lk is None:
+            return None
+        if seen and (tk_, sh, lk) != (text_key, shape, letter_key):
+            return None
+        text_key, shape, letter_key = tk_, sh, lk
+        seen += 1
+    return (text_key, shape, letter_key) if seen else None
+
+
+def _make_fast_normalizer(schema):
+    """
+    Build a per-file normalizer for `schema`. It returns the same dict as
+    normalize_question_item for rows that match, or None so the caller can
+    fall back to the generic path.
+    """
+    text_key, shape, letter_key = schema
+    # keys that outrank letter_key in _resolve_letter; their presence means "use the slow path"
+    outranking = _LETTER_KEYS[:_LETTER_KEYS.index(letter_key)]
+
+    def fast(item):
+        if type(item) is not dict:
+            return None
+        qtext = item.get(text_key)
+        if not qtext or type(qtext) is not str:
+            return None
+        if text_key != "question" and item.get("question"):
+            return None
+        if text_key == "title" and item.get("Question"):
+            return None
+        for k in outranking:
+            if k in item:
+                return None
+        val = item.get(letter_key)
+        if type(val) is not str:
+            return None
+        letter = val.strip().upper()
+        if letter not in _LETTER_SET:
+            return None
+        opts = item.get("options")
+        if shape == "dict":
+            if type(opts) is not dict or opts.keys() != _LETTER_SET:
+                return None
+            a, b, c, d = opts["A"], opts["B"], opts["C"], opts["D"]
+            if not (type(a) is str and type(b) is str and type(c) is str and type(d) is str):
+                return None
+            options = {"A": a.strip(), "B": b.strip(), "C": c.strip(), "D": d.strip()}
+        else:
+            if type(opts) is not list or len(opts) != 4:
+                return None
+            options = {}
+            for raw, L in zip(opts, _LETTERS):
+                if type(raw) is not str:
+                    return None
+                t = raw.strip()
+                if t[:1] != L:
+                    return None
+                options[L] = t[1:].lstrip(".:) -").strip()
+        return {"question": qtext.strip(), "options": options, "correct": letter}
+
+    return fast
+
+
+def normalize_question_batch(items):
+    """
+    Normalize a whole file's rows.
+    Returns (normalized_rows, stats) where stats is
+      {"rows", "fast", "fallback", "skipped", "forced_a", "forced_rows", "schema"}
+    ("forced_rows" = source row numbers whose answer could not be resolved and became "A").
+    Malformed rows are skipped, exactly like the per-item loop used to do.
+    """
+    items = items if isinstance(items, list) else list(items or [])
+    schema = detect_schema(items)
+    fast = _make_fast_normalizer(schema) if schema else None
+    out = []
+    stats = {"rows": len(items), "fast": 0, "fallback": 0, "skipped": 0,
+             "forced_a": 0, "forced_rows": [], "schema": list(schema) if schema else None}
+    for idx, raw in enumerate(items):
+        norm = fast(raw) if fast is not None else None
+        if norm is not None:
+            stats["fast"] += 1
+            out.append(norm)
+            continue
+        try:
+            norm, forced = _normalize_item_checked(raw)
+        except Exception:
+            stats["skipped"] += 1
+            continue
+        stats["fallback"] += 1
+        if forced:
+            stats["forced_a"] += 1
+            stats["forced_rows"].append(idx)
+        out.append(norm)
+    return out, stats
+# --- END: universal question normalizer ---------------------------------------
+
+
+# ------------------------------
+# Tolerant asset finder
+# ------------------------------
+def find_json_file(preferred_name: str) -> str | None:
+    """
+    1) Try exact match in any candidate assets dir
+    2) Fuzzy match ignoring case/spacing/_clean/_normalized
+    Both go through the shared path_utils asset index (no per-call glob).
+    """
+    return find_asset(preferred_name) or find_asset_fuzzy(preferred_name, ".json")
+
+
+# ------------------------------
+# Subject file parsing
+# ------------------------------
+def _question_key(norm: dict) -> tuple:
+    opts = norm.get("options", {})
+    return (
+        norm.get("question", "").strip(),
+        opts.get("A", "").strip(),
+        opts.get("B", "").strip(),
+        opts.get("C", "").strip(),
+        opts.get("D", "").strip(),
+        (norm.get("correct") or "").strip().upper(),
+    )
+
+def read_subject_file(path: str, report: dict | None = None) -> QuestionBank:
+    """
+    Read one subject JSON and return its normalized, de-duplicated questions
+    as a columnar QuestionBank whose rows read like the normalized dict:
+      { "question": str, "options": {"A","B","C","D"}, "correct": "A"|"B"|"C"|"D" }
+    If `report` is given it is filled with normalize_question_batch() stats
+    plus "duplicates". Returns an empty bank if the file cannot be read.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        print(f"[ERROR] Unable to read {path}: {e}")
+        return QuestionBank()
+
+    # unwrap {"questions": [...]} shape if present
+    if isinstance(data, dict) and "questions" in data:
+        data = data["questions"]
+
+    # --- normalize (schema fast path + generic fallback); avoid duplicates ---
+    rows, stats = normalize_question_batch(data)
+    questions = QuestionBank()
+    seen = set()
+    for norm in rows:
+        key = _question_key(norm)
+        if key in seen:
+            continue
+        seen.add(key)
+        questions.append(norm)
+
+    stats["duplicates"] = len(rows) - len(questions)
+    if stats["fallback"] or stats["forced_a"]:
+        print(f"[INFO] {os.path.basename(path)}: {stats['fallback']} of {stats['rows']} row(s) needed the "
+              f"generic normalizer, {stats['forced_a']} answer(s) forced to 'A'")
+    if report is not None:
+        report.update(stats)
+    return questions
+
+
+# ------------------------------
+# Compiled bank cache
+# ------------------------------
+def _file_stat(path: str) -> tuple[int, int]:
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+def _file_sha1(path: str) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def default_cache_path() -> str:
+    """
+    Prefer the first existing assets dir (next to the JSON it compiles);
+    fall back to the per-user data dir when that location is read-only
+    (e.g. Program Files or a one-file PyInstaller temp dir).
+    """
+    for d in assets_dir_candidates():
+        if os.path.isdir(d):
+            p = os.path.join(d, CACHE_FILENAME)
+            if os.access(d, os.W_OK) or os.path.exists(p):
+                return p
+            break
+    return os.path.join(user_data_dir(), CACHE_FILENAME)
+
+
+class BankCache:
+    """
+    On-disk map: source basename → {"size", "mtime_ns", "sha1", "questions"}.
+
+    Lookup is validated in two steps: a matching (size, mtime) is trusted as-is;
+    otherwise the file is hashed and the entry reused if the content is unchanged
+    (e.g. the installer rewrote mtimes). Anything else is a miss.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path or default_cache_path()
+        self.entries: dict[str, dict] = {}
+        self.dirty = False
+        self._lock = threading.Lock()   # put()/save() may race with the prefetch thread
+
+    def load(self) -> "BankCache":
+        try:
+            with open(self.path, "rb") as f:
+                blob = pickle.load(f)
+            if isinstance(blob, dict) and blob.get("version") == CACHE_VERSION:
+                self.entries = blob.get("entries") or {}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[WARN] Ignoring unreadable question cache {self.path}: {e}")
+            self.entries = {}
+        return self
+
+    def get(self, src_path: str) -> QuestionBank | None:
+        ent = self.entries.get(os.path.basename(src_path))
+        if not ent:
+            return None
+        try:
+            size, mtime_ns = _file_stat(src_path)
+        except OSError:
+            return None
+        if ent.get("size") == size and ent.get("mtime_ns") == mtime_ns:
+            return ent.get("questions")
+        if ent.get("size") != size:
+            return None
+        try:
+            if _file_sha1(src_path) != ent.get("sha1"):
+                return None
+        except OSError:
+            return None
+        ent["mtime_ns"] = mtime_ns   # same bytes, new timestamp: refresh stamp only
+        self.dirty = True
+        return ent.get("questions")
+
+    def put(self, src_path: str, questions: QuestionBank) -> None:
+        try:
+            size, mtime_ns = _file_stat(src_path)
+            sha1 = _file_sha1(src_path)
+        except OSError:
+            return
+        with self._lock:
+            self.entries[os.path.basename(src_path)] = {
+                "size": size, "mtime_ns": mtime_ns, "sha1": sha1, "questions": questions,
+            }
+            self.dirty = True
+
+    def save(self) -> bool:
+        with self._lock:
+            if not self.dirty:
+                return True
+            blob = {"version": CACHE_VERSION, "entries": dict(self.entries)}
+            for target in (self.path, os.path.join(user_data_dir(), CACHE_FILENAME)):
+                try:
+                    tmp = target + ".tmp"
+                    with open(tmp, "wb") as f:
+                        pickle.dump(blob, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    os.replace(tmp, target)
+                    self.path = target
+                    self.dirty = False
+                    return True
+                except Exception as e:
+                    print(f"[WARN] Could not write question cache {target}: {e}")
+            return False
+
+
+def load_subject(preferred_filename: str, cache: BankCache | None = None) -> QuestionBank:
+    """Locate a subject JSON by name (exact or fuzzy) and return its normalized questions."""
+    path = find_json_file(preferred_filename)
+    if not path or not os.path.exists(path):
+        print(f"[WARN] Asset not found for: {preferred_filename}")
+        print("[WARN] Looked in:", assets_dir_candidates())
+        return QuestionBank()
+
+    if cache is not None:
+        cached = cache.get(path)
+        if cached is not None:
+            return cached
+
+    questions = read_subject_file(path)
+    print(f"[INFO] Loaded {len(questions)} from {os.path.basename(path)}")
+    if cache is not None and questions:
+        cache.put(path, questions)
+    return questions
+
+
+def _timed_read(path: str) -> tuple[QuestionBank, float]:
+    """Worker entry point (module level so a process pool can pickle it)."""
+    t0 = time.perf_counter()
+    questions = read_subject_file(path)
+    return questions, time.perf_counter() - t0
+
+
+def load_subjects_parallel(manifest=SUBJECT_FILES, cache: BankCache | None = None,
+                           max_workers: int = LOAD_WORKERS, pool: str = LOAD_POOL, on_loaded=None):
+    """
+    Read + normalize every subject in `manifest` on a worker pool.
+
+    Cache hits are served inline; only misses are sent to the pool. The result
+    keeps manifest order and the usual dict shape. `on_loaded(subject, questions)`
+    is called as each subject becomes available (before the others finish).
+    Returns: (dict[str, QuestionBank], timings) where timings is a list of
+      {"subject", "file", "count", "seconds", "cached"} in manifest order.
+    """
+    bank, timings, pending = {}, {}, []
+    for subject, filename in manifest:
+        path = find_json_file(filename)
+        if not path or not os.path.exists(path):
+            print(f"[WARN] Asset not found for: {filename}")
+            bank[subject] = QuestionBank()
+            if on_loaded is not None:
+                on_loaded(subject, bank[subject])
+            continue
+        t0 = time.perf_counter()
+        cached = cache.get(path) if cache is not None else None
+        if cached is not None:
+            bank[subject] = cached
+            timings[subject] = {"subject": subject, "file": os.path.basename(path), "count": len(cached),
+                                "seconds": time.perf_counter() - t0, "cached": True}
+            if on_loaded is not None:
+                on_loaded(subject, cached)
+        else:
+            bank[subject] = None
+            pending.append((subject, path))
+
+    if pending:
+        workers = max(1, min(int(max_workers or 1), len(pending)))
+        if workers == 1:
+            results = map(_timed_read, [p for _, p in pending])
+            executor = None
+        else:
+            Executor = ProcessPoolExecutor if pool == "process" else ThreadPoolExecutor
+            executor = Executor(max_workers=workers)
+            results = executor.map(_timed_read, [p for _, p in pending])
+        try:
+            for (subject, path), (questions, secs) in zip(pending, results):
+                bank[subject] = questions
+                timings[subject] = {"subject": subject, "file": os.path.basename(path), "count": len(questions),
+                                    "seconds": secs, "cached": False}
+                if cache is not None and questions:
+                    cache.put(path, questions)
+                if on_loaded is not None:
+                    on_loaded(subject, questions)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    ordered = {subject: bank[subject] for subject, _ in manifest}
+    timings = [timings[s] for s, _ in manifest if s in timings]
+    for t in timings:   # GOCBT_METRICS=1: one record per subject file
+        metrics.record("load", name="subject", subject=t["subject"], file=t["file"], count=t["count"],
+                       ms=round(t["seconds"] * 1000, 1), source="cache" if t["cached"] else "json")
+    return ordered, timings
+
+
+def print_load_timings(timings, top: int = 10) -> None:
+    """Print the slowest subject files first so heavy banks stand out."""
+    parsed = [t for t in timings if not t["cached"]]
+    if not parsed:
+        return
+    total = sum(t["seconds"] for t in parsed)
+    print(f"[INFO] Parsed {len(parsed)} subject file(s); summed worker time {total:.3f}s")
+    for t in sorted(parsed, key=lambda t: t["seconds"], reverse=True)[:top]:
+        print(f"[INFO]   {t['seconds'] * 1000:8.1f} ms  {t['count']:5d} q  {t['file']}")
+
+
+def load_question_bank(manifest=SUBJECT_FILES, use_cache: bool = USE_BANK_CACHE) -> dict[str, QuestionBank]:
+    """
+    Load every subject in `manifest` order (cache first, misses in parallel).
+    Returns: dict[str, QuestionBank]
+    """
+    cache = BankCache().load() if use_cache else None
+    bank, timings = load_subjects_parallel(manifest, cache)
+    print_load_timings(timings)
+    if cache is not None:
+        cache.save()
+    return bank
+
+
+class SubjectWatcher:
+    """
+    Polls a LazyQuestionBank's loaded subjects every `interval` seconds on a daemon
+    thread. A changed file is re-parsed right away (off the UI thread) but only
+    swapped in when the app calls apply_pending(), i.e. between exams, so a
+    running exam never sees its subject change underneath it.
+    """
+
+    def __init__(self, bank: "LazyQuestionBank", interval: float = RELOAD_INTERVAL):
+        self.bank = bank
+        self.interval = max(0.2, float(interval))
+        self._ready: dict[str, tuple] = {}   # subject -> (questions, stamp)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> "SubjectWatcher":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="gocbt-bank-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"[WARN] Subject watcher: {e}")
+
+    def poll(self) -> list[str]:
+        """Re-parse every changed subject now; returns the subjects that are ready to swap."""
+        with self._lock:
+            known = {s: stamp for s, (_, stamp) in self._ready.items()}
+        changed = self.bank.changed_subjects(known)
+        for subject in changed:
+            questions, stamp = self.bank.parse_subject(subject)
+            with self._lock:
+                self._ready[subject] = (questions, stamp)
+        if changed:
+            self.bank.flush_cache()
+        return changed
+
+    def pending(self) -> list[str]:
+        with self._lock:
+            return list(self._ready)
+
+    def apply_pending(self) -> list[str]:
+        """Swap every re-parsed subject into the bank; returns their names."""
+        with self._lock:
+            ready, self._ready = self._ready, {}
+        for subject, (questions, stamp) in ready.items():
+            self.bank.swap(subject, questions, stamp)
+            print(f"[INFO] Reloaded {subject}: {len(questions)} questions")
+        return list(ready)
+
+
+class LazyQuestionBank(Mapping):
+    """
+    Read-only mapping subject → question sequence that loads each subject on first access.
+
+    Subject names come straight from the manifest, so the subject list renders
+    without touching any JSON. A subject found in questions.gocbtpack whose
+    source file is unchanged is returned as a PackedSubject (records decoded
+    only when indexed); anything else is a QuestionBank from the cache or JSON.
+    prefetch() warms the remaining subjects on a daemon thread (e.g. while the
+    candidate types their name); iterating values()/items() still works and
+    simply loads whatever is missing.
+
+    Every load claims its subject in `_inflight` first, so a subject is parsed
+    once: a caller asking for one that the prefetch (or another thread) is
+    already loading waits for that load instead of starting its own. Parsing
+    runs outside `_lock`; the lock only guards the claim and the publish.
+    """
+
+    def __init__(self, manifest=SUBJECT_FILES, use_cache: bool = USE_BANK_CACHE,
+                 use_pack: bool = USE_QUESTION_PACK):
+        self._files = dict(manifest)
+        self._order = [subject for subject, _ in manifest]
+        self._loaded: dict[str, QuestionBank] = {}
+        self._stamps: dict[str, tuple | None] = {}   # subject -> (path, size, mtime_ns) when loaded
+        self._lock = threading.RLock()
+        self._inflight: dict[str, threading.Event] = {}   # subject -> set once it is published
+        self._use_cache = use_cache
+        self._use_pack = use_pack
+        self._cache = None
+        self._prefetch_thread = None
+
+    # ---- Mapping protocol ----
+    def __getitem__(self, subject):
+        got = self._loaded.get(subject)
+        if got is not None:
+            return got
+        if subject not in self._files:
+            raise KeyError(subject)
+        while True:
+            with self._lock:
+                got = self._loaded.get(subject)
+                if got is not None:
+                    return got
+                ev = self._inflight.get(subject)
+                mine = ev is None
+                if mine:
+                    ev = self._inflight[subject] = threading.Event()
+            if mine:
+                break
+            ev.wait()       # someone else is loading it; if that load failed, claim it next pass
+        t0 = time.perf_counter()
+        try:
+            stamp = self._stamp(subject)
+            got, source = self._from_pack(subject), "pack"
+            if got is None:
+                got, source = load_subject(self._files[subject], self._get_cache()), "json/cache"
+            got = self._publish(subject, got, stamp)
+        finally:
+            self._release(subject)
+        # on-demand load: this one runs on the caller's (usually the UI) thread
+        metrics.record("load", name="subject", subject=subject, count=len(got), source=source,
+                       on_demand=True, ms=round((time.perf_counter() - t0) * 1000, 1))
+        return got
+
+    def __contains__(self, subject):
+        return subject in self._files
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def __len__(self):
+        return len(self._order)
+
+    # ---- Lazy-loading helpers ----
+    def _from_pack(self, subject):
+        if not self._use_pack:
+            return None
+        pack = open_default_pack()
+        packed = pack.get(subject) if pack else None
+        if packed is None:
+            return None
+        if TRUST_COMPILED_PACK and pack.compiled:
+            return packed
+        try:
+            if not source_matches(packed, find_json_file(self._files[subject])):
+                return None
+        except OSError:
+            return None
+        return packed
+
+    def _stamp(self, subject):
+        """(path, size, mtime_ns) of the subject's JSON right now, or None if it isn't there."""
+        path = find_json_file(self._files[subject])
+        try:
+            return (path,) + _file_stat(path) if path else None
+        except OSError:
+            return None
+
+    def _get_cache(self):
+        if self._use_cache and self._cache is None:
+            with self._lock:
+                if self._cache is None:
+                    self._cache = BankCache().load()
+        return self._cache
+
+    def _claim(self, subject) -> bool:
+        """Mark `subject` as being loaded by the caller; False if it is loaded or already claimed."""
+        with self._lock:
+            if subject in self._loaded or subject in self._inflight:
+                return False
+            self._inflight[subject] = threading.Event()
+            return True
+
+    def _publish(self, subject, questions, stamp):
+        with self._lock:
+            got = self._loaded.setdefault(subject, questions)
+            self._stamps.setdefault(subject, stamp)
+        return got
+
+    def _release(self, subject) -> None:
+        with self._lock:
+            ev = self._inflight.pop(subject, None)
+        if ev is not None:
+            ev.set()
+
+    def is_loaded(self, subject) -> bool:
+        return subject in self._loaded
+
+    def wait_loaded(self, subject, timeout: float | None = None) -> bool:
+        """Wait for a load of `subject` already in progress (e.g. the prefetch); True if loaded."""
+        ev = self._inflight.get(subject)
+        if ev is not None:
+            ev.wait(timeout)
+        return subject in self._loaded
+
+    def flush_cache(self) -> None:
+        """Persist any subjects parsed since the cache was read."""
+        cache = self._cache     # BankCache has its own lock; saving never holds up the bank
+        if cache is not None:
+            cache.save()
+
+    def prefetch(self) -> None:
+        """
+        Warm every not-yet-loaded subject on a background daemon thread (idempotent).
+        The subjects are claimed before this returns, so a bank[subject] or
+        wait_loaded() issued afterwards waits for the prefetch instead of parsing.
+        """
+        if self._prefetch_thread is not None:
+            return
+        claimed = {s for s in self._order if self._claim(s)}
+
+        def _loaded(subject, questions, stamp):
+            self._publish(subject, questions, stamp)
+            claimed.discard(subject)
+            self._release(subject)
+
+        def _run():
+            t0 = time.perf_counter()
+            todo, stamps = [], {}
+            try:
+                for s in [s for s in self._order if s in claimed]:
+                    stamp = self._stamp(s)
+                    packed = self._from_pack(s)
+                    if packed is not None:
+                        _loaded(s, packed, stamp)
+                    else:
+                        stamps[s] = stamp
+                        todo.append((s, self._files[s]))
+                packed_ms = round((time.perf_counter() - t0) * 1000, 1)
+                if not todo:
+                    metrics.record("load", name="prefetch", packed_ms=packed_ms, parsed=0, ms=packed_ms)
+                    return
+
+                try:
+                    _, timings = load_subjects_parallel(
+                        todo, self._get_cache(), on_loaded=lambda s, q: _loaded(s, q, stamps[s]))
+                    print_load_timings(timings)
+                except Exception as e:
+                    print(f"[WARN] Prefetch failed: {e}")
+                    metrics.record("load", name="prefetch", ok=False, ms=round((time.perf_counter() - t0) * 1000, 1))
+                    return
+            finally:
+                for s in list(claimed):     # anything not published (pack error, failed pass) is free again
+                    self._release(s)
+            self.flush_cache()
+            metrics.record("load", name="prefetch", packed_ms=packed_ms, parsed=len(todo),
+                           ms=round((time.perf_counter() - t0) * 1000, 1))
+
+        self._prefetch_thread = threading.Thread(target=_run, name="gocbt-bank-prefetch", daemon=True)
+        self._prefetch_thread.start()
+
+    # ---- Hot reload ----
+    def changed_subjects(self, known=None) -> list[str]:
+        """
+        Loaded subjects whose JSON size/mtime (or presence) differs from when they were
+        loaded. `known` maps subject → stamp already being handled (skipped if unchanged).
+        """
+        known = known or {}
+        out = []
+        for subject, old in list(self._stamps.items()):
+            new = self._stamp(subject)
+            if new != old and new != known.get(subject, old):
+                out.append(subject)
+        return out
+
+    def parse_subject(self, subject):
+        """Re-read one subject from its JSON (never the pack). Returns (questions, stamp)."""
+        t0 = time.perf_counter()
+        stamp = self._stamp(subject)
+        questions = load_subject(self._files[subject], self._get_cache())
+        metrics.record("load", name="reload", subject=subject, count=len(questions),
+                       ms=round((time.perf_counter() - t0) * 1000, 1))
+        return questions, stamp
+
+    def swap(self, subject, questions, stamp) -> None:
+        """Atomically replace one subject's questions (readers see the old or the new bank)."""
+        with self._lock:
+            self._loaded[subject] = questions
+            self._stamps[subject] = stamp
@@ -0,0 +1,333 @@
+# question_dedupe.py — cross-bank duplicate / near-duplicate question index
+# - content_hash(): 8-byte BLAKE2b of a question's normalized text, option set and answer
+#   text (case, punctuation and option order don't matter) → exact duplicates
+# - DuplicateIndex: MinHash over word 3-gram shingles + LSH banding to find candidate
+#   near-duplicates, verified with exact Jaccard similarity, merged with union-find
+# - Rows are only merged when their correct-option text matches; similar rows keyed to
+#   different answers are reported as answer conflicts and never dropped
+# - One BLAKE2b call per distinct shingle yields all 32 MinHash lanes (64-byte digest
+#   read as 32 × u16) and signatures are taken column-wise with zip(), so ~20k questions
+#   index in a couple of seconds in pure Python
+# - CLI: python question_dedupe.py [--threshold 0.8] [--out clusters.json]
+
+import re, sys, json, struct, hashlib, argparse
+from collections import defaultdict
+
+NUM_PERM   = 32                 # MinHash lanes (one 64-byte digest per shingle)
+BANDS      = 8                  # LSH bands × rows = NUM_PERM
+BAND_ROWS  = NUM_PERM // BANDS
+SHINGLE_K  = 3                  # word n-gram size
+THRESHOLD  = 0.8                # Jaccard similarity that counts as a near-duplicate
+MAX_BUCKET = 200                # LSH buckets larger than this are boilerplate; not paired out
+
+_TOKEN_RE = re.compile(r"[0-9a-z]+")
+_LANES = struct.Struct(f"<{NUM_PERM}H")
+_LETTERS = ("A", "B", "C", "D")
+
+
+def _tokens(text) -> list[str]:
+    return _TOKEN_RE.findall(str(text or "").casefold())
+
+def _norm_text(text) -> str:
+    return " ".join(_tokens(text))
+
+def answer_text(row) -> str:
+    """Normalized text of the option keyed as correct."""
+    opts = row.get("options") or {}
+    letter = (row.get("correct") or "A")[:1].upper()
+    return _norm_text(opts.get(letter, ""))
+
+def content_hash(row) -> bytes:
+    """Exact-duplicate key: same stem, same set of options and same correct option text."""
+    opts = row.get("options") or {}
+    options = sorted(_norm_text(opts.get(k, "")) for k in _LETTERS)
+    parts = [_norm_text(row.get("question", "")), answer_text(row)] + options
+    return hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=8).digest()
+
+def shingles(row) -> frozenset:
+    """Word 3-grams of the stem followed by the (sorted) options."""
+    opts = row.get("options") or {}
+    toks = _tokens(row.get("question", ""))
+    for text in sorted(_norm_text(opts.get(k, "")) for k in _LETTERS):
+        toks.extend(text.split())
+    if len(toks) < SHINGLE_K:
+        return frozenset((" ".join(toks),)) if toks else frozenset()
+    return frozenset(" ".join(toks[i:i + SHINGLE_K]) for i in range(len(toks) - SHINGLE_K + 1))
+
+
+class _UnionFind:
+    def __init__(self, n):
+        self.parent = list(range(n))
+
+    def find(self, x):
+        p = self.parent
+        while p[x] != x:
+            p[x] = p[p[x]]
+            x = p[x]
+        return x
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            # lower id (earlier in manifest order) stays the root = the copy that is kept
+            if rb < ra:
+                ra, rb = rb, ra
+            self.parent[rb] = ra
+
+
+class DuplicateIndex:
+    """
+    Add questions with add()/add_bank(), then call build().
+    Afterwards clusters() lists every group of 2+ questions that are exact or near
+    duplicates with the same correct answer; members are (subject, index) in insertion
+    order (first = keeper). conflicts() lists near duplicates keyed to different answers.
+    """
+
+    def __init__(self, threshold: float = THRESHOLD):
+        self.threshold = threshold
+        self._refs: list[tuple[str, int]] = []
+        self._hashes: list[bytes] = []
+        self._shingles: list[frozenset] = []
+        self._texts: list[str] = []
+        self._answers: list[str] = []
+        self._lane_cache: dict[str, tuple] = {}
+        self._sigs: list[tuple] = []
+        self._uf = None
+        self._kind: dict[int, str] = {}
+        self._sim: dict[int, float] = {}
+        self._conflict_pairs: dict[tuple[int, int], float] = {}
+        self.stats = {}
+
+    # ---- building ----
+    def add(self, subject: str, index: int, row) -> None:
+        self._refs.append((subject, index))
+        self._hashes.append(content_hash(row))
+        sh = shingles(row)
+        self._shingles.append(sh)
+        self._texts.append(str(row.get("question", "")))
+        self._answers.append(answer_text(row))
+        self._sigs.append(self._signature(sh))
+
+    def add_bank(self, subject: str, questions) -> None:
+        for i in range(len(questions)):
+            self.add(subject, i, questions[i])
+
+    def _signature(self, sh: frozenset) -> tuple:
+        if not sh:
+            return ()
+        cache = self._lane_cache
+        lanes = []
+        for g in sh:
+            v = cache.get(g)
+            if v is None:
+                v = _LANES.unpack(hashlib.blake2b(g.encode("utf-8"), digest_size=64).digest())
+                cache[g] = v
+            lanes.append(v)
+        return tuple(map(min, zip(*lanes)))
+
+    def build(self) -> "DuplicateIndex":
+        n = len(self._refs)
+        uf = self._uf = _UnionFind(n)
+
+        # 1) exact duplicates
+        first_by_hash = {}
+        exact = 0
+        for i, h in enumerate(self._hashes):
+            j = first_by_hash.setdefault(h, i)
+            if j != i:
+                uf.union(j, i)
+                exact += 1
+
+        # 2) LSH candidates → verified near duplicates
+        buckets = defaultdict(list)
+        for i, sig in enumerate(self._sigs):
+            if not sig or first_by_hash[self._hashes[i]] != i:
+                continue   # empty, or already an exact copy of an earlier row
+            for b in range(BANDS):
+                buckets[(b, sig[b * BAND_ROWS:(b + 1) * BAND_ROWS])].append(i)
+
+        pairs, oversized = set(), 0
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            if len(members) > MAX_BUCKET:
+                oversized += 1
+                continue
+            for x in range(len(members)):
+                a = members[x]
+                for b in members[x + 1:]:
+                    pairs.add((a, b))
+
+        near = 0
+        sh, answers = self._shingles, self._answers
+        conflicts = self._conflict_pairs
+        conflicts.clear()
+        for a, b in pairs:
+            if uf.find(a) == uf.find(b):
+                continue
+            sa, sb = sh[a], sh[b]
+            sim = len(sa & sb) / len(sa | sb)
+            if sim >= self.threshold:
+                if answers[a] != answers[b]:
+                    # same question, different key: one of them is wrong, keep both
+                    conflicts[(a, b)] = sim
+                    continue
+                uf.union(a, b)
+                near += 1
+                root = uf.find(a)
+                self._sim[root] = min(sim, self._sim.get(root, 1.0))
+
+        self.stats = {"questions": n, "exact_pairs": exact, "candidate_pairs": len(pairs),
+                      "near_pairs": near, "conflict_pairs": len(conflicts), "oversized_buckets": oversized}
+        return self
+
+    # ---- results ----
+    def clusters(self) -> list[dict]:
+        """[{"members": [(subject, index), ...], "kind": "exact"|"near", "similarity": float}]"""
+        if self._uf is None:
+            self.build()
+        groups = defaultdict(list)
+        for i in range(len(self._refs)):
+            groups[self._uf.find(i)].append(i)
+        out = []
+        for root, ids in groups.items():
+            if len(ids) < 2:
+                continue
+            kinds = {self._hashes[i] for i in ids}
+            out.append({
+                "ids": ids,
+                "members": [self._refs[i] for i in ids],
+                "kind": "exact" if len(kinds) == 1 else "near",
+                "similarity": 1.0 if len(kinds) == 1 else round(self._sim.get(root, self.threshold), 3),
+            })
+        out.sort(key=lambda c: c["ids"][0])
+        return out
+
+    def conflicts(self) -> list[dict]:
+        """
+        Near duplicates whose correct answers differ, grouped with their clusters:
+        [{"ids": [...], "members": [(subject, index), ...], "similarity": float}]
+        """
+        if self._uf is None:
+            self.build()
+        uf = self._uf
+        groups = _UnionFind(len(self._refs))    # unions whole clusters (by their roots)
+        for a, b in self._conflict_pairs:
+            groups.union(uf.find(a), uf.find(b))
+        sims = defaultdict(float)
+        for (a, b), sim in self._conflict_pairs.items():
+            g = groups.find(uf.find(a))
+            sims[g] = max(sims[g], sim)
+        members = defaultdict(list)
+        for i in range(len(self._refs)):
+            g = groups.find(uf.find(i))
+            if g in sims:
+                members[g].append(i)
+        out = [{"ids": ids, "members": [self._refs[i] for i in ids], "similarity": round(sims[g], 3)}
+               for g, ids in members.items()]
+        out.sort(key=lambda c: c["ids"][0])
+        return out
+
+    def redundant(self) -> set[tuple[str, int]]:
+        """
+        Every cluster member except its first (manifest-order) copy. Clusters that are
+        part of an answer conflict are left whole for the content author to resolve.
+        """
+        disputed = {i for c in self.conflicts() for i in c["ids"]}
+        drop = set()
+        for c in self.clusters():
+            if disputed.isdisjoint(c["ids"]):
+                drop.update(c["members"][1:])
+        return drop
+
+    def report(self) -> dict:
+        """JSON-ready cluster report for content authors."""
+        clusters = []
+        for c in self.clusters():
+            clusters.append({
+                "kind": c["kind"],
+                "similarity": c["similarity"],
+                "members": [{"subject": self._refs[i][0], "index": self._refs[i][1],
+                             "hash": self._hashes[i].hex(), "question": self._texts[i][:120]}
+                            for i in c["ids"]],
+            })
+        conflicts = []
+        for c in self.conflicts():
+            conflicts.append({
+                "similarity": c["similarity"],
+                "members": [{"subject": self._refs[i][0], "index": self._refs[i][1],
+                             "hash": self._hashes[i].hex(), "question": self._texts[i][:120],
+                             "answer": self._answers[i][:120]}
+                            for i in c["ids"]],
+            })
+        return {"threshold": self.threshold, "stats": dict(self.stats), "clusters": clusters,
+                "conflicts": conflicts}
+
+
+def build_index(banks, threshold: float = THRESHOLD) -> DuplicateIndex:
+    """banks: Mapping subject → question sequence (a dict, LazyQuestionBank, …)."""
+    idx = DuplicateIndex(threshold)
+    for subject, questions in banks.items():
+        idx.add_bank(subject, questions)
+    return idx.build()
+
+
+# ------------------------------
+# Runtime lookup (from the compiled audit report)
+# ------------------------------
+_CLUSTER_MAP = None
+
+def cluster_map() -> dict[str, int]:
+    """
+    content-hash hex → cluster number, read once from the duplicate clusters that
+    compile_assets.py stored in question_audit.json ({} if the report is absent).
+    """
+    global _CLUSTER_MAP
+    if _CLUSTER_MAP is None:
+        mapping = {}
+        try:
+            from compile_assets import load_audit
+            audit = load_audit() or {}
+            for n, c in enumerate((audit.get("duplicates") or {}).get("clusters", [])):
+                for m in c.get("members", []):
+                    mapping[m["hash"]] = n
+        except Exception as e:
+            print(f"[WARN] Duplicate clusters unavailable: {e}")
+        _CLUSTER_MAP = mapping
+    return _CLUSTER_MAP
+
+def duplicate_key(row):
+    """Key under which two rows count as the same question (cluster if known, else content hash)."""
+    h = content_hash(row).hex()
+    c = cluster_map().get(h)
+    return ("c", c) if c is not None else ("h", h)
+
+
+if __name__ == "__main__":
+    import time
+    from question_bank import load_question_bank
+
+    ap = argparse.ArgumentParser(description="Find duplicate / near-duplicate questions across all subject banks.")
+    ap.add_argument("--threshold", type=float, default=THRESHOLD, help=f"Jaccard similarity (default {THRESHOLD})")
+    ap.add_argument("--out", help="write the cluster report as JSON")
+    args = ap.parse_args()
+
+    bank = load_question_bank()
+    t0 = time.perf_counter()
+    idx = build_index(bank, args.threshold)
+    rep = idx.report()
+    secs = time.perf_counter() - t0
+    s = rep["stats"]
+    print(f"[INFO] Indexed {s['questions']} questions in {secs:.2f}s: {s['exact_pairs']} exact + "
+          f"{s['near_pairs']} near duplicate(s) in {len(rep['clusters'])} cluster(s)")
+    if rep["conflicts"]:
+        print(f"[WARN] {len(rep['conflicts'])} group(s) of near duplicates keyed to different answers")
+    for c in rep["clusters"][:20]:
+        subjects = sorted({m["subject"] for m in c["members"]})
+        print(f"[INFO]   {c['kind']:5s} {c['similarity']:.2f} ×{len(c['members'])}  "
+              f"{c['members'][0]['question'][:60]!r}  ({', '.join(subjects)})")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(rep, f, ensure_ascii=False, indent=2)
+        print(f"[INFO] Cluster report → {args.out}")
+    sys.exit(0)
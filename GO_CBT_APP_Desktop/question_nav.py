@@ -0,0 +1,163 @@
+# question_nav.py — question-number navigator for the exam screen
+# - Cells 1..N in rows of `cols`; each is "current", "answered" or "open"
+# - The painted color of every cell is cached and only cells whose state changed are
+#   repainted, so Next / Previous / a jump touches at most the old and new current cell
+#   (plus the one just answered) instead of reconfiguring all N
+# - Two renderers behind one interface: pooled tk.Buttons (reused across exams) or a
+#   single Canvas of rectangles + text items for large blueprints; the canvas is used
+#   above CANVAS_THRESHOLD questions, GOCBT_NAV_CANVAS=1 / =0 forces either one
+
+import os
+import tkinter as tk
+
+NAV_COLORS = {"current": "#0000ff", "answered": "#008000", "open": "#ff0000"}
+NAV_FG     = "white"
+
+CANVAS_THRESHOLD = 150
+_FORCE = os.environ.get("GOCBT_NAV_CANVAS", "").strip()
+CELL_W, CELL_H, CELL_GAP = 38, 30, 4     # canvas cell size in pixels
+
+
+class _ButtonCells:
+    """One tk.Button per cell, created on demand and hidden (not destroyed) when unused."""
+
+    def __init__(self, parent, on_select, cols, font):
+        self.frame = tk.Frame(parent)
+        self._on_select = on_select
+        self._cols = cols
+        self._font = font
+        self._pool = []
+        self._shown = 0
+        self.painted = []     # color last painted per cell
+        for c in range(cols):
+            self.frame.grid_columnconfigure(c, weight=1)
+
+    def resize(self, count):
+        pool, cols = self._pool, self._cols
+        for i in range(len(pool), count):
+            pool.append(tk.Button(self.frame, text=str(i + 1), width=3, font=self._font, fg=NAV_FG,
+                                  command=lambda i=i: self._on_select(i)))
+        for i in range(self._shown, count):
+            pool[i].grid(row=i // cols, column=i % cols, padx=2, pady=2)
+        for i in range(count, self._shown):
+            pool[i].grid_remove()
+        self._shown = count
+
+    def paint(self, i, color):
+        self._pool[i].config(bg=color)
+
+
+class _CanvasCells:
+    """All cells as rectangle + text items on one Canvas; a click is mapped back to its cell."""
+
+    def __init__(self, parent, on_select, cols, font):
+        self.frame = tk.Canvas(parent, highlightthickness=0, cursor="hand2",
+                               width=cols * (CELL_W + CELL_GAP) + CELL_GAP)
+        self._on_select = on_select
+        self._cols = cols
+        self._font = font
+        self._items = []      # (rect id, text id) per cell
+        self._shown = 0
+        self.painted = []     # color last painted per cell
+        self.frame.bind("<Button-1>", self._click)
+
+    def _origin(self, i):
+        return (CELL_GAP + (i % self._cols) * (CELL_W + CELL_GAP),
+                CELL_GAP + (i // self._cols) * (CELL_H + CELL_GAP))
+
+    def resize(self, count):
+        cv = self.frame
+        for i in range(len(self._items), count):
+            x, y = self._origin(i)
+            rect = cv.create_rectangle(x, y, x + CELL_W, y + CELL_H, outline="#333333", width=1)
+            text = cv.create_text(x + CELL_W / 2, y + CELL_H / 2, text=str(i + 1), fill=NAV_FG, font=self._font)
+            self._items.append((rect, text))
+        for i in range(self._shown, count):
+            for item in self._items[i]:
+                cv.itemconfigure(item, state="normal")
+        for i in range(count, self._shown):
+            for item in self._items[i]:
+                cv.itemconfigure(item, state="hidden")
+        self._shown = count
+        rows = (count + self._cols - 1) // self._cols
+        cv.configure(height=max(1, rows) * (CELL_H + CELL_GAP) + CELL_GAP)
+
+    def paint(self, i, color):
+        self.frame.itemconfigure(self._items[i][0], fill=color)
+
+    def _click(self, evt):
+        col = (evt.x - CELL_GAP) // (CELL_W + CELL_GAP)
+        row = (evt.y - CELL_GAP) // (CELL_H + CELL_GAP)
+        if not 0 <= col < self._cols or row < 0:
+            return
+        i = row * self._cols + col
+        if i < self._shown:
+            self._on_select(i)
+
+
+class QuestionNavigator:
+    """
+    The 1..N grid under the exam question. reset() binds it to an exam,
+    set_current() / set_answered() repaint only what changed.
+    """
+
+    def __init__(self, parent, on_select, cols=25, font=None):
+        self.frame = tk.Frame(parent)
+        self._on_select = on_select
+        self._cols = cols
+        self._font = font
+        self._cells = {}           # "buttons" / "canvas" → renderer, built on first use
+        self._active = None
+        self._painted = []         # the active renderer's painted colors
+        self._answered = bytearray()
+        self._current = -1
+
+    def pack(self, **kw):
+        self.frame.pack(**kw)
+
+    def _renderer(self, count):
+        kind = "canvas" if (_FORCE == "1" or (_FORCE != "0" and count > CANVAS_THRESHOLD)) else "buttons"
+        cells = self._cells.get(kind)
+        if cells is None:
+            cls = _CanvasCells if kind == "canvas" else _ButtonCells
+            cells = self._cells[kind] = cls(self.frame, self._on_select, self._cols, self._font)
+        return cells
+
+    def reset(self, count, answered=()):
+        """Bind to an exam of `count` questions; `answered` flags which already have an answer."""
+        cells = self._renderer(count)
+        if cells is not self._active:
+            if self._active is not None:
+                self._active.frame.pack_forget()
+            cells.frame.pack()
+            self._active = cells
+        cells.resize(count)
+        painted = cells.painted
+        del painted[count:]
+        painted.extend([None] * (count - len(painted)))
+        self._painted = painted
+        self._answered = bytearray(1 if a else 0 for a in answered)
+        self._answered.extend(bytes(count - len(self._answered)))
+        self._current = -1
+        for i in range(count):
+            self._repaint(i)
+
+    def _repaint(self, i):
+        if not 0 <= i < len(self._painted):
+            return
+        state = "current" if i == self._current else ("answered" if self._answered[i] else "open")
+        color = NAV_COLORS[state]
+        if self._painted[i] != color:
+            self._active.paint(i, color)
+            self._painted[i] = color
+
+    def set_current(self, index):
+        old, self._current = self._current, index
+        if old != index:
+            self._repaint(old)
+        self._repaint(index)
+
+    def set_answered(self, index, answered=True):
+        if 0 <= index < len(self._answered) and self._answered[index] != bool(answered):
+            self._answered[index] = 1 if answered else 0
+            self._repaint(index)
@@ -0,0 +1,244 @@
+# question_pack.py — single memory-mapped question pack (questions.gocbtpack)
+# - Build step: python question_pack.py [--out assets/questions.gocbtpack]
+# - Runtime: QuestionPack mmaps the file; PackedSubject decodes a question only when indexed,
+#   so opening a subject and drawing 100 questions is O(100), not O(bank size)
+#
+# Layout (little-endian):
+#   header   "GOCBTPK1", u16 version, u16 flags (bit 0: written by compile_assets.py), u32 subject_count, u64 toc_off, u64 offsets_off, u64 data_off
+#   toc      per subject: str name, str source_file, u64 src_size, u64 src_mtime_ns, 20B src_sha1,
+#            u32 first_question, u32 count           (str = u16 length + UTF-8 bytes)
+#   offsets  u64 absolute record offset per question, plus one end sentinel
+#   records  u8 answer letter, then question/A/B/C/D as u32 length + UTF-8 bytes
+
+import os, mmap, struct, hashlib, argparse
+from collections.abc import Sequence
+
+from path_utils import assets_dir_candidates, find_asset
+
+PACK_FILENAME = "questions.gocbtpack"
+PACK_MAGIC    = b"GOCBTPK1"
+PACK_VERSION  = 1
+PACK_FLAG_COMPILED = 0x0001   # built + audited offline; a frozen build trusts it without source checks
+
+_HEADER = struct.Struct("<8sHHIQQQ")
+_TOC_TAIL = struct.Struct("<QQ20sII")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+
+class PackError(Exception):
+    pass
+
+
+# ------------------------------
+# Writer
+# ------------------------------
+def _pack_str16(s: str) -> bytes:
+    b = s.encode("utf-8")
+    return _U16.pack(len(b)) + b
+
+def _encode_record(q) -> bytes:
+    opts = q.get("options") or {}
+    parts = [bytes((ord((q.get("correct") or "A")[:1]),))]
+    for text in (q.get("question", ""), opts.get("A", ""), opts.get("B", ""), opts.get("C", ""), opts.get("D", "")):
+        b = str(text).encode("utf-8")
+        parts.append(_U32.pack(len(b)))
+        parts.append(b)
+    return b"".join(parts)
+
+def _source_fingerprint(path: str | None) -> tuple[str, int, int, bytes]:
+    if not path or not os.path.exists(path):
+        return "", 0, 0, b"\0" * 20
+    st = os.stat(path)
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return os.path.basename(path), st.st_size, st.st_mtime_ns, h.digest()
+
+def write_pack(out_path: str, subjects, flags: int = 0) -> dict:
+    """
+    subjects: iterable of (subject_name, source_path_or_None, questions)
+    where questions is a QuestionBank or any sequence of normalized dicts.
+    flags: PACK_FLAG_* bits stored in the header.
+    Writes atomically (tmp + os.replace). Returns {"subjects", "questions", "bytes"}.
+    """
+    toc_parts, records, first = [], [], 0
+    for name, src_path, questions in subjects:
+        src_name, size, mtime_ns, sha1 = _source_fingerprint(src_path)
+        count = len(questions)
+        toc_parts.append(_pack_str16(name) + _pack_str16(src_name) + _TOC_TAIL.pack(size, mtime_ns, sha1, first, count))
+        records.extend(_encode_record(q) for q in questions)
+        first += count
+
+    toc = b"".join(toc_parts)
+    toc_off = _HEADER.size
+    offsets_off = toc_off + len(toc)
+    data_off = offsets_off + _U64.size * (len(records) + 1)
+
+    offsets, pos = [], data_off
+    for rec in records:
+        offsets.append(pos)
+        pos += len(rec)
+    offsets.append(pos)
+
+    tmp = out_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, flags, len(toc_parts), toc_off, offsets_off, data_off))
+        f.write(toc)
+        f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        for rec in records:
+            f.write(rec)
+    os.replace(tmp, out_path)
+    return {"subjects": len(toc_parts), "questions": len(records), "bytes": pos}
+
+
+# ------------------------------
+# Reader
+# ------------------------------
+class PackedSubject(Sequence):
+    """One subject inside a pack; indexing decodes that single record into the normalized dict."""
+
+    __slots__ = ("_pack", "name", "source", "first", "count")
+
+    def __init__(self, pack, name, source, first, count):
+        self._pack = pack
+        self.name = name
+        self.source = source   # (file, size, mtime_ns, sha1)
+        self.first = first
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.count))]
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("question index out of range")
+        return self._pack.decode(self.first + i)
+
+    def __repr__(self):
+        return f"<PackedSubject {self.name!r} {self.count} questions>"
+
+
+class QuestionPack:
+    """Read-only, memory-mapped view of questions.gocbtpack."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fh = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._fh.close()
+            raise
+        try:
+            self._read_index()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_index(self):
+        mm = self._mm
+        if len(mm) < _HEADER.size:
+            raise PackError("pack too small")
+        magic, version, flags, n, toc_off, offsets_off, data_off = _HEADER.unpack_from(mm, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise PackError(f"unsupported pack {magic!r} v{version}")
+        self.flags = flags
+        self._offsets_off = offsets_off
+        self.subjects: dict[str, PackedSubject] = {}
+        pos = toc_off
+        for _ in range(n):
+            (ln,) = _U16.unpack_from(mm, pos); pos += 2
+            name = mm[pos:pos + ln].decode("utf-8"); pos += ln
+            (ln,) = _U16.unpack_from(mm, pos); pos += 2
+            src = mm[pos:pos + ln].decode("utf-8"); pos += ln
+            size, mtime_ns, sha1, first, count = _TOC_TAIL.unpack_from(mm, pos); pos += _TOC_TAIL.size
+            self.subjects[name] = PackedSubject(self, name, (src, size, mtime_ns, sha1), first, count)
+
+    def decode(self, qi: int) -> dict:
+        mm = self._mm
+        start, end = struct.unpack_from("<QQ", mm, self._offsets_off + qi * 8)
+        letter = chr(mm[start])
+        pos, texts = start + 1, []
+        for _ in range(5):
+            (ln,) = _U32.unpack_from(mm, pos); pos += 4
+            texts.append(mm[pos:pos + ln].decode("utf-8")); pos += ln
+        if pos != end:
+            raise PackError(f"corrupt record {qi}")
+        return {
+            "question": texts[0],
+            "options": {"A": texts[1], "B": texts[2], "C": texts[3], "D": texts[4]},
+            "correct": letter,
+        }
+
+    @property
+    def compiled(self) -> bool:
+        return bool(self.flags & PACK_FLAG_COMPILED)
+
+    def get(self, subject) -> PackedSubject | None:
+        return self.subjects.get(subject)
+
+    def close(self):
+        for obj in (getattr(self, "_mm", None), getattr(self, "_fh", None)):
+            try:
+                if obj is not None:
+                    obj.close()
+            except Exception:
+                pass
+
+
+def source_matches(packed: PackedSubject, src_path: str | None) -> bool:
+    """
+    True if `packed` was built from the file currently at src_path.
+    Same (size, mtime) is trusted; same size with a new mtime is confirmed by SHA-1.
+    A subject whose source JSON is not shipped at all is served from the pack.
+    """
+    src, size, mtime_ns, sha1 = packed.source
+    if not src_path or not os.path.exists(src_path):
+        return True
+    st = os.stat(src_path)
+    if st.st_size != size:
+        return False
+    if st.st_mtime_ns == mtime_ns:
+        return True
+    return _source_fingerprint(src_path)[3] == sha1
+
+
+_OPEN_PACK = None
+
+def open_default_pack() -> QuestionPack | None:
+    """Open (once per process) the first questions.gocbtpack found in the assets dirs."""
+    global _OPEN_PACK
+    if _OPEN_PACK is None:
+        path = find_asset(PACK_FILENAME)
+        if not path:
+            _OPEN_PACK = False
+        else:
+            try:
+                _OPEN_PACK = QuestionPack(path)
+            except Exception as e:
+                print(f"[WARN] Ignoring question pack {path}: {e}")
+                _OPEN_PACK = False
+    return _OPEN_PACK or None
+
+
+def build_default_pack(out_path: str | None = None) -> dict:
+    """Parse every manifest subject (through the normal loader) and write the pack."""
+    from question_bank import SUBJECT_FILES, find_json_file, load_question_bank
+    bank = load_question_bank()
+    out_path = out_path or os.path.join(assets_dir_candidates()[0], PACK_FILENAME)
+    return write_pack(out_path, ((s, find_json_file(f), bank[s]) for s, f in SUBJECT_FILES))
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Build questions.gocbtpack from the subject JSON files.")
+    ap.add_argument("--out", help=f"output path (default: assets/{PACK_FILENAME})")
+    args = ap.parse_args()
+    info = build_default_pack(args.out)
+    print(f"[INFO] Wrote {info['questions']} questions / {info['subjects']} subjects ({info['bytes']:,} bytes)")
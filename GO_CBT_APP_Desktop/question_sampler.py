@@ -0,0 +1,307 @@
+# question_sampler.py — no-repeat question rotation by index permutation
+# - One compact int32 array per subject (4 bytes/question), shuffled lazily on first use
+#   from a per-subject seed, so the same seed always rebuilds the same order
+# - next_window() hands out the next k positions as an IndexWindow view (no list copy,
+#   no question rows touched); windows walk the permutation and wrap around it, so every
+#   question of a subject is served once before any question repeats
+# - A bitset of served questions per subject (also fed by the simulation exam) is skipped
+#   over, and can be persisted per candidate through rotation_state.RotationState
+# - stratified_sample(): mixed exams drawn per subject (largest-remainder allocation of
+#   configurable weights, random.sample over each subject's unserved indices first) —
+#   never builds or shuffles the combined bank, and the whole draw is reproducible from one seed
+
+import json, random
+from array import array
+from collections.abc import Sequence
+
+WINDOW_SIZE = 100
+
+
+class IndexWindow(Sequence):
+    """k consecutive positions of a permutation, wrapping at its end (read-only view)."""
+
+    __slots__ = ("_perm", "_start", "_len")
+
+    def __init__(self, perm, start: int, length: int):
+        self._perm = perm
+        self._start = start
+        self._len = min(length, len(perm))
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._len))]
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("window index out of range")
+        perm = self._perm
+        return perm[(self._start + i) % len(perm)]
+
+    def __repr__(self):
+        return f"<IndexWindow start={self._start} len={self._len} of {len(self._perm)}>"
+
+
+class _Rotation:
+    __slots__ = ("seed", "size", "cursor", "bits", "_perm")
+
+    def __init__(self, seed: int, size: int, cursor: int = 0, bits: bytearray | None = None):
+        self.seed = seed
+        self.size = size
+        self.cursor = cursor
+        self.bits = bits if bits is not None else bytearray((size + 7) // 8)
+        self._perm = None
+
+    def served(self, i: int) -> bool:
+        return bool(self.bits[i >> 3] & (1 << (i & 7)))
+
+    def mark(self, i: int) -> None:
+        self.bits[i >> 3] |= 1 << (i & 7)
+
+    def unserved(self) -> int:
+        return self.size - int.from_bytes(self.bits, "little").bit_count()
+
+    def new_cycle(self) -> None:
+        self.bits[:] = bytes(len(self.bits))
+
+    @property
+    def perm(self) -> array:
+        if self._perm is None:
+            perm = array("i", range(self.size))
+            random.Random(self.seed).shuffle(perm)
+            self._perm = perm
+        return self._perm
+
+
+class PermutationSampler:
+    """
+    Per-subject rotation through a seeded permutation of question indices.
+
+    size_of(subject) -> int gives the subject's current question count; a subject
+    whose count changed (e.g. hot reload) starts a fresh rotation automatically.
+    With a `state` (rotation_state.RotationState) rotations are restored from and
+    written back to it; call flush() to persist.
+    """
+
+    def __init__(self, size_of, rng=None, state=None):
+        self._size_of = size_of
+        self._rng = rng or random.Random()
+        self._rot: dict[str, _Rotation] = {}
+        self.state = state
+
+    def use_state(self, state) -> None:
+        """Switch to another candidate's persisted rotations."""
+        self.state = state
+        self._rot.clear()
+
+    def _rotation(self, subject) -> _Rotation:
+        size = self._size_of(subject)
+        rot = self._rot.get(subject)
+        if rot is None and self.state is not None:
+            rec = self.state.get(subject)
+            if rec is not None and rec[1] == size:
+                seed, _, cursor, bits = rec
+                rot = _Rotation(seed, size, cursor % size if size else 0, bits)
+                self._rot[subject] = rot
+        if rot is None or rot.size != size:
+            rot = _Rotation(self._rng.getrandbits(64), size)
+            self._rot[subject] = rot
+            self._remember(subject, rot)
+        return rot
+
+    def _remember(self, subject, rot: _Rotation) -> None:
+        if self.state is not None:
+            self.state.put(subject, rot.seed, rot.size, rot.cursor, rot.bits)
+
+    def flush(self) -> bool:
+        return self.state.save() if self.state is not None else False
+
+    def permutation(self, subject) -> array:
+        """The subject's full int32 permutation (built on first call)."""
+        return self._rotation(subject).perm
+
+    def next_window(self, subject, k: int = WINDOW_SIZE):
+        """
+        Next k not-yet-served question indices for `subject`, in permutation order.
+        When the subject runs out of unserved questions a new cycle starts (same
+        permutation). Returns an IndexWindow view when nothing had to be skipped,
+        otherwise a compact array('i'); empty if the subject has no questions.
+        """
+        rot = self._rotation(subject)
+        n = rot.size
+        if n == 0:
+            return IndexWindow(array("i"), 0, 0)
+        k = min(k, n)
+        perm, start = rot.perm, rot.cursor
+        picks, chosen = array("i"), set()
+        left = rot.unserved()
+        pos, contiguous = start, True
+        while len(picks) < k:
+            if left == 0:
+                rot.new_cycle()
+                left = n
+                contiguous = False
+            i = perm[pos]
+            pos = (pos + 1) % n
+            if i in chosen or rot.served(i):
+                contiguous = False
+                continue
+            rot.mark(i)
+            chosen.add(i)
+            picks.append(i)
+            left -= 1
+        if left == 0:
+            rot.new_cycle()
+        rot.cursor = pos
+        self._remember(subject, rot)
+        return IndexWindow(perm, start, k) if contiguous else picks
+
+    def mark_served(self, subject, indices) -> None:
+        """Record questions served elsewhere (e.g. the simulation exam)."""
+        rot = self._rotation(subject)
+        for i in indices:
+            if 0 <= i < rot.size:
+                rot.mark(i)
+        if rot.size and rot.unserved() == 0:
+            rot.new_cycle()
+        self._remember(subject, rot)
+
+    def is_served(self, subject, i: int) -> bool:
+        rot = self._rotation(subject)
+        return 0 <= i < rot.size and rot.served(i)
+
+    def reset(self, subject) -> None:
+        """Forget a subject's rotation; its next window starts a new permutation."""
+        self._rot.pop(subject, None)
+        if self.state is not None:
+            self.state.forget(subject)
+
+
+# ------------------------------
+# Stratified mixed-exam sampling
+# ------------------------------
+def allocate(sizes: dict, k: int, weights: dict | None = None) -> dict:
+    """
+    Split k questions across subjects in proportion to `weights` (default: subject
+    size) using largest remainders; no subject gets more than it holds, and any
+    shortfall is handed to the subjects that still have room.
+    """
+    alloc = {s: 0 for s in sizes}
+    remaining = min(k, sum(sizes.values()))
+    open_ = {s for s, n in sizes.items() if n > 0 and (weights is None or weights.get(s, 0) > 0)}
+    while remaining > 0 and open_:
+        w = {s: float(sizes[s] if weights is None else weights[s]) for s in open_}
+        total = sum(w.values())
+        quotas = {s: remaining * w[s] / total for s in open_}
+        share = {s: int(q) for s, q in quotas.items()}
+        left = remaining - sum(share.values())
+        for s in sorted(open_, key=lambda s: (share[s] - quotas[s], s))[:left]:
+            share[s] += 1
+        for s in list(open_):
+            take = min(share[s], sizes[s] - alloc[s])
+            alloc[s] += take
+            remaining -= take
+            if alloc[s] >= sizes[s]:
+                open_.discard(s)
+    return alloc
+
+
+def stratified_sample(bank, subjects, k: int = WINDOW_SIZE, weights: dict | None = None,
+                      seed: int | None = None, key=None, served=None, on_pick=None, seen=None,
+                      refs: list | None = None):
+    """
+    Draw k questions from `subjects` of `bank` (Mapping subject → question sequence).
+
+    Each subject's share comes from allocate(); its questions are picked with
+    rng.sample(range(n), …), so only the chosen rows are ever touched. `key(row)`
+    (e.g. question_dedupe.duplicate_key) rejects a row equal to one already drawn
+    (pass a shared `seen` set to extend that across several calls);
+    shortfalls are refilled from the other subjects. `served(subject, i)` marks
+    questions the candidate has already seen (e.g. PermutationSampler.is_served, the
+    rotation's bitset): each share is drawn from the subject's unserved questions and
+    only tops up with served ones once those run out. on_pick(subject, i) is called for every chosen row,
+    and `refs`, if given, receives (subject, index) aligned with the returned rows.
+    The final order is shuffled.
+    Returns (rows, seed) — the same seed, bank and served state give the same exam.
+    """
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(48)
+    rng = random.Random(seed)
+    sizes = {s: len(bank[s]) for s in subjects}
+    alloc = allocate(sizes, k, weights)
+
+    picked, origin, spare = [], [], []
+    seen = set() if seen is None else seen
+    for s in subjects:
+        want = alloc.get(s, 0)
+        if not want:
+            continue
+        qlist = bank[s]
+        # a few extra candidates so a rejected duplicate can be replaced from the same subject
+        extra = (want // 4 + 4) if key is not None else 0
+        need = min(sizes[s], want + extra)
+        if served is None:
+            order = rng.sample(range(sizes[s]), need)
+        else:
+            # every unserved question is a candidate, not just a random handful
+            fresh, stale = [], []
+            for i in range(sizes[s]):
+                (stale if served(s, i) else fresh).append(i)
+            order = rng.sample(fresh, min(len(fresh), need))
+            if len(order) < need:
+                order += rng.sample(stale, need - len(order))
+        got = 0
+        for pos, i in enumerate(order):
+            if got == want:
+                spare.append((s, order[pos:]))
+                break
+            row = qlist[i]
+            if key is not None:
+                kv = key(row)
+                if kv in seen:
+                    continue
+                seen.add(kv)
+            picked.append(row)
+            origin.append((s, i))
+            if on_pick is not None:
+                on_pick(s, i)
+            got += 1
+
+    # refill rejected duplicates from the unused tail of each subject
+    for s, rest in spare:
+        if len(picked) >= k:
+            break
+        qlist = bank[s]
+        for i in rest:
+            if len(picked) >= k:
+                break
+            row = qlist[i]
+            kv = key(row) if key is not None else None
+            if kv is not None and kv in seen:
+                continue
+            seen.add(kv)
+            picked.append(row)
+            origin.append((s, i))
+            if on_pick is not None:
+                on_pick(s, i)
+
+    pairs = list(zip(picked, origin))
+    rng.shuffle(pairs)
+    if refs is not None:
+        refs.extend(ref for _, ref in pairs)
+    return [row for row, _ in pairs], seed
+
+
+def load_weights(path: str | None) -> dict | None:
+    """{subject: weight} from a JSON file (None if absent or unreadable)."""
+    if not path:
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return {str(s): float(w) for s, w in data.items()} if isinstance(data, dict) else None
+    except Exception as e:
+        print(f"[WARN] Ignoring subject weights {path}: {e}")
+        return None
@@ -0,0 +1,171 @@
+# question_search.py — full-text search over question + option text of every bank
+# - One inverted-index segment per subject: token → sorted array('I') of question indices,
+#   plus the sorted vocabulary for prefix matching of the word still being typed
+# - Built on a background thread from the (lazy/compiled) bank, each subject as soon as the
+#   bank's prefetch publishes it (so the index never parses a subject a second time);
+#   a reloaded subject only rebuilds its own segment
+# - search(): AND of all query words (the last one as a prefix), rarest posting first,
+#   so a keystroke stays in the low milliseconds across ~20k questions; a prefix that
+#   expands to more than MAX_PREFIX_EXP terms is cut off and the result says so
+# - refresh() drops the reloaded subjects' segments at once (their indices no longer
+#   match the swapped-in bank) and re-adds them when rebuilt
+
+import re, bisect, threading
+from array import array
+
+MIN_PREFIX     = 2      # shorter last words are matched exactly, not as prefixes
+MAX_PREFIX_EXP = 64     # vocabulary terms a prefix may expand to per subject
+_TOKEN_RE = re.compile(r"[0-9a-z]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it of on or that the this to was which what who with".split()
+)
+
+
+def tokenize(text) -> list[str]:
+    return [t for t in _TOKEN_RE.findall(str(text or "").casefold()) if t not in _STOPWORDS]
+
+
+def _row_text(row) -> str:
+    opts = row.get("options") or {}
+    return " ".join((str(row.get("question", "")), *(str(v) for v in opts.values())))
+
+
+class _Segment:
+    __slots__ = ("postings", "vocab", "size")
+
+    def __init__(self, questions):
+        post: dict[str, list] = {}
+        for i in range(len(questions)):
+            for tok in set(tokenize(_row_text(questions[i]))):
+                post.setdefault(tok, []).append(i)
+        self.postings = {t: array("I", ids) for t, ids in post.items()}
+        self.vocab = sorted(self.postings)
+        self.size = len(questions)
+
+    def match(self, words: list[str], prefix: str | None) -> tuple[list[int] | None, bool]:
+        """(sorted hits or None, whether the prefix expansion was cut at MAX_PREFIX_EXP)"""
+        lists, capped = [], False
+        for w in words:
+            p = self.postings.get(w)
+            if p is None:
+                return None, False
+            lists.append(p)
+        if prefix:
+            lo = bisect.bisect_left(self.vocab, prefix)
+            hi = bisect.bisect_left(self.vocab, prefix + "￿", lo)
+            if lo == hi:
+                return None, False
+            if hi - lo == 1:
+                lists.append(self.postings[self.vocab[lo]])
+            else:
+                capped = hi - lo > MAX_PREFIX_EXP
+                merged = set()
+                for t in self.vocab[lo:min(hi, lo + MAX_PREFIX_EXP)]:
+                    merged.update(self.postings[t])
+                lists.append(sorted(merged))
+        if not lists:
+            return None, False
+        lists.sort(key=len)
+        hits = set(lists[0])
+        for p in lists[1:]:
+            hits.intersection_update(p)
+            if not hits:
+                return None, capped
+        return sorted(hits), capped
+
+
+class SearchIndex:
+    """
+    Inverted index over a Mapping subject → question sequence.
+    build_async() indexes every subject on a daemon thread; search() answers
+    from whatever segments are ready (ready() tells whether all are). Start the
+    bank's prefetch() first: a subject it is loading is waited for, not loaded again.
+    """
+
+    def __init__(self, bank):
+        self.bank = bank
+        self._segments: dict[str, _Segment] = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._done = threading.Event()
+        self._refreshing = 0
+
+    def ready(self) -> bool:
+        return self._done.is_set() and not self._refreshing
+
+    def build(self, subjects=None) -> "SearchIndex":
+        wait_loaded = getattr(self.bank, "wait_loaded", None)
+        for subject in list(subjects if subjects is not None else self.bank):
+            if wait_loaded is not None:
+                wait_loaded(subject)
+            try:
+                seg = _Segment(self.bank[subject])
+            except Exception as e:
+                print(f"[WARN] Search index skipped {subject}: {e}")
+                continue
+            with self._lock:
+                self._segments[subject] = seg
+        return self
+
+    def build_async(self) -> None:
+        if self._thread is not None:
+            return
+
+        def _run():
+            try:
+                self.build()
+            finally:
+                self._done.set()
+
+        self._thread = threading.Thread(target=_run, name="gocbt-search-index", daemon=True)
+        self._thread.start()
+
+    def refresh(self, subjects) -> None:
+        """
+        Re-index just these subjects (e.g. after a hot reload), in the background. Their
+        old segments are dropped before this returns, so no search resolves indices
+        against the new bank until the rebuilt segment is in.
+        """
+        subjects = list(subjects)
+        if not subjects:
+            return
+        with self._lock:
+            for subject in subjects:
+                self._segments.pop(subject, None)
+            self._refreshing += 1
+
+        def _run():
+            try:
+                self.build(subjects)
+            finally:
+                with self._lock:
+                    self._refreshing -= 1
+
+        threading.Thread(target=_run, name="gocbt-search-refresh", daemon=True).start()
+
+    def search(self, query: str, limit: int = 200):
+        """
+        Questions containing every word of `query` (last word may be a prefix).
+        Returns (refs, total, capped): refs = [(subject, index)] in subject order, at most
+        `limit`; capped means the prefix matched too many words to expand them all, so
+        `total` is a lower bound.
+        """
+        words = tokenize(query)
+        if not words:
+            return [], 0, False
+        typing = query[-1:].isalnum()
+        prefix = words[-1] if typing and len(words[-1]) >= MIN_PREFIX else None
+        exact = words[:-1] if prefix else words
+        with self._lock:
+            segments = list(self._segments.items())
+        refs, total, capped = [], 0, False
+        for subject, seg in segments:
+            hits, cut = seg.match(exact, prefix)
+            capped = capped or cut
+            if not hits:
+                continue
+            total += len(hits)
+            room = limit - len(refs)
+            if room > 0:
+                refs.extend((subject, i) for i in hits[:room])
+        return refs, total, capped
@@ -0,0 +1,225 @@
+# question_stats.py — per-candidate question history + Leitner scheduler (adaptive practice)
+# - One record per question the candidate has answered, keyed by question_dedupe.content_hash
+#   (so history survives reordering, re-compiling and the same question in two banks):
+#   attempts, correct, Leitner box (1–5), last seen, next due, and where it was last found
+# - Stored as fixed-size binary records in user_data_dir()/stats/<candidate>.qst
+#   (tmp + os.replace, like the rotation state)
+# - pick_adaptive(): due reviews first (heap by due time, lowest box first), then fresh
+#   questions from the candidate's weakest subjects via the no-repeat rotation
+#
+# Layout (little-endian): "GOCBTQS1", u32 subject_count, u32 record_count,
+#   subjects: u16 length + UTF-8 name; records: 8B hash, u16 attempts, u16 correct,
+#   u8 box, u32 last_seen, u32 due, u16 subject id, u32 index
+
+import os, time, heapq, struct, random
+
+from path_utils import user_data_dir
+from rotation_state import candidate_key
+from question_dedupe import content_hash
+from question_sampler import allocate
+
+STATS_MAGIC   = b"GOCBTQS1"
+STATS_DIRNAME = "stats"
+
+# Leitner box → seconds until the question is due again (box 1 = missed: due next session)
+BOX_INTERVALS = (0, 0, 86400, 3 * 86400, 7 * 86400, 21 * 86400)
+MAX_BOX       = 5
+REVIEW_SHARE  = 0.5    # at most this share of an adaptive exam is review
+
+_HEAD = struct.Struct("<8sII")
+_U16 = struct.Struct("<H")
+_REC = struct.Struct("<8sHHBIIHI")
+
+
+class QuestionStats:
+    """hash → [attempts, correct, box, last_seen, due, subject, index] for one candidate."""
+
+    def __init__(self, path: str | None):
+        self.path = path
+        self.records: dict[bytes, list] = {}
+        self.subjects: dict[str, list] = {}    # subject → [attempts, correct]
+        self._hash_index: dict[str, dict] = {}  # subject → {hash: index}, built on demand
+        self._dirty = False
+
+    @classmethod
+    def for_candidate(cls, name: str) -> "QuestionStats":
+        folder = os.path.join(user_data_dir(), STATS_DIRNAME)
+        try:
+            os.makedirs(folder, exist_ok=True)
+        except Exception:
+            pass
+        return cls(os.path.join(folder, candidate_key(name) + ".qst")).load()
+
+    # ---- updates ----
+    def record(self, subject: str, index: int, row, correct: bool, now: float | None = None) -> None:
+        """One answered (or missed) question: update counts and move it between Leitner boxes."""
+        now = int(now if now is not None else time.time())
+        h = content_hash(row)
+        rec = self.records.get(h)
+        if rec is None:
+            rec = self.records[h] = [0, 0, 1, 0, 0, subject, index]
+        rec[0] += 1
+        rec[1] += 1 if correct else 0
+        rec[2] = min(MAX_BOX, rec[2] + 1) if correct else 1
+        rec[3] = now
+        rec[4] = now + BOX_INTERVALS[rec[2]]
+        rec[5], rec[6] = subject, index
+        agg = self.subjects.setdefault(subject, [0, 0])
+        agg[0] += 1
+        agg[1] += 1 if correct else 0
+        self._dirty = True
+
+    def record_exam(self, refs, rows, answers, now: float | None = None) -> int:
+        """Record a finished exam; refs are (subject, index) aligned with rows/answers."""
+        n = 0
+        for ref, row, ans in zip(refs, rows, answers):
+            if ref is None:
+                continue
+            self.record(ref[0], ref[1], row, ans is not None and ans == row.get("correct"), now)
+            n += 1
+        return n
+
+    # ---- queries ----
+    def weakness(self, subject: str) -> float:
+        """Smoothed error rate (wrong+1)/(attempts+2); 0.5 for a subject never attempted."""
+        attempts, correct = self.subjects.get(subject, (0, 0))
+        return (attempts - correct + 1) / (attempts + 2)
+
+    def due(self, limit: int, now: float | None = None, subjects=None):
+        """
+        Up to `limit` (hash, record) pairs that are due, most overdue / lowest box first;
+        with `subjects`, only records from those subjects.
+        """
+        now = int(now if now is not None else time.time())
+        items = ((rec[4], rec[2], h) for h, rec in self.records.items()
+                 if rec[4] <= now and (subjects is None or rec[5] in subjects))
+        return [(h, self.records[h]) for _, _, h in heapq.nsmallest(limit, items)]
+
+    def locate(self, bank, h: bytes, rec) -> tuple | None:
+        """(subject, index) of a recorded question in the current bank, or None if it's gone."""
+        subject, index = rec[5], rec[6]
+        if subject not in bank:
+            return None
+        qlist = bank[subject]
+        if 0 <= index < len(qlist) and content_hash(qlist[index]) == h:
+            return subject, index
+        idx = self._hash_index.get(subject)
+        if idx is None:
+            idx = self._hash_index[subject] = {content_hash(qlist[i]): i for i in range(len(qlist))}
+        i = idx.get(h)
+        return (subject, i) if i is not None else None
+
+    # ---- persistence ----
+    def to_bytes(self) -> bytes:
+        names = sorted({rec[5] for rec in self.records.values()})
+        ids = {s: n for n, s in enumerate(names)}
+        parts = [_HEAD.pack(STATS_MAGIC, len(names), len(self.records))]
+        for s in names:
+            b = s.encode("utf-8")
+            parts.append(_U16.pack(len(b)) + b)
+        for h, (att, cor, box, last, due, subj, index) in self.records.items():
+            parts.append(_REC.pack(h, min(att, 0xFFFF), min(cor, 0xFFFF), box, last, due, ids[subj], index))
+        return b"".join(parts)
+
+    def from_bytes(self, data: bytes) -> None:
+        magic, ns, nr = _HEAD.unpack_from(data, 0)
+        if magic != STATS_MAGIC:
+            raise ValueError("not a question stats file")
+        pos, names = _HEAD.size, []
+        for _ in range(ns):
+            (ln,) = _U16.unpack_from(data, pos); pos += _U16.size
+            names.append(data[pos:pos + ln].decode("utf-8")); pos += ln
+        if len(data) - pos < nr * _REC.size:
+            raise ValueError("truncated question stats file")
+        records, subjects = {}, {}
+        for h, att, cor, box, last, due, sid, index in _REC.iter_unpack(data[pos:pos + nr * _REC.size]):
+            subj = names[sid]
+            records[h] = [att, cor, box, last, due, subj, index]
+            agg = subjects.setdefault(subj, [0, 0])
+            agg[0] += att
+            agg[1] += cor
+        self.records, self.subjects = records, subjects
+
+    def load(self) -> "QuestionStats":
+        if not self.path or not os.path.exists(self.path):
+            return self
+        try:
+            with open(self.path, "rb") as f:
+                self.from_bytes(f.read())
+        except Exception as e:
+            print(f"[WARN] Question stats unreadable, starting fresh: {e}")
+            self.records, self.subjects = {}, {}
+        self._dirty = False
+        return self
+
+    def save(self) -> bool:
+        if not self._dirty or not self.path:
+            return False
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(self.to_bytes())
+            os.replace(tmp, self.path)
+            self._dirty = False
+            return True
+        except Exception as e:
+            print(f"[WARN] Could not save question stats {self.path}: {e}")
+            return False
+
+
+def pick_adaptive(bank, stats: QuestionStats, sampler, subjects, k: int = 100,
+                  review_share: float = REVIEW_SHARE, now: float | None = None, rng=None):
+    """
+    Choose k questions for adaptive practice.
+      1) due reviews (missed items come back next session; correct ones climb the
+         Leitner boxes and return after 1/3/7/21 days), at most review_share·k
+      2) the rest as fresh questions from `subjects`, allocated in proportion to each
+         subject's smoothed error rate and drawn from `sampler` (the no-repeat rotation);
+         fresh picks that collide with a review are topped up from the same rotation
+    Returns (rows, refs) with refs = [(subject, index)] aligned with rows.
+    """
+    rng = rng or random.Random()
+    rows, refs, taken = [], [], set()
+    allowed = set(subjects)
+    used = dict.fromkeys(allowed, 0)
+
+    def take(loc):
+        taken.add(loc)
+        used[loc[0]] += 1
+        rows.append(bank[loc[0]][loc[1]])
+        refs.append(loc)
+
+    # `stats.due` only sees allowed subjects, so the review cap is not used up by
+    # records the caller excluded; records whose question is gone are skipped
+    cap = int(k * review_share)
+    due = stats.due(len(stats.records), now, allowed) if cap > 0 else []
+    for h, rec in due:
+        if len(rows) >= cap:
+            break
+        loc = stats.locate(bank, h, rec)
+        if loc is None or loc in taken:
+            continue
+        take(loc)
+    # reviews are served in this session too, so the rotation skips them this cycle
+    for s in allowed:
+        picked = [i for t, i in refs if t == s]
+        if picked:
+            sampler.mark_served(s, picked)
+
+    sizes = {s: len(bank[s]) for s in subjects}
+    weights = {s: stats.weakness(s) for s in subjects}
+    while len(rows) < k:
+        room = {s: sizes[s] - used[s] for s in subjects}
+        before = len(rows)
+        for s, n in allocate(room, k - len(rows), weights).items():
+            if not n:
+                continue
+            for i in sampler.next_window(s, n):
+                if (s, i) not in taken:
+                    take((s, i))
+        if len(rows) == before:
+            break       # every subject is exhausted (or only repeats came back)
+
+    pairs = list(zip(rows, refs))
+    rng.shuffle(pairs)
+    return [r for r, _ in pairs], [f for _, f in pairs]
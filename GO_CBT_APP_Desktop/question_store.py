@@ -0,0 +1,145 @@
+# question_store.py — compact, column-oriented storage for normalized questions
+# - One QuestionBank per subject: question text + A-D option columns, answer keys packed in bytes
+# - Option strings are interned (banks repeat "All of the above", "True", "None of the above", …)
+# - QuestionRow is a 2-slot read-only view that still behaves like the old dict:
+#       q["question"], q["options"]["B"], q.get("correct"), q.get("options", {}) all work
+# - Pickles compactly, so question_bank.cache stores banks in this form directly
+
+import sys
+from collections.abc import Mapping, Sequence
+
+_LETTERS = ("A", "B", "C", "D")
+_ROW_KEYS = ("question", "options", "correct")
+
+
+class QuestionRow(Mapping):
+    """Read-only view of one question inside a QuestionBank (no per-row dicts kept alive)."""
+
+    __slots__ = ("_bank", "_i")
+
+    def __init__(self, bank, index):
+        self._bank = bank
+        self._i = index
+
+    def __getitem__(self, key):
+        b, i = self._bank, self._i
+        if key == "question":
+            return b._q[i]
+        if key == "options":
+            return {"A": b._a[i], "B": b._b[i], "C": b._c[i], "D": b._d[i]}
+        if key == "correct":
+            return chr(b._keys[i])
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(_ROW_KEYS)
+
+    def __len__(self):
+        return len(_ROW_KEYS)
+
+    def __repr__(self):
+        return f"QuestionRow({dict(self)!r})"
+
+    @property
+    def index(self) -> int:
+        return self._i
+
+    @property
+    def bank(self) -> "QuestionBank":
+        return self._bank
+
+    def to_dict(self) -> dict:
+        return {"question": self["question"], "options": self["options"], "correct": self["correct"]}
+
+
+class QuestionBank(Sequence):
+    """
+    Columnar list of normalized questions.
+
+    Indexing returns QuestionRow views; slicing returns a list of views.
+    Build with append()/extend() or QuestionBank.from_dicts(); the answer
+    column is a bytearray of b"A".."D" (one byte per question).
+    """
+
+    __slots__ = ("_q", "_a", "_b", "_c", "_d", "_keys")
+
+    def __init__(self):
+        self._q: list[str] = []
+        self._a: list[str] = []
+        self._b: list[str] = []
+        self._c: list[str] = []
+        self._d: list[str] = []
+        self._keys = bytearray()
+
+    # ---- building ----
+    def append(self, question: dict) -> None:
+        """Append one normalized dict ({"question", "options", "correct"})."""
+        opts = question.get("options") or {}
+        intern = sys.intern
+        self._q.append(question.get("question", ""))
+        self._a.append(intern(opts.get("A", "")))
+        self._b.append(intern(opts.get("B", "")))
+        self._c.append(intern(opts.get("C", "")))
+        self._d.append(intern(opts.get("D", "")))
+        letter = (question.get("correct") or "A")[:1].upper()
+        self._keys.append(ord(letter if letter in _LETTERS else "A"))
+
+    def extend(self, questions) -> None:
+        for q in questions:
+            self.append(q)
+
+    @classmethod
+    def from_dicts(cls, questions) -> "QuestionBank":
+        bank = cls()
+        bank.extend(questions)
+        return bank
+
+    # ---- Sequence protocol ----
+    def __len__(self):
+        return len(self._q)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [QuestionRow(self, j) for j in range(*i.indices(len(self._q)))]
+        if i < 0:
+            i += len(self._q)
+        if not 0 <= i < len(self._q):
+            raise IndexError("question index out of range")
+        return QuestionRow(self, i)
+
+    def __eq__(self, other):
+        if isinstance(other, QuestionBank):
+            return (self._keys == other._keys and self._q == other._q and self._a == other._a
+                    and self._b == other._b and self._c == other._c and self._d == other._d)
+        if isinstance(other, Sequence):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"<QuestionBank {len(self)} questions>"
+
+    # ---- column access (fast paths for exporters/indexers) ----
+    def question_text(self, i: int) -> str:
+        return self._q[i]
+
+    def correct_letter(self, i: int) -> str:
+        return chr(self._keys[i])
+
+    def to_dicts(self) -> list[dict]:
+        return [row.to_dict() for row in self]
+
+    # ---- pickling (slots + interning survives a cache round-trip) ----
+    def __getstate__(self):
+        return (self._q, self._a, self._b, self._c, self._d, bytes(self._keys))
+
+    def __setstate__(self, state):
+        q, a, b, c, d, keys = state
+        intern = sys.intern
+        self._q = q
+        self._a = [intern(x) for x in a]
+        self._b = [intern(x) for x in b]
+        self._c = [intern(x) for x in c]
+        self._d = [intern(x) for x in d]
+        self._keys = bytearray(keys)
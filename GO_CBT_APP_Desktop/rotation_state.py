@@ -0,0 +1,108 @@
+# rotation_state.py — per-candidate question rotation that survives restarts
+# - One small binary file per candidate in user_data_dir()/rotation/ (name is hashed)
+# - Per subject: permutation seed, bank size, cursor and a bitset of questions already
+#   served (1 bit per question, ~125 bytes for a 1000-question subject)
+# - Loading/saving is a single read/write of a few KB; saves go through tmp + os.replace,
+#   so a crash leaves either the previous or the new state, never a torn file
+#
+# Layout (little-endian): "GOCBTRS1", u32 subject_count, then per subject
+#   u16 name length + UTF-8 name, u64 seed, u32 size, u32 cursor, u32 bitset length + bytes
+
+import os, struct, hashlib
+
+from path_utils import user_data_dir
+
+STATE_MAGIC = b"GOCBTRS1"
+STATE_DIRNAME = "rotation"
+
+_HEAD = struct.Struct("<8sI")
+_U16 = struct.Struct("<H")
+_REC = struct.Struct("<QIII")
+
+
+def candidate_key(name: str) -> str:
+    """Stable file stem for a candidate (case/spacing-insensitive, not the raw name)."""
+    norm = " ".join(str(name or "").split()).casefold()
+    return hashlib.blake2b(norm.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class RotationState:
+    """subject → (seed, size, cursor, bitset) for one candidate, persisted in one file."""
+
+    def __init__(self, path: str | None):
+        self.path = path
+        self._subjects: dict[str, tuple] = {}
+        self._dirty = False
+
+    @classmethod
+    def for_candidate(cls, name: str) -> "RotationState":
+        folder = os.path.join(user_data_dir(), STATE_DIRNAME)
+        try:
+            os.makedirs(folder, exist_ok=True)
+        except Exception:
+            pass
+        return cls(os.path.join(folder, candidate_key(name) + ".rot")).load()
+
+    # ---- access ----
+    def get(self, subject):
+        """(seed, size, cursor, bytearray bitset) or None."""
+        return self._subjects.get(subject)
+
+    def put(self, subject, seed: int, size: int, cursor: int, bits: bytearray) -> None:
+        self._subjects[subject] = (seed, size, cursor, bits)
+        self._dirty = True
+
+    def forget(self, subject) -> None:
+        if self._subjects.pop(subject, None) is not None:
+            self._dirty = True
+
+    # ---- (de)serialization ----
+    def to_bytes(self) -> bytes:
+        parts = [_HEAD.pack(STATE_MAGIC, len(self._subjects))]
+        for subject, (seed, size, cursor, bits) in self._subjects.items():
+            name = subject.encode("utf-8")
+            parts.append(_U16.pack(len(name)) + name)
+            parts.append(_REC.pack(seed, size, cursor, len(bits)))
+            parts.append(bytes(bits))
+        return b"".join(parts)
+
+    def from_bytes(self, data: bytes) -> None:
+        magic, n = _HEAD.unpack_from(data, 0)
+        if magic != STATE_MAGIC:
+            raise ValueError("not a rotation state file")
+        pos, subjects = _HEAD.size, {}
+        for _ in range(n):
+            (ln,) = _U16.unpack_from(data, pos); pos += _U16.size
+            subject = data[pos:pos + ln].decode("utf-8"); pos += ln
+            seed, size, cursor, nbytes = _REC.unpack_from(data, pos); pos += _REC.size
+            bits = bytearray(data[pos:pos + nbytes]); pos += nbytes
+            if len(bits) != nbytes or nbytes != (size + 7) // 8:
+                raise ValueError(f"truncated record for {subject!r}")
+            subjects[subject] = (seed, size, cursor, bits)
+        self._subjects = subjects
+
+    def load(self) -> "RotationState":
+        if not self.path or not os.path.exists(self.path):
+            return self
+        try:
+            with open(self.path, "rb") as f:
+                self.from_bytes(f.read())
+        except Exception as e:
+            print(f"[WARN] Rotation state unreadable, starting fresh: {e}")
+            self._subjects = {}
+        self._dirty = False
+        return self
+
+    def save(self) -> bool:
+        if not self._dirty or not self.path:
+            return False
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(self.to_bytes())
+            os.replace(tmp, self.path)
+            self._dirty = False
+            return True
+        except Exception as e:
+            print(f"[WARN] Could not save rotation state {self.path}: {e}")
+            return False
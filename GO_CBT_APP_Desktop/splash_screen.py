@@ -23,6 +23,7 @@ ACCENT_FG       = "#0F62FE"
 # Loading overlay text & timing
 LOADING_TEXT    = "Preparing your dashboard…"
 LOADING_MS      = 3000   # 2.4 seconds (increase/decrease as you like)
+PROGRESS_MS     = 30     # indeterminate bar step; ~33 fps is smooth and keeps the loop idle
 
 # Strict centered size for the loading overlay window
 LOADING_WIDTH   = 420
@@ -30,12 +31,13 @@ LOADING_HEIGHT  = 280
 
 # Optional icon & asset helpers (best-effort)
 try:
-    from path_utils import find_app_icon, assets_dir_candidates
+    from path_utils import find_app_icon, assets_dir_candidates, find_logo
 except Exception:
     def find_app_icon(): return None
     def assets_dir_candidates():
         here = os.path.dirname(os.path.abspath(__file__))
         return [os.path.join(here, "assets"), here]
+    find_logo = None
 
 # Optional Pillow (for more image formats); Tk PhotoImage handles PNG/GIF on Tk 8.6+
 try:
@@ -45,7 +47,20 @@ except Exception:
     Image = ImageTk = None
     _HAS_PIL = False
 
+# Timers go through the root's shared scheduler when it is available
+try:
+    from tk_scheduler import Scheduler
+except Exception:
+    Scheduler = None
+
 # ---------- Common helpers ----------
+def _later(win, ms, fn):
+    """Run fn() after ~ms, cancelled if `win` is destroyed first."""
+    if Scheduler is not None:
+        Scheduler.for_root(win).call_later(ms, fn, owner=win)
+    else:
+        win.after(ms, fn)
+
 def _center_window(win, w=None, h=None):
     try:
         win.update_idletasks()
@@ -74,6 +89,8 @@ def _zwsp_wrap_text(s: str) -> str:
     return " ".join(soften(tok) for tok in s.split())
 
 def _find_logo_path():
+    if find_logo is not None:
+        return find_logo()
     names = ("go_cbt_logo.png", "go_cbt_logo.gif", "go_cbt.png", "logo.png", "splash.png", "splash.gif")
     for d in assets_dir_candidates():
         for nm in names:
@@ -128,14 +145,15 @@ class _LoadingIntro(tk.Toplevel):
         if logo_path:
             try:
                 if _HAS_PIL:
-                    from PIL import Image, ImageTk  # local import if available
-                    im = Image.open(logo_path)
                     max_logo_w = max(120, inner_w - 140)   # keep space for text & bar
-                    if im.width > max_logo_w:
-                        ratio = max_logo_w / float(im.width)
-                        im = im.resize((int(im.width * ratio), int(im.height * ratio)), Image.LANCZOS)
-                    self._img_ref = ImageTk.PhotoImage(im)
-                else:
+                    try:
+                        # shared cache: the pre-scaled assets/scaled/ variant when built
+                        # (LOGO_BOXES["splash"] is this 236 px box), else decoded + fitted once
+                        from image_cache import get_photo
+                        self._img_ref = get_photo(logo_path, (max_logo_w, max_logo_w))
+                    except Exception:
+                        self._img_ref = None
+                if self._img_ref is None:
                     self._img_ref = tk.PhotoImage(file=logo_path)
                 tk.Label(inner, image=self._img_ref, bg=WINDOW_BG).pack(pady=(0, 8))
             except Exception:
@@ -151,19 +169,23 @@ class _LoadingIntro(tk.Toplevel):
         pb = ttk.Progressbar(inner, mode="indeterminate", length=bar_len)
         pb.pack()
         try:
-            pb.start(11)
+            if Scheduler is not None:
+                # step() is what ttk's own start() runs; here it shares the root's ticks
+                Scheduler.for_root(pb).every(PROGRESS_MS, pb.step, owner=pb)
+            else:
+                pb.start(PROGRESS_MS)
         except Exception:
             pass
 
         # Bring to front and modal-ish
         try:
             self.lift(); self.attributes("-topmost", True); self.focus_force(); self.grab_set()
-            self.after(220, lambda: self.attributes("-topmost", False))
+            _later(self, 220, lambda: self.attributes("-topmost", False))
         except Exception:
             pass
 
         # Auto-finish after the configured delay
-        self.after(max(200, int(duration_ms)), self._finish)
+        _later(self, max(200, int(duration_ms)), self._finish)
 
         # Clean up on close (manual close falls back to finishing)
         self.protocol("WM_DELETE_WINDOW", self._finish)
@@ -336,7 +358,7 @@ class SplashScreen(tk.Toplevel):
             _center_window(self, int(WRAP_WIDTH * 0.95), CANVAS_HEIGHT + 160)
         try:
             self.lift(); self.attributes("-topmost", True); self.focus_force(); self.grab_set()
-            self.after(250, lambda: self.attributes("-topmost", False))
+            _later(self, 250, lambda: self.attributes("-topmost", False))
         except Exception:
             pass
 
@@ -13,13 +13,26 @@ try:
 except Exception:
     RESAMPLE_FILTER = getattr(Image, "LANCZOS", getattr(Image, "ANTIALIAS", Image.BICUBIC))
 
-import os, sys, random, json, glob, tempfile, webbrowser
+import os, sys, io, time, random, json, tempfile, webbrowser
+
+from path_utils import resource_path, asset_path as _pu_asset_path, find_app_icon, find_asset
+import os, json
+
+# Universal question normalizer + subject manifest live in question_bank.py
+from question_bank import LazyQuestionBank, SubjectWatcher, HOT_RELOAD
+from question_dedupe import duplicate_key
+from question_sampler import PermutationSampler, load_weights
+from rotation_state import RotationState
+from exam_blueprint import load_plans, DEFAULT_DURATION
+from question_stats import QuestionStats, pick_adaptive
+from question_search import SearchIndex
+from question_nav import QuestionNavigator
+from virtual_views import VirtualList, VirtualTable, TextWrapper
+from bg_renderer import BackgroundRenderer, load_source as load_bg_source
+from image_cache import get_image, get_photo, LOGO_BOXES
+from tk_scheduler import Scheduler
+import metrics
 
-from path_utils import resource_path, asset_path as _pu_asset_path, assets_dir_candidates, find_app_icon
-import os, glob, json
-from path_utils import assets_dir_candidates
-
-# --- BEGIN: universal question normalizer (place near imports) ----------------
 def _ensure_bg_label(self, parent):
     """
     Ensure a background Label exists and is attached to 'parent'.
@@ -30,120 +43,6 @@ def _ensure_bg_label(self, parent):
         self._bg_label = tk.Label(parent, bd=0, highlightthickness=0)
         self._bg_label.place(relx=0, rely=0, relwidth=1, relheight=1)
 
-def _normalize_options_dict(opts):
-    """
-    Accepts options in any of these shapes:
-      - dict like {"A": "...", "b": "...", "C":"...", "D":"..."} (any case/order)
-      - list like ["A. Text", "B) Text", "C Text", "D - Text"]   (will parse prefixes)
-    Returns ordered dict: {"A": "...", "B": "...", "C": "...", "D": "..."}
-    Missing items become empty strings (so UI still renders A-D).
-    """
-    out = {"A": "", "B": "", "C": "", "D": ""}
-    if isinstance(opts, dict):
-        for k, v in list(opts.items()):
-            K = str(k).strip().upper()
-            if K in out:
-                out[K] = (v if isinstance(v, str) else str(v)).strip()
-        return out
-
-    if isinstance(opts, list):
-        # try to parse "A. xxx", "B) xxx", "C xxx", etc.
-        for raw in opts:
-            s = (raw if isinstance(raw, str) else str(raw)).strip()
-            if not s:
-                continue
-            prefix = s[:2].upper()  # "A.", "B)", "C ", "D-"
-            letter = None
-            if prefix and prefix[0] in "ABCD":
-                letter = prefix[0]
-                # remove typical separators after the letter
-                rest = s[1:].lstrip(".:) -").strip()
-                out[letter] = rest
-        return out
-
-    # unknown shape: return empty slots
-    return out
-
-
-def _extract_letter_from_answer_field(ans):
-    """
-    If 'answer' is a letter (A-D), return letter; if it's text, return None (we'll map later).
-    """
-    if isinstance(ans, str):
-        s = ans.strip().upper()
-        if s in ("A", "B", "C", "D"):
-            return s
-    return None
-
-
-def _map_text_to_letter(options_dict, text):
-    """Try to match a free-text correct answer to one of A-D by case-insensitive equality."""
-    if not isinstance(text, str):
-        text = str(text)
-    goal = text.strip().lower()
-    for L, opt in options_dict.items():
-        if opt.strip().lower() == goal:
-            return L
-    return None
-
-
-def normalize_question_item(item):
-    """
-    Accepts any of your historical item shapes and returns:
-      {
-        "question": "<text>",
-        "options": {"A": "...", "B": "...", "C": "...", "D": "..."},
-        "correct": "A" | "B" | "C" | "D"
-      }
-
-    Supported inputs:
-      - options as dict or list
-      - correct letter in:  answer / correct_option / CorrectOption / correct / Correct
-      - correct text in:    correct_answer / CorrectAnswer
-      - if only text is present, we map it to A-D via options
-    """
-    qtext = item.get("question") or item.get("Question") or item.get("title") or ""
-    opts  = item.get("options", [])
-    options_dict = _normalize_options_dict(opts)
-
-    # 1) Try to get a letter straight
-    letter = None
-    for key in ("correct_option", "CorrectOption", "correct", "Correct"):
-        if key in item:
-            val = item.get(key)
-            if isinstance(val, str) and val.strip().upper() in ("A", "B", "C", "D"):
-                letter = val.strip().upper()
-                break
-
-    if not letter:
-        # 'answer' field can be letter or text
-        letter = _extract_letter_from_answer_field(item.get("answer"))
-
-    # 2) If we still don't have a letter, try by matching text
-    if not letter:
-        corr_text = item.get("correct_answer") or item.get("CorrectAnswer") or ""
-        if corr_text:
-            letter = _map_text_to_letter(options_dict, corr_text)
-
-    # 3) Final fallback: if 'answer' was text (not letter), try mapping it
-    if not letter and isinstance(item.get("answer"), str):
-        letter = _map_text_to_letter(options_dict, item["answer"])
-
-    # Guarantee a letter (worst case pick empty 'A' to avoid crash; better than None)
-    if letter not in ("A", "B", "C", "D"):
-        letter = "A"
-
-    return {
-        "question": str(qtext).strip(),
-        "options": {
-            "A": options_dict.get("A", ""),
-            "B": options_dict.get("B", ""),
-            "C": options_dict.get("C", ""),
-            "D": options_dict.get("D", ""),
-        },
-        "correct": letter
-    }
-# --- END: universal question normalizer --------------------------------------
 
 # ------------------------------
 # Image resampling compatibility
@@ -166,85 +65,104 @@ BASE_FONT_LARGE  = ("Arial", 16, "bold")
 NAV_BAR_COLOR        = "#004d40"
 NAV_BAR_FIXED_HEIGHT = 60
 USE_FIXED_HEIGHT_BARS = True  # Toggle this if you want slim bars that persist even without buttons
+NAV_GRID_COLUMNS     = 25     # question-number buttons per row
+REVIEW_ROW_HEIGHT    = 112    # px of a review row whose question wraps to two lines
+REVIEW_WRAP_PX       = 700    # review question wrap width
+
+SIMULATION_WEIGHTS_FILE = "simulation_weights.json"   # optional {subject: weight} for the simulation mix
 
 # ---------------------------------------------
 # GIF player & branded Goodbye/Outro screen
 # ---------------------------------------------
 class GifPlayer(tk.Label):
+    """
+    Animated GIF label. The file is read once; frames are decoded one at a time as the
+    animation reaches them, into a single reused PhotoImage, and each is shown for its
+    own GIF duration (`delay` ms when a frame has none). Frames run on the root's
+    Scheduler, timed from when the previous one was due (so tick rounding doesn't add
+    up); the loop stops when the label is destroyed and pauses while it is unmapped.
+    """
+
+    MIN_DELAY = 20   # ms; GIFs with 0/10 ms frames would otherwise spin the Tk loop
+
     def __init__(self, master, gif_path, delay=60, **kwargs):
         super().__init__(master, **kwargs)
-        self._frames = []
-        i = 0
-        while True:
-            try:
-                frm = tk.PhotoImage(file=gif_path, format=f"gif -index {i}")
-                self._frames.append(frm)
-                i += 1
-            except Exception:
-                break
+        self._delay = delay
+        self._gif = None
+        self._photo = None
         self._idx = 0
-        if self._frames:
-            self.config(image=self._frames[0])
-            self.after(delay, self._animate, delay)
-
-    def _animate(self, delay):
-        if not self._frames:
+        self._job = None
+        self._due = 0.0
+        try:
+            with open(gif_path, "rb") as f:
+                self._gif = Image.open(io.BytesIO(f.read()))
+            self._photo = ImageTk.PhotoImage(self._gif.convert("RGBA"))
+            self.config(image=self._photo)
+        except Exception as e:
+            print(f"[WARN] GIF unreadable {gif_path}: {e}")
+            self._gif = None
+            return
+        self.bind("<Destroy>", self._stop, add="+")
+        self.bind("<Unmap>", self._stop, add="+")
+        self.bind("<Map>", self._start, add="+")
+        self._start()
+
+    def _frame_delay(self):
+        return max(self.MIN_DELAY, int(self._gif.info.get("duration") or self._delay))
+
+    def _start(self, _evt=None):
+        if self._gif is not None and self._job is None:
+            self._schedule(time.monotonic() * 1000)
+
+    def _schedule(self, base):
+        self._due = base + self._frame_delay()
+        wait = max(0, int(self._due - time.monotonic() * 1000))
+        self._job = Scheduler.for_root(self).call_later(wait, self._animate, owner=self)
+
+    def _stop(self, _evt=None):
+        if self._job is not None:
+            self._job.cancel()
+            self._job = None
+
+    def _animate(self):
+        self._job = None
+        try:
+            try:
+                self._gif.seek(self._idx + 1)
+                self._idx += 1
+            except EOFError:
+                if self._idx == 0:
+                    return            # single frame: nothing to animate
+                self._gif.seek(0)
+                self._idx = 0
+            self._photo.paste(self._gif.convert("RGBA"))
+        except Exception:
             return
-        self._idx = (self._idx + 1) % len(self._frames)
-        self.config(image=self._frames[self._idx])
-        self.after(delay, self._animate, delay)
+        # catch up on tick rounding, but not on a long stall (that would skip frames)
+        self._schedule(max(self._due, time.monotonic() * 1000 - self.MIN_DELAY))
 
 
 def asset_path(*parts):
     """
     Return a valid path under your asset folders.
-    Tries 'assets' first (confirmed folder), then 'assests' (fallback).
+    Tries the indexed 'assets' dirs first (confirmed folder), then 'assests' (fallback).
     """
-    for base in ("assets", "assests"):
-        p = resource_path(base, *parts)
-        if os.path.exists(p):
-            return p
+    p = _pu_asset_path(*parts)
+    if os.path.exists(p):
+        return p
+    p = resource_path("assests", *parts)
+    if os.path.exists(p):
+        return p
     # final fallback to 'assets' (helps produce a clear error if truly missing)
     return resource_path("assets", *parts)
 
-def _norm_name(s: str) -> str:
-    """lowercase alnum only, so 'Financial Regulations_clean.json' ~ 'financialregulationsjson'"""
-    return "".join(ch for ch in s.lower() if ch.isalnum())
-
-def _strip_common_suffixes(s: str) -> str:
-    # Allow matching with or without _clean/_normalized, etc.
-    for token in ("clean", "normalized", "normalised"):
-        s = s.replace(token, "")
-    return s
-
-def find_json_file(preferred_name: str) -> str | None:
-    """
-    1) Try exact match in any candidate assets dir
-    2) Fuzzy match ignoring case/spacing/_clean/_normalized
-    """
-    # 1) exact
-    for d in assets_dir_candidates():
-        p = os.path.join(d, preferred_name)
-        if os.path.exists(p):
-            return p
-
-    # 2) fuzzy
-    want = _strip_common_suffixes(_norm_name(preferred_name))
-    for d in assets_dir_candidates():
-        for f in glob.glob(os.path.join(d, "*.json")):
-            base = os.path.basename(f)
-            nb = _strip_common_suffixes(_norm_name(base))
-            if nb == want or want in nb or nb in want:
-                return f
-    return None
-
 class GoodbyeScreen(tk.Frame):
     def __init__(self, master, on_exit, auto_close_ms=4000):
         super().__init__(master, bg="#0b1020")
         self.on_exit = on_exit
         self._build_ui()
         if auto_close_ms:
-            self.after(auto_close_ms, self.on_exit)
+            Scheduler.for_root(self).call_later(auto_close_ms, self.on_exit, owner=self)
 
     def _build_ui(self):
         wrap = tk.Frame(self, bg="#0b1020")
@@ -257,10 +175,10 @@ class GoodbyeScreen(tk.Frame):
 
         try:
             if os.path.exists(logo_path):
-                img = Image.open(logo_path)
-                img.thumbnail((260, 260))
-                self._logo = ImageTk.PhotoImage(img)
-                tk.Label(wrap, image=self._logo, bg="#0b1020").pack(pady=(12, 10))
+                # pre-scaled assets/scaled/ variant when built, else decoded + fitted once
+                self._logo = get_photo(logo_path, LOGO_BOXES["goodbye"])
+                if self._logo is not None:
+                    tk.Label(wrap, image=self._logo, bg="#0b1020").pack(pady=(12, 10))
         except Exception:
             pass
 
@@ -302,6 +220,34 @@ class GoodbyeScreen(tk.Frame):
         ).pack(pady=(2, 18))
 
 
+class ReviewRow(tk.Frame):
+    """
+    One recycled row of the review page: question, answer, status and a jump button.
+    The question comes pre-wrapped (TextWrapper) so the row's height is known up front.
+    """
+
+    def __init__(self, master, on_jump):
+        super().__init__(master, pady=5, padx=10, bg="#e0f7fa", bd=1, relief="groove")
+        self.index = 0
+        self.jump_btn = tk.Button(self, text="", font=BASE_FONT, width=18,
+                                  command=lambda: on_jump(self.index))
+        self.jump_btn.pack(side="right", padx=10)
+        self.q_lbl = tk.Label(self, font=BASE_FONT_BOLD, justify="left", anchor="nw", bg="#e0f7fa")
+        self.q_lbl.pack(anchor="w", fill="x")
+        self.ans_lbl = tk.Label(self, font=BASE_FONT, fg="blue", bg="#e0f7fa")
+        self.ans_lbl.pack(anchor="w", padx=10)
+        self.status_lbl = tk.Label(self, font=BASE_FONT_BOLD, bg="#e0f7fa")
+        self.status_lbl.pack(anchor="w", padx=10)
+
+    def show(self, index, lines, user_ans):
+        self.index = index
+        status = "Answered" if user_ans else "Unanswered"
+        self.q_lbl.config(text="\n".join(lines))
+        self.ans_lbl.config(text=f"Your answer: {user_ans if user_ans else 'Not answered'}")
+        self.status_lbl.config(text=f"Status: {status}", fg="green" if status == "Answered" else "red")
+        self.jump_btn.config(text=f"Go to Question {index+1}")
+
+
 class GO_CBT_App(tk.Frame):
     def __init__(self, master=None):
         super().__init__(master)
@@ -316,30 +262,46 @@ class GO_CBT_App(tk.Frame):
         except Exception:
             pass
 
+        # GOCBT_METRICS=1: event-loop heartbeat + timings to user_data_dir()/metrics
+        metrics.start(self._root())
+
         self.student_name = ""
         self.full_question_bank = self.load_full_question_bank()
         self.questions = {}
         self.answers = {}
         self.current_subject = None
         self.current_question_index = 0
-        self.timer_id = None
-        self._timer_after_id = None
+        self._timer_job = None
         self.bind("<Destroy>", self._on_destroy, add="+")
         self.selected_option = tk.StringVar()
-        self.nav_buttons = []
-        self.cycle_start_indices = {}
+        self.navigator = None
+        self.review_list = None
+        self._result_summary = (0, 0, 0, 0, 0.0)
+        # Screens are built once and raised on demand (see _show_screen)
+        self._screens = {}
+        self._current_screen = None
+        self._exam_plans = None
+        self._plan_subjects = ()
+        self.exam_duration = DEFAULT_DURATION
+        # (subject, index) of every question in each exam, aligned with self.questions
+        self.question_refs = {}
+        self.exam_seeds = {}        # exam title -> seed that reproduces its question set (planned exams)
+        self.question_stats = None
+        # Full-text index over every question/option, built in the background after login shows
+        self.search_index = SearchIndex(self.full_question_bank)
 
         # Background holders
-        self._bg_src = None
-        self._bg_tk = None
         self._bg_label = None
+        self._bg_renderer = None
+
+        # Per-subject no-repeat rotation: a seeded int32 index permutation built on first use;
+        # start_exam() attaches the candidate's persisted state (seed + served bitset)
+        self.question_sampler = PermutationSampler(lambda s: len(self.full_question_bank.get(s, ())))
 
-        # Shuffle question bank once
-        self.shuffled_question_bank = {}
-        for subject, questions in self.full_question_bank.items():
-            shuffled = questions[:]
-            random.shuffle(shuffled)
-            self.shuffled_question_bank[subject] = shuffled
+        # Edited subject JSON files are re-parsed in the background and swapped in between exams
+        self._bank_watcher = None
+        if HOT_RELOAD and isinstance(self.full_question_bank, LazyQuestionBank):
+            self._bank_watcher = SubjectWatcher(self.full_question_bank)
 
         # Default: Close X behaves normally unless overridden on Results screen
         self._bind_close_x_to(self.master.destroy)
@@ -357,13 +319,10 @@ class GO_CBT_App(tk.Frame):
         # ---------- Window-close helpers ----------
     def stop_timer(self):
         """Cancel any scheduled timer tick."""
-        aid = getattr(self, "_timer_after_id", None)
-        if aid:
-            try:
-                self.after_cancel(aid)
-            except Exception:
-                pass
-            self._timer_after_id = None
+        job = getattr(self, "_timer_job", None)
+        if job is not None:
+            job.cancel()
+            self._timer_job = None
 
     def _on_destroy(self, _evt=None):
         """Ensure timers are cancelled when this widget goes away."""
@@ -371,6 +330,10 @@ class GO_CBT_App(tk.Frame):
             self.stop_timer()
         except Exception:
             pass
+        if self._bank_watcher is not None:
+            self._bank_watcher.stop()
+        if self._bg_renderer is not None:
+            self._bg_renderer.detach()
 
     # ---------- General helpers ----------
     def disable_all_buttons(self):
@@ -391,10 +354,42 @@ class GO_CBT_App(tk.Frame):
             except Exception:
                 pass
         # 🔧 make sure stale refs don’t linger
+        if self._bg_renderer is not None:
+            self._bg_renderer.detach()
         self._bg_label = None
-        self._bg_img = None
-        self._bg_tk = None
-        
+        self._bg_renderer = None
+        self._screens = {}
+        self._current_screen = None
+        self.navigator = None
+        self.review_list = None
+
+    # ---------- Screen manager ----------
+    def _show_screen(self, name, build, keep=True):
+        """
+        Show screen `name`, building it with build(frame) the first time only.
+        The previous screen is hidden with pack_forget (or destroyed if it was a
+        one-off screen shown with keep=False), so switching never rebuilds widgets.
+        """
+        frame = self._screens.get(name)
+        if frame is None or not frame.winfo_exists():
+            frame = tk.Frame(self)
+            build(frame)
+            if keep:
+                self._screens[name] = frame
+        prev = self._current_screen
+        if prev is not frame:
+            if prev is not None:
+                try:
+                    if any(prev is f for f in self._screens.values()):
+                        prev.pack_forget()
+                    else:
+                        prev.destroy()
+                except tk.TclError:
+                    pass
+            frame.pack(fill="both", expand=True)
+        self._current_screen = frame
+        return frame
+
     def on_data_ready(self):
         """
         Safe default handler called when question-bank loading finishes.
@@ -498,145 +493,58 @@ class GO_CBT_App(tk.Frame):
     # ---------- Question bank loader ----------
     def load_full_question_bank(self):
         """
-        Load all subject JSON files from assets/ or _internal/assets/.
-        Returns: dict[str, list[dict]]
+        Map every subject in the manifest to its questions (assets/ or _internal/assets/).
+        Subjects are parsed lazily on first use (from question_bank.cache when the
+        source file is unchanged); show_login_page() starts a background prefetch.
+        Returns: Mapping[str, list[dict]]
         """
-        def load_questions_by_filename(preferred_filename: str) -> list[dict]:
-            """
-            Locate a subject JSON by name (exact or fuzzy) and return a list of normalized questions.
-            Normalized shape:
-              { "question": str, "options": {"A","B","C","D"}, "correct": "A"|"B"|"C"|"D" }
-            """
-            # --- helper: tolerant finder ---
-            def _norm_name(s: str) -> str:
-                return "".join(ch for ch in s.lower() if ch.isalnum())
-
-            def _strip_common_suffixes(s: str) -> str:
-                for t in ("clean", "normalized", "normalised"):
-                    s = s.replace(t, "")
-                return s
-
-            def _find_json_file(name: str) -> str | None:
-                # 1) exact match in any asset dir
-                for d in assets_dir_candidates():
-                    p = os.path.join(d, name)
-                    if os.path.exists(p):
-                        return p
-                # 2) fuzzy match
-                want = _strip_common_suffixes(_norm_name(name))
-                for d in assets_dir_candidates():
-                    for f in glob.glob(os.path.join(d, "*.json")):
-                        base = os.path.basename(f)
-                        nb = _strip_common_suffixes(_norm_name(base))
-                        if nb == want or want in nb or nb in want:
-                            return f
-                return None
-
-            # --- resolve file path ---
-            path = _find_json_file(preferred_filename)
-            if not path or not os.path.exists(path):
-                print(f"[WARN] Asset not found for: {preferred_filename}")
-                print("[WARN] Looked in:", assets_dir_candidates())
-                return []
-
-            # --- read JSON safely ---
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except Exception as e:
-                print(f"[ERROR] Unable to read {path}: {e}")
-                return []
-
-            # unwrap {"questions": [...]} shape if present
-            if isinstance(data, dict) and "questions" in data:
-                data = data["questions"]
-
-            # --- normalize in a SINGLE loop; avoid duplicates ---
-            questions: list[dict] = []
-            seen = set()
-            for raw in data:
-                try:
-                    norm = normalize_question_item(raw)  # your universal normalizer at module top
-                    opts = norm.get("options", {})
-                    key = (
-                        norm.get("question", "").strip(),
-                        opts.get("A", "").strip(),
-                        opts.get("B", "").strip(),
-                        opts.get("C", "").strip(),
-                        opts.get("D", "").strip(),
-                        (norm.get("correct") or "").strip().upper(),
-                    )
-                    if key in seen:
-                        continue
-                    seen.add(key)
-                    questions.append(norm)
-                except Exception:
-                    # skip malformed rows quietly
-                    continue
-
-            print(f"[INFO] Loaded {len(questions)} from {os.path.basename(path)}")
-            return questions
-
-                    # === END OF NEW BLOCK ===
-            
-        full_bank = {}
-        # Map subjects → intended filenames (finder is fuzzy about case/spacing/underscores)
-        full_bank["Current Affairs"] = load_questions_by_filename("Nigerian_Current_Affairs_Full.json")
-        full_bank["Code of Conduct"] = load_questions_by_filename("Code_of_Conduct_Questions_1-400.json")
-        full_bank["Nigerian Tax"] = load_questions_by_filename("NIGERIAN_TAX_MCQs.json")
-        full_bank["Leadership"] = load_questions_by_filename("Leadership.json")
-        full_bank["Computer Knowledge"] = load_questions_by_filename("Computer.json")
-        full_bank["Psychometrics"] = load_questions_by_filename("Psychometrics.json")
-        full_bank["Financial Regulations"] = load_questions_by_filename("Financial Regulations.json")
-        full_bank["Public Procurement"] = load_questions_by_filename("Public Procurement.json")
-        full_bank["Federal Civil Service Strategic Implementation Plan 2025"] = load_questions_by_filename("FCSSIP25_MCQs.json")
-        full_bank["CBN and Monetary Policy"] = load_questions_by_filename("CBN AND MONETARY POLICIES.json")
-        full_bank["FCTA and It's Operations"] = load_questions_by_filename("FCTA AND ITS OPERATIONS.json")
-        full_bank["Comprehensive Competency Framework"] = load_questions_by_filename("CCF_100_MCQs.json")
-        full_bank["Public Service Rules"] = load_questions_by_filename("PSR.json")
-        full_bank["Education Profession"] = load_questions_by_filename("Education_Sector.json")
-        full_bank["Medical/Health Profession"] = load_questions_by_filename("Health_MCQs.json")
-        full_bank["Tourism Development, Arts & Culture Profession"] = load_questions_by_filename("TAC_MCQs.json")
-        full_bank["Transportation & Vehicle Inspection Profession"] = load_questions_by_filename("Transport_MCQs.json")
-        full_bank["Lands, Housing & Urban Development Profession"] = load_questions_by_filename("URP_MCQs.json")
-        full_bank["Agriculture, Rural Development and Infrastructure Profession"] = load_questions_by_filename("Agric_MCQs.json")
-        full_bank["Social Welfare & Community Development Profession"] = load_questions_by_filename("Social_MCQs.json")
-        full_bank["Human Resource Management (Admin) Profession"] = load_questions_by_filename("HRM_MCQs.json")
-        full_bank["Engineering Profession"] = load_questions_by_filename("Engineering_MCQs.json")
-        full_bank["Civil Service Reforms & Policies"] = load_questions_by_filename("CCRP_MCQs.json")
-        full_bank["Fire Service Profession"] = load_questions_by_filename("Fire_Service_MCQs.json")
-        full_bank["General Knowledge"] = load_questions_by_filename("General Knowledge MCQs.json")
-        full_bank["Expanded FCTA Structure & Functions"] = load_questions_by_filename("Expanded FCTA Structure & Functions.json")
-        full_bank["Legal Profession"] = load_questions_by_filename("Legal_MCQs.json")
-        full_bank["Finance & Account, Budget and Audit Profession"] = load_questions_by_filename("Accounting_MCQs.json")
-        full_bank["Architectural Profession"] = load_questions_by_filename("Architecture.json")
-        full_bank["Information and Communication Technology Profession"] = load_questions_by_filename("ICT.json")
-        full_bank["General Mock Test for All"] = load_questions_by_filename("GMT.json")
-        full_bank["Surveying Profession"] = load_questions_by_filename("Surveying.json")
-        full_bank["Journalism Profession"] = load_questions_by_filename("Journalism.json")
-        full_bank["Public Relations Profession"] = load_questions_by_filename("Public Relations.json")
-        full_bank["Guidance & Counselling and Librarianship Professions"] = load_questions_by_filename("Guidance_Library_MCQs.json")
-        full_bank["Community & Public Health Profession"] = load_questions_by_filename("Community_Public_Health_MCQs.json")
-        full_bank["Environmental & Utilities Profession"] = load_questions_by_filename("Environment_Utilities_MCQs.json")
-        full_bank["Compliance/Regulatory Profession"] = load_questions_by_filename("Compliance_Regulatory_MCQs.json")
-        full_bank["Planning, Research & Statistics (PRS) Profession"] = load_questions_by_filename("Planning_Research_Statistics_MCQs.json")
-        full_bank["Protocol & Liaison, Public Affairs and Customer Service Profession"] = load_questions_by_filename("Protocol_PublicAffairs_CustomerService_MCQs.json")
-
-        return full_bank
+        return LazyQuestionBank()
+
+    @property
+    def exam_plans(self):
+        """Built-in + assets/blueprints/*.json exam plans, compiled against the current subject list."""
+        subjects = tuple(self.full_question_bank)
+        if self._exam_plans is None or subjects != self._plan_subjects:
+            weights = load_weights(find_asset(SIMULATION_WEIGHTS_FILE))
+            self._exam_plans = load_plans(subjects, weights)
+            self._plan_subjects = subjects
+        return self._exam_plans
+
+    def _apply_bank_updates(self):
+        """Between exams: swap in re-parsed subjects and restart only their rotation."""
+        if self._bank_watcher is None:
+            return
+        reloaded = self._bank_watcher.apply_pending()
+        if reloaded:
+            self._exam_plans = None     # recompiled on next use against the updated bank
+        for subject in reloaded:
+            self.question_sampler.reset(subject)
+        self.search_index.refresh(reloaded)
 
     # ---------- Login Page ----------
+    @metrics.timed("screen")
     def show_login_page(self):
         self._bind_close_to_default()
-        self.clear_widgets()
+        self._show_screen("login", self._build_login_screen)
+        self.name_entry.focus_set()
 
+        # Warm the remaining subjects while the candidate types their name
+        try:
+            self.full_question_bank.prefetch()
+        except AttributeError:
+            pass
+        if self._bank_watcher is not None:
+            self._bank_watcher.start()
+        self.search_index.build_async()
+
+    def _build_login_screen(self, screen):
         # Centered minimal box
-        box = tk.Frame(self, bd=2, relief="groove", padx=20, pady=20)
+        box = tk.Frame(screen, bd=2, relief="groove", padx=20, pady=20)
         box.place(relx=0.5, rely=0.5, anchor="center")
 
         tk.Label(box, text="Enter Your Full Name (for Practice Purpose):", font=BASE_FONT_BOLD).pack(pady=(0, 10))
         self.name_entry = tk.Entry(box, font=BASE_FONT, width=40)
         self.name_entry.pack(pady=(0, 10))
-        self.name_entry.focus_set()
 
         # Instruction lines
         tk.Label(
@@ -676,16 +584,17 @@ class GO_CBT_App(tk.Frame):
             messagebox.showwarning("Input Required", "Please enter your full name to continue.")
             return
         self.student_name = name
+        self.question_sampler.use_state(RotationState.for_candidate(name))
+        self.question_stats = QuestionStats.for_candidate(name)
         self.show_subject_selection()
 
     # ---------- Subject Selection ----------
+    @metrics.timed("screen")
     def show_subject_selection(self):
         self._bind_close_to_default()
-        self.clear_widgets()
-        select_frame = tk.Frame(self)
-        select_frame.pack(fill="both", expand=True, padx=20, pady=20)
-
-        welcome_msg = (
+        self._apply_bank_updates()
+        self._show_screen("subjects", self._build_subject_screen)
+        self.welcome_label.config(text=(
             f"Welcome {self.student_name}\n"
             "Below are subjects like Current Affairs, Leadership, Computer Knowledge, Psychometrics, Financial Regulations, Public Procurement, Civil Service Reforms and Policies, FCSSIP-25, "
             "CBN and Monetary Policy, FCTA & Its Operations, Public Service Rules, Code of Conduct, Comprehensive Competency Framework, Nigerian Tax, "
@@ -693,12 +602,21 @@ class GO_CBT_App(tk.Frame):
             "Select your subject from the list and click Load Selected Subject or Simply double-click on any subject in the list to open it.\n"
             "OR\n"
             "Click LOAD SIMULATION EXAM for a mixed 100 questions across subjects excluding Professional Questions:\n"
-        )
+        ))
+        # Subjects can come and go with a hot reload; the list is only refilled when they do
+        subjects = sorted(self.full_question_bank.keys())
+        if subjects != self._all_subjects_sorted:
+            self._all_subjects_sorted = subjects
+            self._apply_subject_filter()
+
+    def _build_subject_screen(self, screen):
+        select_frame = tk.Frame(screen)
+        select_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
         # ---- Dynamic wrap label (fits window width) ----
-        label = tk.Label(
+        label = self.welcome_label = tk.Label(
             select_frame,
-            text=welcome_msg,
+            text="",
             font=BASE_FONT_BOLD,
             justify="left",
             wraplength=1  # temporary; will be set after layout & on resize
@@ -737,19 +655,23 @@ class GO_CBT_App(tk.Frame):
         self.subject_listbox.pack(side="left", fill="both", expand=True)
         yscroll.pack(side="right", fill="y")
 
-        # Cache & populate subjects
-        self._all_subjects_sorted = sorted(self.full_question_bank.keys())
-        for subj in self._all_subjects_sorted:
-            self.subject_listbox.insert("end", subj)
+        # Filled by show_subject_selection()
+        self._all_subjects_sorted = []
 
-        # Live filter
-        def _apply_subject_filter(*_):
-            q = (self.subject_search_var.get() or "").strip().lower()
-            self.subject_listbox.delete(0, "end")
-            for subj in self._all_subjects_sorted:
-                if q in subj.lower():
-                    self.subject_listbox.insert("end", subj)
-        self.subject_search_var.trace_add("write", _apply_subject_filter)
+        # ---- Matching questions (full-text search across every bank) ----
+        match_frame = tk.Frame(select_frame)
+        match_frame.pack(fill="x", pady=(0, 8))
+        self.match_count_label = tk.Label(match_frame, text="", font=BASE_FONT, anchor="w")
+        self.match_count_label.pack(fill="x")
+        self.match_listbox = tk.Listbox(match_frame, font=BASE_FONT, height=6, activestyle="none")
+        self.match_listbox.pack(fill="x")
+        self._search_refs = []
+        custom_btn = tk.Button(match_frame, text="Start Custom Exam from Matches", font=BASE_FONT_BOLD,
+                               command=self.load_custom_exam)
+        custom_btn.pack(anchor="e", pady=(4, 0))
+
+        # Live filter: subject names + question text (index answers in a few ms per keystroke)
+        self.subject_search_var.trace_add("write", self._apply_subject_filter)
 
         # Double-click to load
         def _on_double_click(event):
@@ -764,11 +686,87 @@ class GO_CBT_App(tk.Frame):
                              font=BASE_FONT_BOLD, command=self.load_selected_subject)
         load_btn.pack(side="left", padx=8)
 
-        load_sim_btn = tk.Button(btns, text="Load Simulation Exam (Mixed 100 Questions)",
+        sim_total = self.exam_plans["simulation"].total
+        load_sim_btn = tk.Button(btns, text=f"Load Simulation Exam (Mixed {sim_total} Questions)",
                                  font=BASE_FONT_BOLD, bg="#007acc", fg="white",
                                  command=self.load_simulation_exam)
         load_sim_btn.pack(side="left", padx=8)
 
+        adaptive_btn = tk.Button(btns, text="Adaptive Practice (Weak Areas + Review)",
+                                 font=BASE_FONT_BOLD, command=self.load_adaptive_practice)
+        adaptive_btn.pack(side="left", padx=8)
+
+        # ---- Blueprint exams (assets/blueprints/*.json), e.g. promotion-exam mocks ----
+        extra = [p for bid, p in self.exam_plans.items() if bid not in ("subject_practice", "simulation")]
+        if extra:
+            bp_frame = tk.Frame(select_frame)
+            bp_frame.pack(pady=(4, 0))
+            tk.Label(bp_frame, text="Blueprint exam:", font=BASE_FONT).pack(side="left")
+            names = [f"{p.name} ({p.total} Q, {p.duration // 60} min)" for p in extra]
+            bp_combo = ttk.Combobox(bp_frame, values=names, state="readonly", font=BASE_FONT, width=45)
+            bp_combo.current(0)
+            bp_combo.pack(side="left", padx=8)
+            tk.Button(bp_frame, text="Start Blueprint Exam", font=BASE_FONT_BOLD,
+                      command=lambda: self.load_blueprint_exam(extra[bp_combo.current()].id)
+                      ).pack(side="left", padx=8)
+
+    def _apply_subject_filter(self, *_):
+        raw = self.subject_search_var.get() or ""
+        q = raw.strip().lower()
+        self.subject_listbox.delete(0, "end")
+        for subj in self._all_subjects_sorted:
+            if q in subj.lower():
+                self.subject_listbox.insert("end", subj)
+        self._update_question_matches(raw)
+
+    def _update_question_matches(self, query, shown=50):
+        self.match_listbox.delete(0, "end")
+        if len(query.strip()) < 3:
+            self._search_refs = []
+            self.match_count_label.config(text="")
+            return
+        refs, total, capped = self.search_index.search(query)
+        refs = self._valid_refs(refs)
+        self._search_refs = refs
+        bank = self.full_question_bank
+        self.match_listbox.insert("end", *(f"{s} — {bank[s][i]['question'][:110]}" for s, i in refs[:shown]))
+        note = "" if self.search_index.ready() else " (still indexing…)"
+        if capped:
+            note += " (keep typing to narrow the last word)"
+        self.match_count_label.config(text=f"{total}{'+' if capped else ''} matching question(s){note}")
+
+    def _valid_refs(self, refs):
+        """Drop (subject, index) refs that the current bank no longer has (e.g. mid hot reload)."""
+        bank = self.full_question_bank
+        return [(s, i) for s, i in refs if s in bank and 0 <= i < len(bank[s])]
+
+    def load_custom_exam(self):
+        """Exam made of the current search matches (a random subset if there are more than fit)."""
+        if not getattr(self, "_search_refs", None):
+            messagebox.showwarning("No Matches", "Type at least 3 letters to find questions first.")
+            return
+        query = (self.subject_search_var.get() or "").strip()
+        # swap in reloaded subjects first, so the refs below index the bank the exam uses
+        self._apply_bank_updates()
+        refs, _, _ = self.search_index.search(query, limit=1 << 30)   # every match, not just the shown ones
+        refs = self._valid_refs(refs)
+        if not refs:
+            messagebox.showwarning("No Matches", "No questions match this search any more; try again in a moment.")
+            return
+        plan = self.exam_plans["subject_practice"]
+        if len(refs) > plan.total:
+            refs = random.sample(refs, plan.total)
+        else:
+            random.shuffle(refs)
+        bank = self.full_question_bank
+        self.exam_duration = plan.duration
+        self.current_subject = f"Custom Exam: {query}"[:80]
+        self.questions[self.current_subject] = plan.arrange_options(bank[s][i] for s, i in refs)
+        self.question_refs[self.current_subject] = refs
+        self.answers[self.current_subject] = [None] * len(refs)
+        self.current_question_index = 0
+        self.begin_exam()
+
     def load_selected_subject(self):
         # Prefer Listbox selection if present
         if hasattr(self, "subject_listbox") and self.subject_listbox.size() > 0:
@@ -784,26 +782,105 @@ class GO_CBT_App(tk.Frame):
         self.load_questions_for_subject(subject)
 
     def load_simulation_exam(self):
-        all_questions = []
-        for subject, qlist in self.full_question_bank.items():
-            # Skip any subject that ends with "Profession"
-            if subject.strip().lower().endswith("profession"):
-                continue
-            all_questions.extend(qlist)
-
-        if len(all_questions) < 100:
-            messagebox.showerror("Activation required", "Your GO CBT APP license is not active on this PC. Click OK to open the purchase page for simulation exam.")
+        self._apply_bank_updates()
+        # Simulation blueprint: non-"Profession" subjects, stratified per subject (weights
+        # from assets/simulation_weights.json, else by bank size). The seed reproduces it.
+        self._start_planned_exam(self.exam_plans["simulation"], "Simulation Exam",
+            "Your GO CBT APP license is not active on this PC. Click OK to open the purchase page for simulation exam.",
+            shortage_title="Activation required")
+
+    def load_blueprint_exam(self, plan_id):
+        self._apply_bank_updates()
+        plan = self.exam_plans.get(plan_id)
+        if plan is None:
+            messagebox.showwarning("Invalid Selection", "That exam blueprint is not available.")
             return
+        self._start_planned_exam(plan, plan.name,
+            f"Not enough questions are available for {plan.name}.")
 
-        random.shuffle(all_questions)
-        self.current_subject = "Simulation Exam"
-        self.questions[self.current_subject] = all_questions[:100]
-        self.answers[self.current_subject] = [None] * 100
+    def _start_planned_exam(self, plan, title, shortage_msg, shortage_title="Not Enough Questions"):
+        """Assemble `plan` (duplicates skipped, unserved questions first) and open the exam."""
+        if plan.available(self.full_question_bank) < plan.total:
+            messagebox.showerror(shortage_title, shortage_msg)
+            return
+        # Questions this candidate has already been served are drawn last, and the
+        # picks are recorded in the same rotation state as subject practice.
+        env_seed = os.environ.get("GOCBT_SIM_SEED", "").strip()
+        served_now, refs = {}, []
+        picked, seed = plan.assemble(
+            self.full_question_bank,
+            seed=int(env_seed) if env_seed.isdigit() else None,
+            key=duplicate_key,
+            served=self.question_sampler.is_served,
+            on_pick=lambda s, i: served_now.setdefault(s, []).append(i),
+            refs=refs,
+        )
+        for subject, indices in served_now.items():
+            self.question_sampler.mark_served(subject, indices)
+        self.question_sampler.flush()
+        self.exam_seeds[title] = seed
+        print(f"[INFO] {title} seed={seed}")
+        metrics.record("exam", name=plan.id, title=title, seed=seed, count=len(picked))
+        self.exam_duration = plan.duration
+        self.current_subject = title
+        self.questions[self.current_subject] = picked
+        self.question_refs[self.current_subject] = refs
+        self.answers[self.current_subject] = [None] * len(picked)
         self.current_question_index = 0
-        self.show_exam_window()
+        self.begin_exam()
         
+    def load_adaptive_practice(self):
+        """
+        Practice picked from this candidate's history: missed / due questions come back
+        (Leitner boxes), the rest are fresh questions weighted towards weak subjects.
+        """
+        self._apply_bank_updates()
+        stats = self.question_stats or QuestionStats(None)
+        bank = self.full_question_bank
+        subjects = [s for s in bank if not s.strip().lower().endswith("profession") or s in stats.subjects]
+        plan = self.exam_plans["subject_practice"]
+        picked, refs = pick_adaptive(bank, stats, self.question_sampler, subjects, plan.total)
+        if not picked:
+            messagebox.showerror("Activation required", "Your GO CBT APP license is not active on this PC. Click OK to open the purchase page.")
+            return
+        self.question_sampler.flush()
+        self.exam_duration = plan.duration
+        self.current_subject = "Adaptive Practice"
+        self.questions[self.current_subject] = plan.arrange_options(picked)
+        self.question_refs[self.current_subject] = refs
+        self.answers[self.current_subject] = [None] * len(picked)
+        self.current_question_index = 0
+        self.begin_exam()
+
+    def _record_exam_stats(self):
+        """Feed the finished exam into the candidate's per-question history."""
+        stats = self.question_stats
+        refs = self.question_refs.pop(self.current_subject, None)   # once per exam
+        if stats is None or not refs:
+            return
+        try:
+            stats.record_exam(refs, self.questions.get(self.current_subject, []),
+                              self.answers.get(self.current_subject, []))
+            stats.save()
+        except Exception as e:
+            print(f"[WARN] Could not record question stats: {e}")
+
     def audit_loaded_subjects(app):
         print("\n=== GO CBT Question Bank Audit ===")
+        # Prefer the report compile_assets.py wrote at build time (no need to load every subject)
+        try:
+            from compile_assets import load_audit
+            audit = load_audit()
+        except Exception:
+            audit = None
+        if audit:
+            for s in audit.get("subjects", []):
+                print(f"{s['subject']}: total={s['kept']}, forced_a={s['forced_a']}, "
+                      f"skipped={s['skipped']}, duplicates={s['duplicates']}")
+            for m in audit.get("missing", []):
+                print(f"{m['subject']}: missing ({m['file']})")
+            print(f"=== Audit Complete (compiled {audit.get('generated', '?')}) ===\n")
+            return
         for subj, qlist in app.full_question_bank.items():
             total = len(qlist)
             bad = 0
@@ -816,40 +893,40 @@ class GO_CBT_App(tk.Frame):
         print("=== Audit Complete ===\n")
 
     def load_questions_for_subject(self, subject):
+        self._apply_bank_updates()
         self.current_subject = subject
 
-        questions_pool = self.shuffled_question_bank.get(subject, [])
-        if len(questions_pool) == 0:
+        plan = self.exam_plans["subject_practice"]
+        window = self.question_sampler.next_window(subject, plan.total)
+        if len(window) == 0:
             messagebox.showerror("Activation required", "Your GO CBT APP license is not active on this PC. Click OK to open the purchase page.")
             return
 
-        start_index = self.cycle_start_indices.get(subject, 0)
-        if start_index + 100 > len(questions_pool):
-            selected = questions_pool[start_index:] + questions_pool[:(start_index + 100) % len(questions_pool)]
-            self.cycle_start_indices[subject] = (start_index + 100) % len(questions_pool)
-        else:
-            selected = questions_pool[start_index:start_index + 100]
-            self.cycle_start_indices[subject] = start_index + 100
-
+        self.question_sampler.flush()
+        bank = self.full_question_bank[subject]
+        selected = plan.arrange_options(bank[i] for i in window)
+        self.question_refs[subject] = [(subject, i) for i in window]
+        self.exam_duration = plan.duration
         self.questions[subject] = selected
         self.answers[subject] = [None] * len(selected)
         self.current_question_index = 0
 
-        self.show_exam_window()
+        self.begin_exam()
 
     # ---------- Background handling for Exam Window ----------
-    def _setup_exam_background(self):
+    @metrics.timed("background")
+    def _setup_exam_background(self, parent=None):
         """
-        Create/refresh the background image for the exam window.
+        Create/refresh the background image for the exam window (drawn under `parent`,
+        the exam screen; defaults to the main frame).
         - Looks up assets/exam_bg.(png|jpg), cbt_bg.(png|jpg), or bg.(png|jpg)
-        - Resizes with Pillow on window <Configure>
-        - Keeps references to avoid GC
+        - bg_renderer.BackgroundRenderer decodes it once, follows <Configure> with a
+          debounced, size-bucketed render (quick preview while dragging, LANCZOS after)
         - Falls back to a friendly solid color if not found/failed
         """
-        import os, tkinter as tk
         from path_utils import asset_path
 
-        parent = self  # draw under the main frame
+        parent = parent or self
 
         # 1) Candidate files in assets/
         candidates = ["exam_bg.jpg", "exam_bg.png", "cbt_bg.jpg", "cbt_bg.png", "bg.jpg", "bg.png"]
@@ -860,115 +937,71 @@ class GO_CBT_App(tk.Frame):
                 bg_path = p
                 break
 
-        # 2) No image -> remove label and use a soft color
-        if not bg_path:
-            try:
-                if getattr(self, "_bg_label", None) and self._bg_label.winfo_exists():
-                    self._bg_label.destroy()
-            except Exception:
-                pass
-            self._bg_label = None
-            self._bg_src = None
-            self._bg_tk = None
-            try:
-                self.configure(bg="#e9f3ff")
-            except Exception:
-                pass
-            return
-
-        # 3) Ensure a background label exists
-        if getattr(self, "_bg_label", None) is None or not self._bg_label.winfo_exists():
-            self._bg_label = tk.Label(parent, bd=0, highlightthickness=0)
-            self._bg_label.place(relx=0, rely=0, relwidth=1, relheight=1)
+        if getattr(self, "_bg_renderer", None) is not None:
+            self._bg_renderer.detach()
+            self._bg_renderer = None
 
-        # 4) Load source image
-        try:
-            self._bg_src = Image.open(bg_path).convert("RGBA")
-        except Exception:
+        # 2) No image (or undecodable) -> remove label and use a soft color
+        if not bg_path or load_bg_source(bg_path) is None:
             try:
                 if getattr(self, "_bg_label", None) and self._bg_label.winfo_exists():
                     self._bg_label.destroy()
             except Exception:
                 pass
             self._bg_label = None
-            self._bg_src = None
-            self._bg_tk = None
             try:
-                self.configure(bg="#e9f3ff")
+                parent.configure(bg="#e9f3ff")
             except Exception:
                 pass
             return
 
-        # 5) Render current size
-        w = max(1, parent.winfo_width() or 1)
-        h = max(1, parent.winfo_height() or 1)
-        try:
-            img = self._bg_src.resize((w, h), RESAMPLE_FILTER)
-        except Exception:
-            img = self._bg_src
-        self._bg_tk = ImageTk.PhotoImage(img)
-
+        # 3) Ensure a background label exists, behind the content
         if getattr(self, "_bg_label", None) is None or not self._bg_label.winfo_exists():
             self._bg_label = tk.Label(parent, bd=0, highlightthickness=0)
             self._bg_label.place(relx=0, rely=0, relwidth=1, relheight=1)
-
         try:
-            self._bg_label.configure(image=self._bg_tk)
-            self._bg_label.image = self._bg_tk   # keep reference
-            self._bg_label.lower()               # behind content
+            self._bg_label.lower()
         except Exception:
             pass
 
-        # 6) Bind resize (replace any existing binding)
-        try:
-            if hasattr(self, "_bg_bind_id") and self._bg_bind_id:
-                try:
-                    self.unbind("<Configure>", self._bg_bind_id)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
-        def _on_resize(evt):
-            if not getattr(self, "_bg_label", None) or not self._bg_label.winfo_exists():
-                return
-            if not getattr(self, "_bg_src", None):
-                return
-            if evt.width <= 1 or evt.height <= 1:
-                return
-            try:
-                img2 = self._bg_src.resize((evt.width, evt.height), RESAMPLE_FILTER)
-                self._bg_tk = ImageTk.PhotoImage(img2)
-                if self._bg_label and self._bg_label.winfo_exists():
-                    self._bg_label.configure(image=self._bg_tk)
-                    self._bg_label.image = self._bg_tk
-            except Exception:
-                pass
-
-        try:
-            self._bg_bind_id = self.bind("<Configure>", _on_resize)
-        except Exception:
-            pass
+        # 4) Render at the current size now and follow resizes
+        self._bg_renderer = BackgroundRenderer(self._bg_label, bg_path)
+        self._bg_renderer.attach(parent)
 
     # ---------- Exam Window ----------
+    def begin_exam(self):
+        """Open a freshly loaded exam: show it, then start its clock from the blueprint duration."""
+        self.show_exam_window()
+        self.start_timer(self.exam_duration)
+
+    @metrics.timed("screen")
     def show_exam_window(self):
-        self._setup_exam_background()
-    # ... then create/pack your content frames on top
+        """
+        Raise the exam screen and bind it to the current exam. Only data is rebound
+        (student, number grid size, current question); the running clock is left alone,
+        so coming back from the review page does not restart it.
+        """
         self._bind_close_to_default()
-        self.clear_widgets()
+        self._show_screen("exam", self._build_exam_screen)
+        self.student_label.config(text=f"Student: {self.student_name}")
+        self.navigator.reset(len(self.questions.get(self.current_subject, [])),
+                             self.answers.get(self.current_subject, ()))
+        self.load_question(self.current_question_index)
 
-        # Background image
-        self._setup_exam_background()
+    def _build_exam_screen(self, screen):
+        # Background image (once; it follows the screen's size)
+        self._setup_exam_background(screen)
 
         # --- Main content frame ---
-        content_frame = tk.Frame(self)
+        content_frame = tk.Frame(screen)
         content_frame.pack(fill="both", expand=True, padx=40, pady=20)
 
         header = tk.Frame(content_frame, bg=NAV_BAR_COLOR)
         header.pack(fill="x")
 
-        tk.Label(header, text=f"Student: {self.student_name}", fg="white", bg=NAV_BAR_COLOR,
-                 font=BASE_FONT_BOLD).pack(side="left", padx=20, pady=10)
+        self.student_label = tk.Label(header, text="", fg="white", bg=NAV_BAR_COLOR,
+                                      font=BASE_FONT_BOLD)
+        self.student_label.pack(side="left", padx=20, pady=10)
         submit_btn = tk.Button(header, text="Submit", command=self.confirm_submit,
                                font=BASE_FONT, width=12)
         submit_btn.pack(side="right", padx=(0, 10), pady=10)
@@ -976,8 +1009,6 @@ class GO_CBT_App(tk.Frame):
                                     font=BASE_FONT_BOLD)
         self.timer_label.pack(side="right", padx=20, pady=10)
 
-        self.start_timer(3600)  # 1 hour
-
         # --- Question display area ---
         self.question_area = tk.Frame(content_frame)
         self.question_area.pack(pady=20, fill="both", expand=True)
@@ -992,7 +1023,6 @@ class GO_CBT_App(tk.Frame):
         )
         self.question_text_label.pack(anchor="w", padx=30, pady=(0, 30))
 
-        self.selected_option = tk.StringVar()
         self.option_rbs = {}
         for opt in ['A', 'B', 'C', 'D']:
             rb = tk.Radiobutton(
@@ -1003,7 +1033,6 @@ class GO_CBT_App(tk.Frame):
             rb.pack(anchor="w", padx=20, pady=8)
             self.option_rbs[opt] = rb
 
-        
         # --- Nav bar (TOP) — keep frame; WITH Prev/Next buttons ---
         nav_frame_top = tk.Frame(content_frame, bg=NAV_BAR_COLOR)
         nav_frame_top.pack(pady=10, fill='x', expand=True)
@@ -1020,25 +1049,12 @@ class GO_CBT_App(tk.Frame):
         tk.Button(button_container_top, text="Next", command=self.next_question,
                   font=BASE_FONT, width=10).pack(side="left", padx=20, pady=8)
 
-        # --- Number grid (1..N) ---
-
+        # --- Number grid (1..N); reset per exam, repainted cell by cell ---
         nav_buttons_outer = tk.Frame(content_frame)
         nav_buttons_outer.pack(pady=10)
-        self.nav_buttons_frame = tk.Frame(nav_buttons_outer)
-        self.nav_buttons_frame.pack()
-
-        q_count = len(self.questions.get(self.current_subject, []))
-        cols = 25
-        self.nav_buttons = []
-        for i in range(q_count):
-            row = i // cols
-            col = i % cols
-            btn = tk.Button(self.nav_buttons_frame, text=str(i + 1), width=3, font=BASE_FONT,
-                            command=lambda i=i: self.go_to_question(i))
-            btn.grid(row=row, column=col, padx=2, pady=2)
-            self.nav_buttons.append(btn)
-        for c in range(cols):
-            self.nav_buttons_frame.grid_columnconfigure(c, weight=1)
+        self.navigator = QuestionNavigator(nav_buttons_outer, self.go_to_question,
+                                           cols=NAV_GRID_COLUMNS, font=BASE_FONT)
+        self.navigator.pack()
 
         # --- Nav bar (BOTTOM) — keep frame; no Prev/Next buttons ---
         nav_frame_bottom = tk.Frame(content_frame, bg=NAV_BAR_COLOR)
@@ -1051,9 +1067,6 @@ class GO_CBT_App(tk.Frame):
             button_container_bottom.configure(height=NAV_BAR_FIXED_HEIGHT)
             button_container_bottom.pack_propagate(False)
 
-        # Finally show Q1
-        self.load_question(self.current_question_index)
-
     # ---------- Answer storage ----------
     def _initialize_empty_answers(self):
         self.answers = {}
@@ -1078,6 +1091,8 @@ class GO_CBT_App(tk.Frame):
         if selected == "":
             selected = None
         self.answers[self.current_subject][self.current_question_index] = selected
+        if self.navigator is not None:
+            self.navigator.set_answered(self.current_question_index, selected is not None)
 
     def load_question(self, index):
         q_list = self.questions.get(self.current_subject, [])
@@ -1096,46 +1111,35 @@ class GO_CBT_App(tk.Frame):
         self.update_nav_buttons()
 
     def update_nav_buttons(self):
-        q_count = len(self.questions[self.current_subject])
-        for i in range(q_count):
-            btn = self.nav_buttons[i]
-            answer = self.answers[self.current_subject][i]
-            if i == self.current_question_index:
-                btn.config(bg="#0000ff", fg="white")
-            elif answer is not None and answer != "":
-                btn.config(bg="#008000", fg="white")
-            else:
-                btn.config(bg="#ff0000", fg="white")
+        # Answered cells are updated by save_current_answer(); here only the
+        # previous and the new current cell are repainted
+        self.navigator.set_current(self.current_question_index)
 
+    # Navigation runs synchronously inside the click handler, so there is no window for a
+    # second click to sneak in: no disable/enable pass over the widgets per step.
     def next_question(self):
         try:
-            self.disable_all_buttons()
             self.save_current_answer()
             if self.current_question_index < len(self.questions[self.current_subject]) - 1:
                 self.current_question_index += 1
                 self.load_question(self.current_question_index)
-            self.enable_all_buttons()
         except tk.TclError:
             pass
 
     def prev_question(self):
         try:
-            self.disable_all_buttons()
             self.save_current_answer()
             if self.current_question_index > 0:
                 self.current_question_index -= 1
                 self.load_question(self.current_question_index)
-            self.enable_all_buttons()
         except tk.TclError:
             pass
 
     def go_to_question(self, index):
         try:
-            self.disable_all_buttons()
             self.save_current_answer()
             self.current_question_index = index
             self.load_question(index)
-            self.enable_all_buttons()
         except tk.TclError:
             pass
 
@@ -1146,22 +1150,16 @@ class GO_CBT_App(tk.Frame):
         import time
         self.exam_end_ts = time.time() + int(seconds)
         self.stop_timer()  # clear any old one
-        self._timer_after_id = self.after(1000, self.update_timer)
+        # One shared 1 s tick owned by the label: destroying the exam screen cancels it
+        self._timer_job = Scheduler.for_root(self).every(1000, self.update_timer, owner=self.timer_label)
+        self.update_timer()  # show the full time now
 
     def update_timer(self):
-        """Safe ticking timer; survives navigation and window closes."""
-        # Label guard
+        """One countdown tick (run every second by the root's Scheduler)."""
         lbl = getattr(self, "timer_label", None)
         if not lbl:
             self.stop_timer()
             return
-        try:
-            if not lbl.winfo_exists():
-                self.stop_timer()
-                return
-        except Exception:
-            self.stop_timer()
-            return
 
         # Compute remaining
         import time
@@ -1188,9 +1186,6 @@ class GO_CBT_App(tk.Frame):
                     pass
             return
 
-        # Tick again
-        self._timer_after_id = self.after(1000, self.update_timer)
-
     # ---------- Submission flow ----------
     def confirm_submit(self):
         try:
@@ -1209,65 +1204,58 @@ class GO_CBT_App(tk.Frame):
             pass
 
     # Review answers page (answered/unanswered only)
+    @metrics.timed("screen")
     def show_review_answers(self):
         self._bind_close_to_default()
         try:
             self.disable_all_buttons()
-            self.clear_widgets()
-            tk.Label(self, text=f"Review Answers for {self.student_name}", font=BASE_FONT_BOLD).pack(pady=10)
-
-            canvas = tk.Canvas(self)
-            scrollbar = tk.Scrollbar(self, orient="vertical", command=canvas.yview)
-            scrollable_frame = tk.Frame(canvas)
+            self._show_screen("review", self._build_review_screen)
+            self.review_title.config(text=f"Review Answers for {self.student_name}")
+            # Only the rows in view exist; they are re-filled from self.answers as they scroll in
+            self.review_list.see(0)
+            self.review_list.set_count(len(self.questions.get(self.current_subject, [])))
+            self.enable_all_buttons()
+        except tk.TclError:
+            pass
 
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
+    def _build_review_screen(self, screen):
+        self.review_title = tk.Label(screen, text="", font=BASE_FONT_BOLD)
+        self.review_title.pack(pady=10)
+
+        btn_frame = tk.Frame(screen)
+        btn_frame.pack(side="bottom", pady=20)
+        tk.Button(btn_frame, text="Confirm Final Submit", font=BASE_FONT, command=self.final_submit_confirmation).pack(side="left", padx=10)
+        tk.Button(btn_frame, text="Return to Exam", font=BASE_FONT, command=self.show_exam_window).pack(side="left", padx=10)
+
+        self._review_wrap = TextWrapper(BASE_FONT_BOLD)
+        self.review_list = VirtualList(
+            screen, REVIEW_ROW_HEIGHT,
+            make_row=lambda parent: ReviewRow(parent, self.go_to_question_from_review),
+            bind_row=self._bind_review_row,
+            row_height_of=self._review_row_height,
+        )
+        self.review_list.pack(fill="both", expand=True, padx=10)
 
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
+    def _review_lines(self, i):
+        q_list = self.questions.get(self.current_subject, [])
+        text = str(q_list[i].get("question") or "") if i < len(q_list) else ""
+        return self._review_wrap.lines(f"Q{i+1}: {text}", REVIEW_WRAP_PX)
 
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
+    def _review_row_height(self, i):
+        # the full question is shown: rows grow/shrink by a line from the two-line height
+        return REVIEW_ROW_HEIGHT + (len(self._review_lines(i)) - 2) * self._review_wrap.linespace
 
-            q_list = self.questions.get(self.current_subject, [])
-            for i, q in enumerate(q_list):
-                user_ans = self.answers[self.current_subject][i]
-                status = "Answered" if user_ans else "Unanswered"
-                ans_text = f"Your answer: {user_ans if user_ans else 'Not answered'}"
-
-                frame = tk.Frame(scrollable_frame, pady=5, padx=10, bg="#e0f7fa")
-                frame.pack(fill="x", pady=2, padx=10)
-
-                tk.Label(frame, text=f"Q{i+1}: {q.get('question')}", font=BASE_FONT_BOLD, wraplength=700,
-                         justify="left", bg="#e0f7fa").pack(anchor="w")
-                tk.Label(frame, text=ans_text, font=BASE_FONT, fg="blue", bg="#e0f7fa").pack(anchor="w", padx=10)
-                tk.Label(frame, text=f"Status: {status}", font=BASE_FONT_BOLD,
-                         fg="green" if status == "Answered" else "red", bg="#e0f7fa").pack(anchor="w", padx=10)
-
-                btn_text = f"Go to Question {i+1}"
-                btn = tk.Button(scrollable_frame, text=btn_text, font=BASE_FONT,
-                                command=lambda i=i: self.go_to_question_from_review(i))
-                btn.pack(fill="x", pady=2)
-
-            btn_frame = tk.Frame(self)
-            btn_frame.pack(pady=20)
-
-            tk.Button(btn_frame, text="Confirm Final Submit", font=BASE_FONT, command=self.final_submit_confirmation).pack(side="left", padx=10)
-            tk.Button(btn_frame, text="Return to Exam", font=BASE_FONT, command=self.show_exam_window).pack(side="left", padx=10)
-            self.enable_all_buttons()
-        except tk.TclError:
-            pass
+    def _bind_review_row(self, row, i):
+        q_list = self.questions.get(self.current_subject, [])
+        answers = self.answers.get(self.current_subject, [])
+        if i < len(q_list):
+            row.show(i, self._review_lines(i), answers[i] if i < len(answers) else None)
 
     def go_to_question_from_review(self, index):
         try:
             self.disable_all_buttons()
-            self.save_current_answer()
             self.current_question_index = index
-            self.clear_widgets()
-            self.show_exam_window()
-            self.load_question(index)
+            self.show_exam_window()   # raises the kept exam screen at `index`; the clock keeps running
             self.enable_all_buttons()
         except tk.TclError:
             pass
@@ -1287,9 +1275,8 @@ class GO_CBT_App(tk.Frame):
     def submit_exam(self):
         try:
             self.save_current_answer()
-            if self.timer_id:
-                self.after_cancel(self.timer_id)
-                self.timer_id = None
+            self.stop_timer()
+            self.exam_end_ts = None
 
             q_list = self.questions.get(self.current_subject, [])
             total = len(q_list)
@@ -1298,10 +1285,12 @@ class GO_CBT_App(tk.Frame):
             wrong = attempted - correct
             score_pct = (correct / total) * 100 if total > 0 else 0
 
+            self._record_exam_stats()
             self.show_results(total, attempted, correct, wrong, score_pct)
         except tk.TclError:
             pass
 
+    @metrics.timed("pdf")
     def export_results_to_pdf(self, total, attempted, correct, wrong, score_pct):
         """
         Export the current result summary to a PDF and open it.
@@ -1388,6 +1377,9 @@ class GO_CBT_App(tk.Frame):
             f"Wrong: {wrong}",
             f"Score: {score:.2f}%",
         ]
+        seed = getattr(self, "exam_seeds", {}).get(getattr(self, "current_subject", None))
+        if seed is not None:
+            details.append(f"Exam Seed: {seed}")
         for line in details:
             if y < bottom_margin:
                 c.showPage(); c.setFont("Helvetica", 14); y = height - top_margin
@@ -1439,62 +1431,87 @@ class GO_CBT_App(tk.Frame):
 
         return temp_pdf.name
 
+    @metrics.timed("screen")
     def show_results(self, total, attempted, correct, wrong, score_pct):
         # Bind CLOSE (X) to outro only while Results screen is visible
         self._bind_close_x_to(self.on_result_exit)
 
-        self.clear_widgets()
+        self._show_screen("results", self._build_results_screen)
+        self._result_summary = (total, attempted, correct, wrong, score_pct)
+        self.results_title.config(text=f"Exam Results for {self.student_name}")
+
+        # Prepare mentor comment text
+        mentor_comment = self.get_mentor_comment(score_pct)
+
+        # Data rows
+        data = [
+            self.student_name,
+            self.current_subject,
+            str(total),
+            str(attempted),
+            str(correct),
+            str(wrong),
+            f"{score_pct:.2f}",
+            mentor_comment,
+            "Gbenga O. Olabode",
+        ]
+        for lbl, value_text in zip(self._result_values, data):
+            lbl.config(text=value_text)
+        seed = self.exam_seeds.get(self.current_subject)
+        self.results_seed.config(text=f"Exam seed: {seed} (reproduces this question set)" if seed is not None else "")
 
+    def _build_results_screen(self, screen):
         # Title
-        tk.Label(self, text=f"Exam Results for {self.student_name}",
-                 font=("Arial", 20, "bold"), fg="green").pack(pady=20)
+        self.results_title = tk.Label(screen, text="", font=("Arial", 20, "bold"), fg="green")
+        self.results_title.pack(pady=20)
 
         # Table frame
-        table_frame = tk.Frame(self, bg="white", bd=4, relief="solid",
+        table_frame = tk.Frame(screen, bg="white", bd=4, relief="solid",
                                highlightbackground="green", highlightthickness=4)
         table_frame.pack(pady=10, padx=20, fill="x")
 
-        # Prepare mentor comment text
-        mentor_comment = self.get_mentor_comment(score_pct)
-
-        # Data rows
-        data = [
-            ("Name of Candidate:", self.student_name),
-            ("Subject Attempted:", self.current_subject),
-            ("Total Questions:", str(total)),
-            ("Attempted:", str(attempted)),
-            ("Correct:", str(correct)),
-            ("Wrong:", str(wrong)),
-            ("Score (%):", f"{score_pct:.2f}"),
-            ("Mentor's Comment:", mentor_comment),
-            ("Mentor:", "Gbenga O. Olabode"),
+        captions = [
+            "Name of Candidate:",
+            "Subject Attempted:",
+            "Total Questions:",
+            "Attempted:",
+            "Correct:",
+            "Wrong:",
+            "Score (%):",
+            "Mentor's Comment:",
+            "Mentor:",
         ]
 
-        for row_idx, (label_text, value_text) in enumerate(data):
+        self._result_values = []
+        for row_idx, label_text in enumerate(captions):
             left_lbl = tk.Label(table_frame, text=label_text, font=("Arial", 16, "bold"),
                                 fg="green", bg="white", borderwidth=1, relief="solid",
                                 anchor="w", padx=10, pady=5)
             left_lbl.grid(row=row_idx, column=0, sticky="ew", padx=1, pady=1)
 
-            right_lbl = tk.Label(table_frame, text=value_text, font=("Arial", 16),
+            right_lbl = tk.Label(table_frame, text="", font=("Arial", 16),
                                  fg="green", bg="white", borderwidth=1, relief="solid",
                                  anchor="w", padx=10, pady=5, justify="left", wraplength=750)
             right_lbl.grid(row=row_idx, column=1, sticky="ew", padx=1, pady=1)
+            self._result_values.append(right_lbl)
 
         table_frame.grid_columnconfigure(0, weight=1)
         table_frame.grid_columnconfigure(1, weight=2)
 
+        # Seed of a simulation/blueprint exam, so the paper can be audited later
+        self.results_seed = tk.Label(screen, text="", font=("Arial", 12), fg="green")
+        self.results_seed.pack()
+
         # Buttons (including Exit -> outro)
-        btn_frame = tk.Frame(self)
+        btn_frame = tk.Frame(screen)
         btn_frame.pack(pady=20)
 
         tk.Button(btn_frame, text="Review Answers", font=("Arial", 16),
                   command=self.show_score_details).pack(side="left", padx=10)
 
         tk.Button(btn_frame, text="Save/Print Results as PDF", font=("Arial", 16),
-                  command=lambda: self.export_results_to_pdf(
-                      total, attempted, correct, wrong, score_pct
-                  )).pack(side="left", padx=10)
+                  command=lambda: self.export_results_to_pdf(*self._result_summary)
+                  ).pack(side="left", padx=10)
 
         tk.Button(btn_frame, text="Restart Exam", font=("Arial", 16),
                   command=self.restart_exam).pack(side="left", padx=10)
@@ -1507,16 +1524,16 @@ class GO_CBT_App(tk.Frame):
         """Public hook: when user clicks 'Exit' or Close X on the Results screen."""
         self.show_goodbye_and_exit()
 
+    @metrics.timed("screen")
     def show_goodbye_and_exit(self):
         """Show branded outro (logo + thank-you GIF + message), then close app."""
         # While outro is visible, CLOSE (X) should simply close immediately to avoid loops
         self._bind_close_x_to(self.master.destroy)
 
-        self.clear_widgets()
-
         # Build and pack the goodbye screen; auto-closes in ~4s, or user can 'Exit Now'
-        goodbye = GoodbyeScreen(self, on_exit=self.master.destroy, auto_close_ms=4000)
-        goodbye.pack(fill="both", expand=True)
+        self._show_screen("goodbye", lambda screen: GoodbyeScreen(
+            screen, on_exit=self.master.destroy, auto_close_ms=4000).pack(fill="both", expand=True),
+            keep=False)
 
     def get_mentor_comment(self, score_pct: float) -> str:
         if score_pct >= 91:
@@ -1547,107 +1564,67 @@ class GO_CBT_App(tk.Frame):
             return ("The journey has started! You are a CBT “Believer”\n"
                     "You’ve tried. You can do it. Don’t give up—greatness starts here!")
 
+    @metrics.timed("screen")
     def show_score_details(self):
         self._bind_close_to_default()
-        self.clear_widgets()
-        tk.Label(self,
-                 text=f"Detailed Results for {self.student_name}",
-                 font=BASE_FONT_BOLD).pack(pady=10)
-
-        # Scrollable container
-        container = tk.Frame(self)
-        container.pack(fill="both", expand=True)
-
-        canvas = tk.Canvas(container)
-        vscroll = tk.Scrollbar(container, orient="vertical", command=canvas.yview)
-        canvas.configure(yscrollcommand=vscroll.set)
-
-        vscroll.pack(side="right", fill="y")
-        canvas.pack(side="left", fill="both", expand=True)
-
-        table = tk.Frame(canvas)
-        canvas.create_window((0, 0), window=table, anchor="nw")
-
-        def on_configure(event=None):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-        table.bind("<Configure>", lambda e: on_configure())
-
-        # Styles
-        header_style = dict(font=("Arial", 14, "bold"),
-                            bg="#e8f5e9", fg="#1b5e20",
-                            borderwidth=1, relief="solid",
-                            anchor="w", padx=8, pady=6)
-
-        # NOTE: no 'fg' here; we set it per cell
-        body_style   = dict(font=("Arial", 12),
-                            bg="white",
-                            borderwidth=1, relief="solid",
-                            anchor="w", padx=8, pady=6)
-        base_fg = "#1b5e20"
-
-        # Header row
-        headers = ["Question", "Your Answer", "Correct answer", "Correct answer text", "Status"]
-        for col, title in enumerate(headers):
-            tk.Label(table, text=title, **header_style).grid(row=0, column=col, sticky="nsew")
+        self._show_screen("details", self._build_score_details)
+        self.details_title.config(text=f"Detailed Results for {self.student_name}")
+        # Rows are wrapped, measured and drawn only as they scroll into view
+        self.details_table.set_count(len(self.questions.get(self.current_subject, [])))
 
-        # Column sizing
-        table.grid_columnconfigure(0, weight=5)  # Question
-        table.grid_columnconfigure(1, weight=1)  # Your Answer
-        table.grid_columnconfigure(2, weight=1)  # Correct letter
-        table.grid_columnconfigure(3, weight=4)  # Correct text
-        table.grid_columnconfigure(4, weight=1)  # Status
-
-        # Populate rows
-        q_list = self.questions.get(self.current_subject, [])
-        answers = self.answers.get(self.current_subject, [])
-
-        for idx, q in enumerate(q_list, start=1):
-            q_text = q.get("question", "")
-            options = q.get("options", {}) or {}
-            correct_letter = (q.get("correct") or "").strip()
-            correct_text = options.get(correct_letter, "")
-            user_letter = ((answers[idx-1] or "").strip()) if idx-1 < len(answers) else ""
-
-            if not user_letter:
-                status_text = "Unanswered"
-                status_fg = "#616161"  # gray
-            elif user_letter == correct_letter:
-                status_text = "Correct"
-                status_fg = "#1b5e20"  # green
-            else:
-                status_text = "Incorrect"
-                status_fg = "#b71c1c"  # red
-
-            # Cells (set fg explicitly)
-            tk.Label(table, text=f"{idx}. {q_text}", wraplength=750, justify="left",
-                     fg=base_fg, **body_style).grid(row=idx, column=0, sticky="nsew")
-            tk.Label(table, text=(user_letter or "—"),
-                     fg=base_fg, **body_style).grid(row=idx, column=1, sticky="nsew")
-            tk.Label(table, text=(correct_letter or "—"),
-                     fg=base_fg, **body_style).grid(row=idx, column=2, sticky="nsew")
-            tk.Label(table, text=(correct_text or "—"), wraplength=550, justify="left",
-                     fg=base_fg, **body_style).grid(row=idx, column=3, sticky="nsew")
-            tk.Label(table, text=status_text,
-                     fg=status_fg, **body_style).grid(row=idx, column=4, sticky="nsew")
+    def _build_score_details(self, screen):
+        self.details_title = tk.Label(screen, text="", font=BASE_FONT_BOLD)
+        self.details_title.pack(pady=10)
 
         # Buttons
-        btn_frame = tk.Frame(self)
-        btn_frame.pack(pady=12)
+        btn_frame = tk.Frame(screen)
+        btn_frame.pack(side="bottom", pady=12)
 
         tk.Button(btn_frame, text="Save Detailed Results as PDF", font=BASE_FONT,
                   command=self.export_detailed_results_to_pdf).pack(side="left", padx=10)
 
-        # Recompute summary for "Back to Results"
-        total = len(q_list)
-        attempted = sum(1 for a in answers if a)
-        correct = sum(1 for i, a in enumerate(answers) if a and a == q_list[i].get("correct"))
-        wrong = attempted - correct
-        score_pct = (correct / total * 100) if total else 0.0
-
+        # Summary of the same exam, kept by show_results()
         tk.Button(btn_frame, text="Back to Results", font=BASE_FONT,
-                  command=lambda: self.show_results(total, attempted, correct, wrong, score_pct))\
+                  command=lambda: self.show_results(*self._result_summary))\
           .pack(side="left", padx=10)
 
+        # Column sizing: Question 5, Your Answer 1, Correct letter 1, Correct text 4, Status 1
+        headers = [("Question", 5), ("Your Answer", 1), ("Correct answer", 1),
+                   ("Correct answer text", 4), ("Status", 1)]
+        self.details_table = VirtualTable(screen, headers, self._score_detail_cells,
+                                          font=("Arial", 12), header_font=("Arial", 14, "bold"))
+        self.details_table.pack(fill="both", expand=True)
+
+    def _score_detail_cells(self, i):
+        """(text, fg) for the five cells of question i in the detailed results table."""
+        base_fg = "#1b5e20"
+        q = self.questions.get(self.current_subject, [])[i]
+        answers = self.answers.get(self.current_subject, [])
+        q_text = q.get("question", "")
+        options = q.get("options", {}) or {}
+        correct_letter = (q.get("correct") or "").strip()
+        correct_text = options.get(correct_letter, "")
+        user_letter = ((answers[i] or "").strip()) if i < len(answers) else ""
+
+        if not user_letter:
+            status_text = "Unanswered"
+            status_fg = "#616161"  # gray
+        elif user_letter == correct_letter:
+            status_text = "Correct"
+            status_fg = "#1b5e20"  # green
+        else:
+            status_text = "Incorrect"
+            status_fg = "#b71c1c"  # red
+
+        return [
+            (f"{i + 1}. {q_text}", base_fg),
+            (user_letter or "—", base_fg),
+            (correct_letter or "—", base_fg),
+            (correct_text or "—", base_fg),
+            (status_text, status_fg),
+        ]
+
+    @metrics.timed("pdf")
     def export_detailed_results_to_pdf(self):
         """
         Save a detailed results PDF with columns:
@@ -1683,6 +1660,9 @@ class GO_CBT_App(tk.Frame):
         c.setTitle(f"Detailed Results - {safe_name}")
         c.setSubject(safe_subject)
         c.setCreator("GO CBT App")
+        seed = self.exam_seeds.get(self.current_subject)
+        if seed is not None:
+            c.setKeywords(f"seed={seed}")
 
         # ---- Layout constants ----
         left_margin   = 40
@@ -1716,8 +1696,9 @@ class GO_CBT_App(tk.Frame):
         # ---- Optional logo ----
         try:
             logo_path = resource_path("assets", "logo.png")
-            if os.path.exists(logo_path):
-                img = ImageReader(logo_path)
+            logo = get_image(logo_path, LOGO_BOXES["pdf"]) if os.path.exists(logo_path) else None
+            if logo is not None:
+                img = ImageReader(logo)
                 iw, ih = img.getSize()
                 target_w = 110
                 target_h = int(ih * (target_w / iw)) if iw else 0
@@ -1732,7 +1713,7 @@ class GO_CBT_App(tk.Frame):
         c.drawCentredString(width / 2, y, f"Detailed Results for {student_name}")
         y -= 20
         c.setFont(body_font, 11)
-        c.drawCentredString(width / 2, y, f"Subject: {subject}")
+        c.drawCentredString(width / 2, y, f"Subject: {subject}" + (f"    Exam seed: {seed}" if seed is not None else ""))
         y -= 24
 
         # --- Header row drawer (reused on new pages) ---
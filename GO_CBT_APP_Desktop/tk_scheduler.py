@@ -0,0 +1,217 @@
+# tk_scheduler.py — one timer service per Tk root instead of after() calls all over the app
+# - Scheduler.for_root(widget): the scheduler of that widget's root, created on first use
+# - call_later(ms, fn, owner) / every(ms, fn, owner): due times are snapped to a TICK_MS
+#   grid and periodic jobs are phase-aligned to their interval, so jobs that fall in the
+#   same slot (focus nudges from two windows, several 1 s refreshes) share one wake-up;
+#   the root never has more than one after() pending
+# - Jobs with an `owner` widget are cancelled when that widget is destroyed
+#   (cancel_owner() does the same by hand), so callbacks never hit dead widgets
+# - stats(): pending jobs and how late the event loop ran them (lateness is measured
+#   against the slot a job was scheduled for, i.e. it is event-loop lag, not grid rounding)
+
+import sys, time, heapq, itertools
+
+TICK_MS = 20        # scheduling grid; jobs due within one tick run together
+MAX_CATCHUP = 1     # periodic jobs that fell this many intervals behind skip ahead
+
+
+def _now_ms():
+    return time.monotonic() * 1000.0
+
+
+class Job:
+    """Handle returned by call_later()/every(); cancel() is safe to call more than once."""
+
+    __slots__ = ("fn", "interval", "owner", "due", "active", "_sched")
+
+    def __init__(self, sched, fn, interval, owner):
+        self._sched = sched
+        self.fn = fn
+        self.interval = interval    # ms for periodic jobs, None for one-shots
+        self.owner = owner
+        self.due = 0.0
+        self.active = True
+
+    def cancel(self):
+        self._sched.cancel(self)
+
+
+class Scheduler:
+    """
+    Single after() loop for a Tk root. Use Scheduler.for_root(widget) rather than
+    constructing one, so every window of the app shares the same ticks.
+    """
+
+    def __init__(self, root, tick_ms=TICK_MS):
+        self.root = root
+        self.tick_ms = max(1, int(tick_ms))
+        self._heap = []                 # (due, seq, job)
+        self._seq = itertools.count()
+        self._owners = {}               # widget path → set of jobs
+        self._bound = set()             # widget paths with our <Destroy> binding (bound once)
+        self._after_id = None
+        self._armed_for = None          # due time the pending after() was set for
+        self._ran = 0
+        self._late_sum = 0.0
+        self._late_max = 0.0
+        root.bind("<Destroy>", self._on_root_destroy, add="+")
+
+    @classmethod
+    def for_root(cls, widget):
+        root = widget._root()
+        sched = getattr(root, "_gocbt_scheduler", None)
+        if sched is None:
+            sched = root._gocbt_scheduler = cls(root)
+        return sched
+
+    # ---- scheduling ----
+    def _slot(self, t):
+        tick = self.tick_ms
+        return -(-t // tick) * tick
+
+    def call_later(self, ms, fn, owner=None):
+        """Run fn() once, about `ms` from now (never earlier)."""
+        job = Job(self, fn, None, owner)
+        self._push(job, self._slot(_now_ms() + max(0, ms)))
+        self._track(job)
+        return job
+
+    def every(self, ms, fn, owner=None):
+        """
+        Run fn() every `ms` until cancelled (or until `owner` is destroyed). Runs land on
+        multiples of `ms` (the first one may come sooner than `ms`), so periodic jobs with
+        the same interval tick together.
+        """
+        ms = max(self.tick_ms, int(ms))
+        job = Job(self, fn, ms, owner)
+        self._push(job, (_now_ms() // ms + 1) * ms)
+        self._track(job)
+        return job
+
+    def cancel(self, job):
+        if job is None or not job.active:
+            return
+        job.active = False
+        if job.owner is not None:
+            jobs = self._owners.get(str(job.owner))
+            if jobs is not None:
+                jobs.discard(job)
+                if not jobs:
+                    del self._owners[str(job.owner)]
+        # the heap entry is dropped lazily when it comes up
+
+    def cancel_owner(self, owner):
+        """Cancel every job owned by `owner`."""
+        for job in list(self._owners.get(str(owner), ())):
+            self.cancel(job)
+
+    def stats(self) -> dict:
+        ran = self._ran
+        return {
+            "pending": sum(1 for _, _, j in self._heap if j.active),
+            "periodic": sum(1 for _, _, j in self._heap if j.active and j.interval),
+            "ran": ran,
+            "late_avg_ms": round(self._late_sum / ran, 1) if ran else 0.0,
+            "late_max_ms": round(self._late_max, 1),
+        }
+
+    def reset_stats(self):
+        self._ran = 0
+        self._late_sum = self._late_max = 0.0
+
+    # ---- internals ----
+    def _track(self, job):
+        owner = job.owner
+        if owner is None:
+            return
+        key = str(owner)
+        self._owners.setdefault(key, set()).add(job)
+        if key not in self._bound:
+            try:
+                owner.bind("<Destroy>", lambda e, w=owner: self._on_owner_destroy(e, w), add="+")
+                self._bound.add(key)
+            except Exception:
+                pass
+
+    def _on_owner_destroy(self, evt, owner):
+        if evt.widget is not owner:
+            return      # a child's <Destroy> seen through a toplevel's bindtags
+        self.cancel_owner(owner)
+        self._bound.discard(str(owner))     # the path may be reused by a new widget
+
+    def _push(self, job, due):
+        job.due = due
+        heapq.heappush(self._heap, (due, next(self._seq), job))
+        self._arm()
+
+    def _arm(self):
+        heap = self._heap
+        while heap and not heap[0][2].active:
+            heapq.heappop(heap)
+        if not heap:
+            self._disarm()
+            return
+        due = heap[0][0]
+        if self._after_id is not None and self._armed_for <= due:
+            return
+        self._disarm()
+        delay = max(0, int(due - _now_ms() + 0.999))
+        try:
+            self._after_id = self.root.after(delay, self._fire)
+            self._armed_for = due
+        except Exception:       # root already gone
+            self._after_id = None
+
+    def _disarm(self):
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = self._armed_for = None
+
+    def _fire(self):
+        self._after_id = self._armed_for = None
+        now = _now_ms()
+        heap = self._heap
+        ready = []
+        while heap and heap[0][0] <= now + 0.5:
+            ready.append(heapq.heappop(heap)[2])
+        for job in ready:
+            if not job.active:
+                continue
+            late = max(0.0, now - job.due)
+            self._ran += 1
+            self._late_sum += late
+            if late > self._late_max:
+                self._late_max = late
+            self._run(job)
+            if job.active and job.interval:
+                due = job.due + job.interval
+                if due <= now - MAX_CATCHUP * job.interval:
+                    # the loop was blocked for whole intervals: skip ahead, don't burst
+                    due = -(-now // job.interval) * job.interval
+                heapq.heappush(heap, (due, next(self._seq), job))
+                job.due = due
+        self._arm()
+
+    def _run(self, job):
+        if job.interval is None:
+            self.cancel(job)
+        try:
+            job.fn()
+        except Exception:
+            try:
+                self.root.report_callback_exception(*sys.exc_info())
+            except Exception:
+                pass
+
+    def _on_root_destroy(self, evt):
+        if evt.widget is not self.root:
+            return
+        for _, _, job in self._heap:
+            job.active = False
+        self._heap.clear()
+        self._owners.clear()
+        self._bound.clear()
+        self._disarm()
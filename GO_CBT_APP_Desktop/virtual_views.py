@@ -0,0 +1,360 @@
+# virtual_views.py — scroll views that only materialize what is on screen
+# - VirtualList: rows of real widgets placed on a Canvas; only the rows in view (plus a
+#   small buffer) exist, and their widgets are recycled as the list scrolls, so a 100- or
+#   300-question review page costs ~15 rows of widgets, not 5 per question
+# - Rows are built by make_row(parent) and filled by bind_row(widget, index); the list
+#   never keeps data of its own. Rows are row_height px, or row_height_of(index) px when
+#   given (measured the first time a row scrolls near the view, like VirtualTable's)
+# - TextWrapper: word-wraps text to a pixel width with one font (per-word widths and
+#   wrapped lines are cached), so row heights are known before any widget exists
+# - VirtualTable: a read-only table drawn as rectangles + text items on one Canvas.
+#   Cells are word-wrapped by a TextWrapper, each row's height is measured the first
+#   time it scrolls near the view, and only the rows in view are drawn
+
+import bisect
+import tkinter as tk
+import tkinter.font as tkfont
+
+WHEEL_UNITS = 3     # scroll units per mouse-wheel notch
+
+
+class VirtualList:
+    """
+    A vertical list of `count` rows. Call set_count() when the data changes size,
+    refresh() when it changes in place, see(i) to jump to a row. With row_height_of,
+    rows are that many px (it must not depend on the list's width) and row_height is
+    only the estimate for rows not measured yet.
+    """
+
+    def __init__(self, parent, row_height, make_row, bind_row, buffer=2, row_height_of=None, **canvas_kw):
+        self.frame = tk.Frame(parent)
+        self.row_height = int(row_height)
+        self.buffer = buffer
+        self.count = 0
+        self._make_row = make_row
+        self._bind_row = bind_row
+        self._height_of = row_height_of or (lambda i: self.row_height)
+        self._slots = []        # [widget, canvas window id, bound index or -1]
+        self._by_index = {}
+        self._width = 1
+        self._tops = [0]        # y of row i; len = measured rows + 1
+        self._region = None
+
+        self.canvas = tk.Canvas(self.frame, highlightthickness=0,
+                                yscrollincrement=max(1, self.row_height // 2), **canvas_kw)
+        self._scrollbar = tk.Scrollbar(self.frame, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self._scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.bind("<Configure>", self._on_configure)
+        self._bind_wheel(self.canvas)
+
+    def pack(self, **kw):
+        self.frame.pack(**kw)
+
+    # ---- data ----
+    def set_count(self, count):
+        """New data: forget measured heights and rebind the rows in view."""
+        self.count = int(count)
+        self._tops = [0]
+        self._update_region()
+        self.refresh()
+
+    def refresh(self):
+        """Rebind every row in view (the data behind them changed)."""
+        for slot in self._slots:
+            slot[2] = -1
+        self._by_index.clear()
+        self._render()
+
+    def see(self, index):
+        """Scroll so that row `index` is at the top."""
+        index = max(0, min(index, self.count))
+        self._measure(rows=index)
+        self._update_region()
+        self.canvas.yview_moveto(self._tops[index] / max(1, self._total_height()))
+
+    # ---- row geometry ----
+    def _measure(self, y=0, rows=0):
+        """Measure rows until the top of the next one is past `y` and at least `rows` are known."""
+        tops, height_of = self._tops, self._height_of
+        while len(tops) <= self.count and (tops[-1] < y or len(tops) <= rows):
+            tops.append(tops[-1] + height_of(len(tops) - 1))
+
+    def _total_height(self):
+        measured = len(self._tops) - 1
+        avg = (self._tops[-1] / measured) if measured else self.row_height
+        return int(self._tops[-1] + (self.count - measured) * avg)
+
+    def _update_region(self):
+        region = (0, 0, self._width, self._total_height())
+        if region != self._region:    # only on change: a new region re-fires yscrollcommand
+            self._region = region
+            self.canvas.configure(scrollregion=region)
+
+    # ---- rendering ----
+    def _visible_range(self):
+        top = self.canvas.canvasy(0)
+        bottom = top + max(self.canvas.winfo_height(), self.row_height)
+        self._measure(y=bottom)
+        tops = self._tops
+        first = max(0, bisect.bisect_right(tops, top) - 1 - self.buffer)
+        last = bisect.bisect_left(tops, bottom) + self.buffer
+        self._measure(rows=last)
+        return first, min(last, len(tops) - 1)
+
+    def _render(self):
+        first, last = self._visible_range()
+        free = []
+        for slot in self._slots:
+            i = slot[2]
+            if not first <= i < last:
+                if i >= 0:
+                    del self._by_index[i]
+                    slot[2] = -1
+                free.append(slot)
+        cv = self.canvas
+        for i in range(first, last):
+            if i in self._by_index:
+                continue
+            slot = free.pop() if free else self._new_slot()
+            slot[2] = i
+            self._by_index[i] = slot
+            self._bind_row(slot[0], i)
+            cv.coords(slot[1], 0, self._tops[i])
+            cv.itemconfigure(slot[1], height=self._tops[i + 1] - self._tops[i], state="normal")
+        for slot in free:
+            cv.itemconfigure(slot[1], state="hidden")
+        self._update_region()
+
+    def _new_slot(self):
+        widget = self._make_row(self.canvas)
+        win = self.canvas.create_window(0, 0, window=widget, anchor="nw",
+                                        width=self._width, height=self.row_height)
+        self._bind_wheel(widget)
+        slot = [widget, win, -1]
+        self._slots.append(slot)
+        return slot
+
+    # ---- events ----
+    def _on_yscroll(self, first, last):
+        self._scrollbar.set(first, last)
+        self._render()
+
+    def _on_configure(self, evt):
+        if evt.width != self._width:
+            self._width = evt.width
+            for _, win, _ in self._slots:
+                self.canvas.itemconfigure(win, width=evt.width)
+        self._render()
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel, add="+")
+        widget.bind("<Button-4>", self._on_wheel, add="+")
+        widget.bind("<Button-5>", self._on_wheel, add="+")
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
+
+    def _on_wheel(self, evt):
+        up = getattr(evt, "num", 0) == 4 or getattr(evt, "delta", 0) > 0
+        self.canvas.yview_scroll(-WHEEL_UNITS if up else WHEEL_UNITS, "units")
+        return "break"
+
+
+class TextWrapper:
+    """Greedy word wrap of text to a pixel width in one font; results are cached."""
+
+    CACHE_MAX = 20000
+
+    def __init__(self, font):
+        self.font = font if isinstance(font, tkfont.Font) else tkfont.Font(font=font)
+        self.linespace = self.font.metrics("linespace")
+        self._word_w = {}
+        self._cache = {}
+
+    def _text_width(self, word):
+        w = self._word_w.get(word)
+        if w is None:
+            w = self._word_w[word] = self.font.measure(word)
+        return w
+
+    def lines(self, text, width):
+        """Tuple of the lines `text` wraps to at `width` px (explicit newlines kept)."""
+        key = (text, width)
+        lines = self._cache.get(key)
+        if lines is not None:
+            return lines
+        space = self._text_width(" ")
+        out = []
+        for para in str(text).split("\n"):
+            line, line_w = [], 0
+            for word in para.split():
+                w = self._text_width(word)
+                if line and line_w + space + w > width:
+                    out.append(" ".join(line))
+                    line, line_w = [], 0
+                if w > width and not line:
+                    # a single word wider than the column: break it by characters
+                    chunk = ""
+                    for ch in word:
+                        if chunk and self._text_width(chunk + ch) > width:
+                            out.append(chunk)
+                            chunk = ""
+                        chunk += ch
+                    word, w = chunk, self._text_width(chunk)
+                line.append(word)
+                line_w = w if len(line) == 1 else line_w + space + w
+            out.append(" ".join(line))
+        lines = tuple(out) or ("",)
+        if len(self._cache) >= self.CACHE_MAX:
+            self._cache.clear()
+        self._cache[key] = lines
+        return lines
+
+
+class VirtualTable:
+    """
+    Table of `count` rows whose cells come from cell(i) -> [(text, fg), ...] (one per
+    column). `columns` is [(title, weight)]; column widths follow the canvas width.
+    Unmeasured rows count with the average measured height until they are reached.
+    """
+
+    def __init__(self, parent, columns, cell, font=("Arial", 12), header_font=("Arial", 14, "bold"),
+                 pad=(8, 6), bg="white", header_bg="#e8f5e9", header_fg="#1b5e20",
+                 line="#616161", buffer=200):
+        self.frame = tk.Frame(parent)
+        self.columns = list(columns)
+        self.count = 0
+        self._cell = cell
+        self._wrapper = TextWrapper(font)
+        self._font = self._wrapper.font
+        self._header_font = tkfont.Font(font=header_font)
+        self._padx, self._pady = pad
+        self._bg, self._line = bg, line
+        self._header_bg, self._header_fg = header_bg, header_fg
+        self._buffer = buffer
+        self._linespace = self._wrapper.linespace
+        self._width = 1
+        self._region = None
+        self._col_x = [0] * (len(self.columns) + 1)
+        self._reset_rows()
+
+        self._head = tk.Canvas(self.frame, highlightthickness=0, bg=header_bg,
+                               height=self._header_font.metrics("linespace") + 2 * self._pady)
+        self._head.pack(side="top", fill="x")
+        body = tk.Frame(self.frame)
+        body.pack(side="top", fill="both", expand=True)
+        self.canvas = tk.Canvas(body, highlightthickness=0, bg=bg, yscrollincrement=self._linespace)
+        self._scrollbar = tk.Scrollbar(body, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self._scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.bind("<Configure>", self._on_configure)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind(seq, self._on_wheel, add="+")
+
+    def pack(self, **kw):
+        self.frame.pack(**kw)
+
+    def set_count(self, count):
+        """New data: forget measured heights and drawn rows (wrapped lines stay cached)."""
+        self.count = int(count)
+        self._reset_rows()
+        self.canvas.delete("row")
+        self.canvas.yview_moveto(0)
+        self._render()
+
+    def _reset_rows(self):
+        self._tops = [0]       # y of row i; len = measured rows + 1
+        self._drawn = set()
+
+    # ---- text layout ----
+    def _wrap(self, text, width):
+        return self._wrapper.lines(text, width)
+
+    def _layout_columns(self):
+        total = sum(w for _, w in self.columns) or 1
+        x = 0.0
+        for c, (_, weight) in enumerate(self.columns):
+            self._col_x[c] = int(x)
+            x += self._width * weight / total
+        self._col_x[-1] = self._width
+
+    def _cell_width(self, c):
+        return max(10, self._col_x[c + 1] - self._col_x[c] - 2 * self._padx)
+
+    # ---- row geometry ----
+    def _measure_until(self, y):
+        tops = self._tops
+        while len(tops) <= self.count and tops[-1] < y:
+            i = len(tops) - 1
+            cells = self._cell(i)
+            lines = max(len(self._wrap(text, self._cell_width(c))) for c, (text, _) in enumerate(cells))
+            tops.append(tops[-1] + lines * self._linespace + 2 * self._pady)
+
+    def _total_height(self):
+        measured = len(self._tops) - 1
+        avg = (self._tops[-1] / measured) if measured else self._linespace + 2 * self._pady
+        return int(self._tops[-1] + (self.count - measured) * avg)
+
+    # ---- drawing ----
+    def _draw_header(self):
+        hd = self._head
+        hd.delete("all")
+        h = int(hd.cget("height"))
+        for c, (title, _) in enumerate(self.columns):
+            x0, x1 = self._col_x[c], self._col_x[c + 1]
+            hd.create_rectangle(x0, 0, x1 - 1, h - 1, fill=self._header_bg, outline=self._line)
+            hd.create_text(x0 + self._padx, self._pady, text=title, anchor="nw",
+                           fill=self._header_fg, font=self._header_font)
+
+    def _draw_row(self, i):
+        cv, tag = self.canvas, f"r{i}"
+        y0, y1 = self._tops[i], self._tops[i + 1]
+        for c, (text, fg) in enumerate(self._cell(i)):
+            x0, x1 = self._col_x[c], self._col_x[c + 1]
+            cv.create_rectangle(x0, y0, x1 - 1, y1, fill=self._bg, outline=self._line, tags=("row", tag))
+            cv.create_text(x0 + self._padx, y0 + self._pady, anchor="nw", fill=fg, font=self._font,
+                           text="\n".join(self._wrap(text, self._cell_width(c))), tags=("row", tag))
+        self._drawn.add(i)
+
+    def _render(self):
+        if self._width <= 1:
+            return
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        self._measure_until(bottom + self._buffer)
+        tops = self._tops
+        first = max(0, bisect.bisect_right(tops, top - self._buffer) - 1)
+        last = min(len(tops) - 1, bisect.bisect_left(tops, bottom + self._buffer))
+        for i in list(self._drawn):
+            if not first <= i < last:
+                self.canvas.delete(f"r{i}")
+                self._drawn.discard(i)
+        for i in range(first, last):
+            if i not in self._drawn:
+                self._draw_row(i)
+        region = (0, 0, self._width, self._total_height())
+        if region != self._region:    # only on change: a new region re-fires yscrollcommand
+            self._region = region
+            self.canvas.configure(scrollregion=region)
+
+    # ---- events ----
+    def _on_yscroll(self, first, last):
+        self._scrollbar.set(first, last)
+        self._render()
+
+    def _on_configure(self, evt):
+        if evt.width != self._width:
+            # new column widths: every wrapped height changes
+            self._width = evt.width
+            self._layout_columns()
+            self._draw_header()
+            self._reset_rows()
+            self.canvas.delete("row")
+        self._render()
+
+    def _on_wheel(self, evt):
+        up = getattr(evt, "num", 0) == 4 or getattr(evt, "delta", 0) > 0
+        self.canvas.yview_scroll(-WHEEL_UNITS if up else WHEEL_UNITS, "units")
+        return "break"